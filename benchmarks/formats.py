@@ -0,0 +1,85 @@
+"""
+Load-time benchmark of the problem file formats on one generated instance.
+
+    python -m benchmarks.formats --generator sparse --size 100000 100000
+    python -m benchmarks.formats --generator transportation --size 200 500 --formats json mps
+
+The instance is written once in each format into a temporary directory, then every format is
+loaded --repeats times (median wall time) and once more under tracemalloc for the peak memory.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generators import GENERATORS, generate
+from optimax.formats import read_problem, write_problem
+from optimax.parser import ProblemInstance
+
+FORMATS = {"json": "problem.json", "mps": "problem.mps", "lp": "problem.lp", "binary": "problem.optimax"}
+
+def _size(path: str) -> int:
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return os.path.getsize(path)
+
+def run(name: str, size: tuple, seed: int = 0, formats=tuple(FORMATS), repeats: int = 3, memory: bool = True) -> list:
+    """
+    Benchmarks loading one generated instance in each format.
+
+    Parameters:
+        name (str): Generator name.
+        size (tuple): Size parameters of the generator.
+        seed (int): Random seed.
+        formats (iterable): Keys of FORMATS to compare.
+        repeats (int): Number of timed loads per format.
+        memory (bool): Also measure the tracemalloc peak of one load.
+
+    Returns:
+        list: One dict per format with 'format', 'file_mb', 'load_s' (median) and 'peak_mb'.
+    """
+    problem = ProblemInstance.from_json(json.dumps(generate(name, size, seed)))
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in formats:
+            path = os.path.join(tmp, FORMATS[fmt])
+            write_problem(problem, path)
+            times = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                loaded = read_problem(path)
+                times.append(time.perf_counter() - start)
+                del loaded
+            peak = None
+            if memory:
+                tracemalloc.start()
+                try:
+                    loaded = read_problem(path)
+                    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+                    del loaded
+                finally:
+                    tracemalloc.stop()
+            results.append({"format": fmt, "file_mb": round(_size(path) / 2 ** 20, 2),
+                            "load_s": statistics.median(times), "peak_mb": None if peak is None else round(peak, 1)})
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare load times of the OPTIMAX problem file formats.")
+    parser.add_argument("--generator", choices=list(GENERATORS), default="sparse", help="Instance generator.")
+    parser.add_argument("--size", type=int, nargs="+", default=[20000, 20000], help="Size parameters of the generator.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--formats", nargs="+", choices=list(FORMATS), default=list(FORMATS), help="Formats to compare.")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed loads per format.")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="Skip the tracemalloc pass.")
+    args = parser.parse_args(argv)
+    for result in run(args.generator, tuple(args.size), args.seed, args.formats, args.repeats, args.memory):
+        peak = "-" if result["peak_mb"] is None else f"{result['peak_mb']:.1f} MB"
+        print(f"{result['format']:<8} {result['file_mb']:9.2f} MB {result['load_s'] * 1000:12.1f} ms {peak:>12}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
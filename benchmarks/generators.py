@@ -0,0 +1,215 @@
+"""
+Seeded generators of synthetic problems in the OPTIMAX JSON input format.
+
+Every generator takes its size parameters plus a seed and returns the JSON document as a dict,
+so the same (generator, size, seed) always produces the same problem. All instances are feasible
+and bounded by construction. Rows with few nonzeros are written in the sparse row form
+('indices' + 'coeficientes'), dense rows in the dense form.
+"""
+import numpy as np
+
+def _sparse_row(indices, values, sign, rhs):
+    return {"indices": np.asarray(indices).tolist(), "coeficientes": np.asarray(values).tolist(), "signo": sign, "valor": float(rhs)}
+
+def _document(objective, c, constraints, integer):
+    return {
+        "objetivo": objective,
+        "funcion_objetivo": np.asarray(c).tolist(),
+        "restricciones": constraints,
+        "variables_enteras": np.asarray(integer).tolist(),
+    }
+
+def dense_lp(rows: int, cols: int, seed: int = 0) -> dict:
+    """
+    Dense LP: maximize c x subject to A x <= b with every coefficient positive.
+
+    Parameters:
+        rows (int): Number of constraints.
+        cols (int): Number of variables.
+        seed (int): Random seed.
+
+    Returns:
+        dict: The problem in the JSON input format.
+    """
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(1, 10, (rows, cols))
+    b = A @ rng.uniform(0, 5, cols) + rng.uniform(1, 10, rows)
+    constraints = [{"coeficientes": A[i].tolist(), "signo": "<=", "valor": float(b[i])} for i in range(rows)]
+    return _document("maximizar", rng.uniform(1, 10, cols), constraints, [False] * cols)
+
+def sparse_lp(rows: int, cols: int, seed: int = 0, row_nnz: int = 5) -> dict:
+    """
+    Sparse LP with a mix of '<=', '>=' and '==' rows, built around a known feasible point,
+    plus one upper-bound row per variable.
+
+    Parameters:
+        rows (int): Number of random constraints.
+        cols (int): Number of variables.
+        seed (int): Random seed.
+        row_nnz (int): Nonzeros per row.
+
+    Returns:
+        dict: The problem in the JSON input format.
+    """
+    rng = np.random.default_rng(seed)
+    row_nnz = min(row_nnz, cols)
+    x0 = rng.uniform(0, 5, cols)
+    senses = rng.choice(["<=", ">=", "=="], rows, p=[0.6, 0.3, 0.1])
+    constraints = []
+    for i in range(rows):
+        indices = np.sort(rng.choice(cols, row_nnz, replace=False))
+        values = rng.uniform(1, 10, row_nnz)
+        activity = values @ x0[indices]
+        rhs = {"<=": activity + rng.uniform(0, 5), ">=": activity - rng.uniform(0, 5), "==": activity}[senses[i]]
+        constraints.append(_sparse_row(indices, values, senses[i], rhs))
+    # A singleton row 'x_j <= 10' per variable keeps the objective bounded
+    for j in range(cols):
+        constraints.append(_sparse_row([j], [1.0], "<=", 10.0))
+    return _document("maximizar", rng.uniform(-5, 10, cols), constraints, [False] * cols)
+
+def transportation(sources: int, destinations: int, seed: int = 0) -> dict:
+    """
+    Transportation LP: ship from sources with limited supply to destinations with a demand at minimum cost.
+    Variable s * destinations + d is the amount shipped from source s to destination d.
+
+    Parameters:
+        sources (int): Number of sources.
+        destinations (int): Number of destinations.
+        seed (int): Random seed.
+
+    Returns:
+        dict: The problem in the JSON input format.
+    """
+    rng = np.random.default_rng(seed)
+    num_vars = sources * destinations
+    demand = rng.uniform(10, 50, destinations)
+    # Supplies exceed total demand by 20% so the instance is always feasible
+    supply = rng.dirichlet(np.ones(sources)) * demand.sum() * 1.2
+    constraints = []
+    for s in range(sources):
+        indices = s * destinations + np.arange(destinations)
+        constraints.append(_sparse_row(indices, np.ones(destinations), "<=", supply[s]))
+    for d in range(destinations):
+        indices = np.arange(sources) * destinations + d
+        constraints.append(_sparse_row(indices, np.ones(sources), ">=", demand[d]))
+    return _document("minimizar", rng.uniform(1, 20, num_vars), constraints, [False] * num_vars)
+
+def knapsack(items: int, dimensions: int = 1, seed: int = 0) -> dict:
+    """
+    Multi-dimensional integer knapsack: maximize value subject to one capacity row per dimension.
+
+    Parameters:
+        items (int): Number of items (integer variables).
+        dimensions (int): Number of capacity constraints.
+        seed (int): Random seed.
+
+    Returns:
+        dict: The problem in the JSON input format.
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(5, 30, (dimensions, items)).astype(float)
+    values = weights.mean(axis=0) + rng.integers(-4, 5, items)
+    capacity = np.floor(weights.sum(axis=1) / 4)
+    constraints = [{"coeficientes": weights[k].tolist(), "signo": "<=", "valor": float(capacity[k])} for k in range(dimensions)]
+    return _document("maximizar", values, constraints, [True] * items)
+
+def set_cover(elements: int, sets: int, seed: int = 0, set_size: int = 4) -> dict:
+    """
+    Weighted set cover: choose sets of minimum total cost so that every element is covered at least once.
+
+    Parameters:
+        elements (int): Number of elements (constraints).
+        sets (int): Number of candidate sets (integer variables).
+        seed (int): Random seed.
+        set_size (int): Elements per set.
+
+    Returns:
+        dict: The problem in the JSON input format.
+    """
+    rng = np.random.default_rng(seed)
+    set_size = min(set_size, elements)
+    members = [set(rng.choice(elements, set_size, replace=False).tolist()) for _ in range(sets)]
+    # Every element gets at least one covering set
+    for element in range(elements):
+        members[rng.integers(sets)].add(element)
+    covering = [[] for _ in range(elements)]
+    for j, chosen in enumerate(members):
+        for element in chosen:
+            covering[element].append(j)
+    constraints = [_sparse_row(sorted(js), np.ones(len(js)), ">=", 1) for js in covering]
+    return _document("minimizar", rng.integers(1, 10, sets).astype(float), constraints, [True] * sets)
+
+def block_diagonal(blocks: int, rows: int, cols: int, seed: int = 0) -> dict:
+    """
+    Independent sparse LPs packed into one problem: block k uses variables k * cols .. (k + 1) * cols - 1
+    and shares no constraint with the other blocks.
+
+    Parameters:
+        blocks (int): Number of blocks.
+        rows (int): Random constraints per block.
+        cols (int): Variables per block.
+        seed (int): Random seed; block k is sparse_lp(rows, cols, seed * blocks + k).
+
+    Returns:
+        dict: The problem in the JSON input format.
+    """
+    c, constraints = [], []
+    for k in range(blocks):
+        block = sparse_lp(rows, cols, seed=seed * blocks + k)
+        c.extend(block["funcion_objetivo"])
+        for row in block["restricciones"]:
+            constraints.append(dict(row, indices=[j + k * cols for j in row["indices"]]))
+    return _document("maximizar", c, constraints, [False] * (blocks * cols))
+
+GENERATORS = {
+    "dense": dense_lp,
+    "sparse": sparse_lp,
+    "transportation": transportation,
+    "knapsack": knapsack,
+    "set_cover": set_cover,
+    "block_diagonal": block_diagonal,
+}
+
+# Size parameters of each generator per scale
+SIZES = {
+    "small": {
+        "dense": [(10, 10), (50, 50)],
+        "sparse": [(50, 50), (200, 200)],
+        "transportation": [(5, 5), (10, 20)],
+        "knapsack": [(10, 1), (20, 3)],
+        "set_cover": [(10, 20), (20, 40)],
+        "block_diagonal": [(4, 20, 20)],
+    },
+    "medium": {
+        "dense": [(200, 200), (500, 500)],
+        "sparse": [(1000, 1000), (5000, 5000)],
+        "transportation": [(30, 50), (50, 100)],
+        "knapsack": [(50, 3), (100, 5)],
+        "set_cover": [(50, 100), (100, 200)],
+        "block_diagonal": [(8, 1000, 1000)],
+    },
+    "large": {
+        "dense": [(1000, 1000)],
+        "sparse": [(20000, 20000), (50000, 50000)],
+        "transportation": [(100, 200)],
+        "knapsack": [(200, 5)],
+        "set_cover": [(200, 400)],
+        "block_diagonal": [(16, 5000, 5000)],
+    },
+}
+
+def generate(name: str, size: tuple, seed: int = 0) -> dict:
+    """
+    Generates one instance.
+
+    Parameters:
+        name (str): Generator name (a key of GENERATORS).
+        size (tuple): Size parameters, in the generator's argument order.
+        seed (int): Random seed.
+
+    Returns:
+        dict: The problem in the JSON input format.
+    """
+    if name not in GENERATORS:
+        raise ValueError(f"Unsupported generator: {name}")
+    return GENERATORS[name](*size, seed=seed)
@@ -0,0 +1,118 @@
+"""
+What the primal heuristics save on integer problems, per ILP backend.
+
+    python -m benchmarks.heuristics
+    python -m benchmarks.heuristics --generator set_cover --sizes 200x400 --backends highs native --seeds 0 1 2
+
+Every generated instance is solved by each backend twice, without and with heuristics (see
+optimax.heuristics). Both runs go through SolveLimits() without any limit, so that CBC and HiGHS
+report their node counts. Times are the median over the repeats and include the heuristics;
+'time saved' and 'nodes saved' are the plain run minus the heuristic one, so negative values are
+costs. A case is correct when both runs reach the same optimal value within a relative 1e-6.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from benchmarks.generators import GENERATORS, generate
+from optimax.limits import SolveLimits
+from optimax.parser import ProblemInstance
+from optimax.solver import ILP_BACKENDS, Solver
+
+DEFAULT_SIZES = {"knapsack": ["20x3", "30x3"], "set_cover": ["100x200", "200x400"]}
+
+def _median_time(run, repeats: int):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = run()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times)
+
+def run(name: str, size: tuple, seed: int = 0, backends=ILP_BACKENDS, repeats: int = 1) -> dict:
+    """
+    Benchmarks the heuristics on one generated instance.
+
+    Parameters:
+        name (str): Generator name.
+        size (tuple): Size parameters of the generator.
+        seed (int): Random seed.
+        backends (iterable): ILP backends to compare.
+        repeats (int): Number of timed solves per backend and mode.
+
+    Returns:
+        dict: 'case', 'rows', 'cols' and 'backends', one dict per backend with 'backend', 'plain' and
+            'heuristics' ({'status', 'optimal_value', 'nodes', 'time_s'}; the latter also has
+            'incumbent', 'found_by', 'heuristics_time_s' and 'nodes_pruned'), 'time_saved_s',
+            'nodes_saved' (None when a node count is missing) and 'correct'.
+    """
+    problem = ProblemInstance.from_json(json.dumps(generate(name, size, seed)))
+    results = []
+    for backend in backends:
+        modes = {}
+        for heuristics in (False, True):
+            solution, elapsed = _median_time(
+                lambda: Solver.solve(problem, "branch_and_bound", backend=backend, limits=SolveLimits(),
+                                     heuristics=heuristics), repeats)
+            mode = {"status": solution["status"], "optimal_value": solution.get("optimal_value"),
+                    "nodes": solution.get("nodes"), "time_s": elapsed}
+            if heuristics:
+                summary = solution["heuristics"]
+                mode.update(incumbent=summary["objective_value"], found_by=summary["found_by"],
+                            heuristics_time_s=summary["time"], nodes_pruned=summary["nodes_pruned"])
+            modes["heuristics" if heuristics else "plain"] = mode
+        plain, heuristic = modes["plain"], modes["heuristics"]
+        expected, value = plain["optimal_value"], heuristic["optimal_value"]
+        correct = plain["status"] == heuristic["status"] and (
+            expected is None and value is None or
+            expected is not None and value is not None and abs(value - expected) <= 1e-6 * max(1.0, abs(expected)))
+        nodes_saved = None
+        if plain["nodes"] is not None and heuristic["nodes"] is not None:
+            nodes_saved = plain["nodes"] - heuristic["nodes"]
+        results.append({"backend": backend, **modes, "time_saved_s": plain["time_s"] - heuristic["time_s"],
+                        "nodes_saved": nodes_saved, "correct": correct})
+    return {
+        "case": f"{name}-{'x'.join(str(v) for v in size)}-s{seed}",
+        "rows": problem.num_constraints,
+        "cols": problem.num_variables,
+        "backends": results,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the time and nodes primal heuristics save per ILP backend.")
+    parser.add_argument("--generator", choices=[name for name in GENERATORS if name in DEFAULT_SIZES], nargs="+",
+                        default=list(DEFAULT_SIZES), help="Integer instance generators.")
+    parser.add_argument("--sizes", nargs="+", metavar="AxB",
+                        help="Size parameters of the generators, e.g. 100x200 (default: two sizes each).")
+    parser.add_argument("--backends", choices=ILP_BACKENDS, nargs="+", default=list(ILP_BACKENDS),
+                        help="ILP backends to compare.")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="Random seeds; one instance per seed and size.")
+    parser.add_argument("--repeats", type=int, default=1, help="Timed solves per backend and mode.")
+    parser.add_argument("--output", metavar="FILE", help="Also write the results as JSON to FILE.")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'case':<24} {'backend':<8} {'incumbent':>10} {'found by':<17} {'nodes':>13} {'time':>21} {'saved':>10}")
+    for name in args.generator:
+        for size in args.sizes or DEFAULT_SIZES[name]:
+            for seed in args.seeds:
+                result = run(name, tuple(int(v) for v in size.split("x")), seed, args.backends, args.repeats)
+                results.append(result)
+                for entry in result["backends"]:
+                    plain, heuristic = entry["plain"], entry["heuristics"]
+                    incumbent = "-" if heuristic["incumbent"] is None else f"{heuristic['incumbent']:.6g}"
+                    nodes = f"{str(plain['nodes'] if plain['nodes'] is not None else '-')} -> " \
+                            f"{str(heuristic['nodes'] if heuristic['nodes'] is not None else '-')}"
+                    times = f"{plain['time_s'] * 1000:.1f} -> {heuristic['time_s'] * 1000:.1f} ms"
+                    flag = "" if entry["correct"] else "  WRONG"
+                    print(f"{result['case']:<24} {entry['backend']:<8} {incumbent:>10} {str(heuristic['found_by']):<17} "
+                          f"{nodes:>13} {times:>21} {entry['time_saved_s'] * 1000:7.1f} ms{flag}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=1)
+    return 0 if all(entry["correct"] for result in results for entry in result["backends"]) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
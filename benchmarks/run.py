@@ -0,0 +1,227 @@
+"""
+Scaling benchmarks: solves generated instances over a grid of sizes and times every phase.
+
+    python -m benchmarks.run --scale small --output results.json
+    python -m benchmarks.run --scale small --baseline benchmarks/baseline.json
+    python -m benchmarks.run --scale small --output benchmarks/baseline.json   # refresh the baseline
+
+Each instance goes through the same phases as main.py: from_json, validation, selector,
+assembly (building the backend's model), solve (the backend itself) and format_solution.
+Times are the median over the repeats; memory is the tracemalloc peak of each phase, measured
+in a separate run because tracing slows Python code down. Memory allocated inside HiGHS or CBC
+is not visible to tracemalloc.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import scipy
+
+from benchmarks.generators import GENERATORS, SIZES, generate
+from optimax.parser import ProblemInstance
+from optimax.selector import AlgorithmSelector, TimingTable
+from optimax.solver import Solver, LP_METHODS
+from optimax.utils import validate_dimensions, format_solution
+
+PHASES = ("from_json", "validation", "selector", "assembly", "solve", "format_solution")
+
+def _phases(json_input: str, algorithm: str = None, backend: str = None):
+    # Each phase reads what the previous ones left in 'state'
+    state = {}
+
+    def from_json():
+        state["problem"] = ProblemInstance.from_json(json_input)
+
+    def validation():
+        state["problem"].validate()
+        validate_dimensions(state["problem"])
+
+    def selector():
+        selected_algorithm, selected_backend = AlgorithmSelector.select(state["problem"])
+        state["algorithm"] = algorithm or selected_algorithm
+        state["backend"] = backend or selected_backend
+
+    def assembly():
+        state["run"] = Solver.assemble(state["problem"], state["algorithm"], state["backend"])
+
+    def solve():
+        state["solution"] = state["run"]()
+
+    def format_phase():
+        state["text"] = format_solution(state["solution"])
+
+    steps = [from_json, validation, selector, assembly, solve, format_phase]
+    return state, list(zip(PHASES, steps))
+
+def run_case(name: str, size: tuple, seed: int = 0, repeats: int = 3, algorithm: str = None, backend: str = None) -> dict:
+    """
+    Benchmarks one generated instance.
+
+    Parameters:
+        name (str): Generator name.
+        size (tuple): Size parameters of the generator.
+        seed (int): Random seed.
+        repeats (int): Number of timed runs.
+        algorithm (str): Algorithm to use instead of the selector's choice.
+        backend (str): ILP backend to use instead of the selector's choice.
+
+    Returns:
+        dict: Problem dimensions, algorithm, backend, status, optimal value and, per phase,
+            'median_s', 'min_s' and 'peak_kb'.
+    """
+    json_input = json.dumps(generate(name, size, seed))
+    times = {phase: [] for phase in PHASES}
+    for _ in range(repeats):
+        state, steps = _phases(json_input, algorithm, backend)
+        for phase, step in steps:
+            start = time.perf_counter()
+            step()
+            times[phase].append(time.perf_counter() - start)
+
+    peaks = {}
+    state, steps = _phases(json_input, algorithm, backend)
+    tracemalloc.start()
+    try:
+        for phase, step in steps:
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            step()
+            peaks[phase] = (tracemalloc.get_traced_memory()[1] - current) / 1024
+    finally:
+        tracemalloc.stop()
+
+    problem = state["problem"]
+    solution = state["solution"]
+    phases = {
+        phase: {"median_s": statistics.median(times[phase]), "min_s": min(times[phase]), "peak_kb": round(peaks[phase], 1)}
+        for phase in PHASES
+    }
+    return {
+        "case": case_id(name, size, seed),
+        "generator": name,
+        "size": list(size),
+        "seed": seed,
+        "rows": problem.num_constraints,
+        "cols": problem.num_variables,
+        "nnz": int(problem.A.nnz),
+        "algorithm": state["algorithm"],
+        "backend": state["backend"] if state["algorithm"] == "branch_and_bound" else None,
+        "status": str(solution.get("status")),
+        "optimal_value": solution.get("optimal_value"),
+        "total_s": sum(phase["median_s"] for phase in phases.values()),
+        "phases": phases,
+    }
+
+def case_id(name: str, size: tuple, seed: int) -> str:
+    return f"{name}-{'x'.join(str(v) for v in size)}-s{seed}"
+
+def iter_cases(scale: str, generators=None, seeds=(0,)):
+    for name, sizes in SIZES[scale].items():
+        if generators and name not in generators:
+            continue
+        for size in sizes:
+            for seed in seeds:
+                yield name, size, seed
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.5, min_seconds: float = 0.01, min_kb: float = 64) -> list:
+    """
+    Compares a benchmark run with a baseline run.
+
+    A phase regresses when it is more than 'tolerance' (relative) slower or larger than in the
+    baseline, and also by more than min_seconds / min_kb, so that noise on tiny phases is ignored.
+    A changed optimal value or status is always reported. Cases missing from either run are skipped.
+
+    Parameters:
+        results (dict): The current run, as written by main().
+        baseline (dict): The baseline run.
+        tolerance (float): Allowed relative slowdown or memory growth.
+        min_seconds (float): Ignore slowdowns smaller than this.
+        min_kb (float): Ignore memory growth smaller than this.
+
+    Returns:
+        list: One message per regression; empty if there is none.
+    """
+    base_cases = {case["case"]: case for case in baseline["results"]}
+    regressions = []
+    for case in results["results"]:
+        base = base_cases.get(case["case"])
+        if base is None:
+            continue
+        if case["status"] != base["status"]:
+            regressions.append(f"{case['case']}: status {base['status']!r} -> {case['status']!r}")
+        elif base["optimal_value"] is not None and case["optimal_value"] is not None and \
+                abs(case["optimal_value"] - base["optimal_value"]) > 1e-6 * max(1.0, abs(base["optimal_value"])):
+            regressions.append(f"{case['case']}: optimal value {base['optimal_value']} -> {case['optimal_value']}")
+        for phase in PHASES:
+            now, before = case["phases"][phase], base["phases"][phase]
+            slower = now["median_s"] - before["median_s"]
+            if slower > min_seconds and now["median_s"] > before["median_s"] * (1 + tolerance):
+                regressions.append(f"{case['case']}: {phase} time {before['median_s'] * 1000:.2f} ms -> {now['median_s'] * 1000:.2f} ms")
+            grown = now["peak_kb"] - before["peak_kb"]
+            if grown > min_kb and now["peak_kb"] > before["peak_kb"] * (1 + tolerance):
+                regressions.append(f"{case['case']}: {phase} memory {before['peak_kb']:.0f} KB -> {now['peak_kb']:.0f} KB")
+    return regressions
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark OPTIMAX on generated LP/ILP instances.")
+    parser.add_argument("--scale", choices=list(SIZES), default="small", help="Size grid to run.")
+    parser.add_argument("--generators", nargs="+", choices=list(GENERATORS), help="Only run these generators.")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="Random seeds; one instance per seed and size.")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per instance.")
+    parser.add_argument("--algorithm", choices=list(LP_METHODS) + ["revised_simplex", "branch_and_bound"],
+                        help="Force an algorithm instead of the selector's choice.")
+    parser.add_argument("--backend", choices=("pulp", "highs", "native"), help="Force an ILP backend.")
+    parser.add_argument("--output", metavar="FILE", default="benchmark_results.json", help="Where to write the results.")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare with a stored run; exit with status 1 on regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown against --baseline.")
+    parser.add_argument("--timing-table", metavar="FILE",
+                        help="Also time every selector candidate on the instances and write a selector timing table.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = list(iter_cases(args.scale, args.generators, args.seeds))
+    results = []
+    for name, size, seed in cases:
+        result = run_case(name, size, seed, repeats=args.repeats, algorithm=args.algorithm, backend=args.backend)
+        results.append(result)
+        # Solver output (CBC) goes to stdout, so progress is reported on stderr
+        print(f"{result['case']:<32} {result['algorithm']:<16} {result['status'][:30]:<30} "
+              f"{result['total_s'] * 1000:10.2f} ms", file=sys.stderr)
+
+    report = {"scale": args.scale, "repeats": args.repeats, "environment": environment(), "results": results}
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+    print(f"Results: {args.output}", file=sys.stderr)
+
+    if args.timing_table:
+        problems = [ProblemInstance.from_json(json.dumps(generate(name, size, seed))) for name, size, seed in cases]
+        TimingTable.measure(problems, repeats=args.repeats).save(args.timing_table)
+        print(f"Timing table: {args.timing_table}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, tolerance=args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        print(f"{len(regressions)} regression(s) against {args.baseline}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Correctness and speed of the built-in revised simplex against HiGHS.
+
+    python -m benchmarks.simplex
+    python -m benchmarks.simplex --generator transportation --sizes 10x20 30x50 --seeds 0 1 2
+
+Every generated instance is solved as an LP (integrality dropped) by HiGHS dual simplex and by
+each variant of optimax.revised_simplex. A variant is correct when it agrees with HiGHS on the
+status and, when optimal, on the objective value within a relative 1e-6. Times are the median
+over the repeats.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.generators import GENERATORS, generate
+from optimax.parser import ProblemInstance
+from optimax.revised_simplex import PRICING_RULES, SIMPLEX_METHODS, RevisedSimplex
+from optimax.solver import Solver
+
+DEFAULT_SIZES = {"dense": ["20x20", "60x80"], "sparse": ["100x100", "300x400"], "transportation": ["10x20", "20x30"]}
+
+def _median_time(run, repeats: int):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = run()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times)
+
+def run(name: str, size: tuple, seed: int = 0, repeats: int = 3) -> dict:
+    """
+    Benchmarks every revised simplex variant on one generated instance.
+
+    Parameters:
+        name (str): Generator name.
+        size (tuple): Size parameters of the generator.
+        seed (int): Random seed.
+        repeats (int): Number of timed solves per engine.
+
+    Returns:
+        dict: 'case', 'rows', 'cols', 'highs' ({'status', 'optimal_value', 'nit', 'time_s'}) and 'variants',
+            one dict per method and pricing rule with 'method', 'pricing', 'status', 'optimal_value',
+            'nit', 'time_s', 'error' (relative objective difference) and 'correct'.
+    """
+    problem = ProblemInstance.from_json(json.dumps(generate(name, size, seed)))
+    problem = ProblemInstance.from_arrays(problem.objective, problem.c, problem.A, problem.b, problem.senses,
+                                          np.zeros(problem.num_variables, dtype=bool), lower=problem.lower,
+                                          upper=problem.upper)
+    reference, highs_time = _median_time(lambda: Solver.solve_lp(problem, method="highs-ds"), repeats)
+    expected = reference.get("optimal_value")
+    variants = []
+    for method in SIMPLEX_METHODS:
+        for pricing in PRICING_RULES:
+            result, elapsed = _median_time(RevisedSimplex(problem, method, pricing).solve, repeats)
+            value = result.get("optimal_value")
+            error = None
+            if value is not None and expected is not None:
+                error = abs(value - expected) / max(1.0, abs(expected))
+            correct = (value is None) == (expected is None) and (error is None or error <= 1e-6)
+            variants.append({"method": method, "pricing": pricing, "status": result["status"], "optimal_value": value,
+                             "nit": result["nit"], "time_s": elapsed, "error": error, "correct": correct})
+    return {
+        "case": f"{name}-{'x'.join(str(v) for v in size)}-s{seed}",
+        "rows": problem.num_constraints,
+        "cols": problem.num_variables,
+        "highs": {"status": str(reference["status"]), "optimal_value": expected, "nit": reference.get("nit"),
+                  "time_s": highs_time},
+        "variants": variants,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the built-in revised simplex with HiGHS.")
+    parser.add_argument("--generator", choices=[name for name in GENERATORS if name in DEFAULT_SIZES], nargs="+",
+                        default=list(DEFAULT_SIZES), help="LP instance generators.")
+    parser.add_argument("--sizes", nargs="+", metavar="AxB",
+                        help="Size parameters of the generators, e.g. 100x200 (default: a small and a medium size each).")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="Random seeds; one instance per seed and size.")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed solves per engine.")
+    parser.add_argument("--output", metavar="FILE", help="Also write the results as JSON to FILE.")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'case':<28} {'engine':<22} {'status':<12} {'nit':>6} {'time':>11} {'rel. error':>10}")
+    for name in args.generator:
+        for size in args.sizes or DEFAULT_SIZES[name]:
+            for seed in args.seeds:
+                result = run(name, tuple(int(v) for v in size.split("x")), seed, args.repeats)
+                results.append(result)
+                highs = result["highs"]
+                print(f"{result['case']:<28} {'highs-ds':<22} {highs['status'][:12]:<12} {str(highs['nit'] or '-'):>6} "
+                      f"{highs['time_s'] * 1000:8.1f} ms {'-':>10}")
+                for variant in result["variants"]:
+                    error = "-" if variant["error"] is None else f"{variant['error']:.1e}"
+                    flag = "" if variant["correct"] else "  WRONG"
+                    print(f"{'':<28} {variant['method'] + '/' + variant['pricing']:<22} {variant['status'][:12]:<12} "
+                          f"{variant['nit']:>6} {variant['time_s'] * 1000:8.1f} ms {error:>10}{flag}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=1)
+    return 0 if all(variant["correct"] for result in results for variant in result["variants"]) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,254 @@
+import argparse
+import json
+import logging
+import os
 import sys
+from optimax.metrics import Metrics, phase
 from optimax.parser import ProblemInstance
 from optimax.selector import AlgorithmSelector
-from optimax.solver import Solver
-from optimax.visualizer import Visualizer
+from optimax.solver import Solver, ILP_BACKENDS
 from optimax.utils import format_solution
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python main.py <path_to_json_file>")
-        sys.exit(1)
-    
-    json_file_path = sys.argv[1]
-    
-    # Read the JSON input file
-    try:
-        with open(json_file_path, 'r') as f:
-            json_input = f.read()
-    except Exception as e:
-        print("Error reading file:", e)
-        sys.exit(1)
-    
-    # Parse the problem instance from JSON
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Solve LP/ILP problems described in JSON, MPS or LP files.")
+    parser.add_argument("json_file", nargs="?",
+                        help="Path to a single JSON problem file, an MPS (.mps, .fmps) or CPLEX LP (.lp) file, "
+                             "optionally gzipped, or a binary problem directory.")
+    parser.add_argument("--batch", metavar="SOURCE",
+                        help="Solve many problems: a directory of *.json files, a glob pattern or a .jsonl file.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes for --batch, --serve and --decompose (default: CPU count).")
+    parser.add_argument("--order", choices=["input", "completion"], default="input",
+                        help="Emit --batch results in input order or as soon as each one completes.")
+    parser.add_argument("--output", metavar="FILE",
+                        help="Write --batch results as JSONL to FILE instead of stdout.")
+    parser.add_argument("--cache", metavar="PATH", nargs="?", const="",
+                        help="Reuse solutions of equivalent problems. With PATH, solutions are also stored in an "
+                             "sqlite file that persists across runs and is shared by batch workers.")
+    parser.add_argument("--cache-entries", type=int, default=1024,
+                        help="Maximum number of solutions kept in memory by --cache.")
+    parser.add_argument("--cache-mb", type=float, default=64,
+                        help="Maximum memory in MB used by in-memory --cache entries.")
+    parser.add_argument("--backend", choices=("auto",) + ILP_BACKENDS, default="auto",
+                        help="Engine for integer problems: PuLP/CBC, in-process HiGHS MILP (falls back to PuLP) "
+                             "or the built-in Branch & Bound. 'auto' (the default) lets the selector pick the "
+                             "fastest one from its timing table.")
+    parser.add_argument("--presolve", action="store_true",
+                        help="Remove empty, singleton and duplicate rows and fixed or unused variables before solving.")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Log the selector's decision and the problem features behind it to stderr.")
+    parser.add_argument("--metrics", choices=["json"],
+                        help="After the solution, print per-phase wall/CPU time, peak memory, problem size, backend "
+                             "iterations and cache/presolve statistics as one JSON line. With --batch, each result "
+                             "line gets a 'metrics' field instead.")
+    parser.add_argument("--serve", metavar="ADDRESS",
+                        help="Run as a resident service on HOST:PORT or unix:PATH, solving POSTed JSON problems on a "
+                             "pool of pre-warmed workers (--workers). See README for the endpoints.")
+    parser.add_argument("--max-queue", type=int, default=64,
+                        help="With --serve, maximum requests waiting or running before new ones get HTTP 503.")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="With --serve, default per-request timeout in seconds (HTTP 504 when exceeded).")
+    parser.add_argument("--decompose", action="store_true",
+                        help="Split the problem into independent blocks (no shared constraints or variables) and "
+                             "solve them in parallel on --workers processes, each with its own selected algorithm.")
+    parser.add_argument("--tree-log", metavar="FILE",
+                        help="Stream the Branch & Bound tree to FILE while solving, as JSONL (one node per line) or "
+                             "DOT (.dot/.gv). Uses the native backend unless --backend is given; memory stays bounded "
+                             "and --plots renders a collapsed tree and a search summary.")
+    parser.add_argument("--time-limit", type=float, metavar="SECONDS",
+                        help="Stop integer solves after SECONDS of wall-clock time and return the best solution found "
+                             "so far (status 'Feasible'), with its bound and gap.")
+    parser.add_argument("--gap-rel", type=float, metavar="GAP",
+                        help="Accept an integer solution as optimal once |incumbent - bound| <= GAP * |incumbent|.")
+    parser.add_argument("--gap-abs", type=float, metavar="GAP",
+                        help="Accept an integer solution as optimal once |incumbent - bound| <= GAP.")
+    parser.add_argument("--node-limit", type=int, metavar="NODES",
+                        help="Stop integer solves after NODES Branch & Bound nodes. With --verbose and any of these "
+                             "limits, improving solutions are logged to stderr as they are found.")
+    parser.add_argument("--heuristics", action="store_true",
+                        help="Run primal heuristics (LP rounding with repair, diving, feasibility pump) on integer "
+                             "problems for an early incumbent, which the backend then only has to beat.")
+    parser.add_argument("--trace", action="store_true",
+                        help="Solve a linear problem with the built-in revised simplex, which records the objective "
+                             "after every iteration, so --plots draws a real convergence graph. Integer problems "
+                             "are solved as usual.")
+    plots = parser.add_mutually_exclusive_group()
+    plots.add_argument("--plots", metavar="DIR", nargs="?", const=".", default=None,
+                       help="Render plots in the background into DIR (default: current directory), "
+                            "named after each problem.")
+    plots.add_argument("--no-plots", dest="plots", action="store_const", const=None,
+                       help="Headless mode (the default): skip all plotting, so matplotlib is never imported.")
+    args = parser.parse_args(argv)
+    if not args.json_file and not args.batch and not args.serve:
+        parser.error("either a JSON file, --batch SOURCE or --serve ADDRESS is required")
+    if args.tree_log and (args.batch or args.serve):
+        parser.error("--tree-log applies to a single problem")
+    for name in ("time_limit", "gap_rel", "gap_abs", "node_limit"):
+        value = getattr(args, name)
+        if value is not None and value < 0:
+            parser.error(f"--{name.replace('_', '-')} must not be negative")
+    if args.trace and (args.batch or args.serve or args.decompose):
+        parser.error("--trace applies to a single problem")
+    if args.decompose and (args.batch or args.serve or args.tree_log):
+        parser.error("--decompose applies to a single problem and cannot be combined with --tree-log")
+    return args
+
+def solve_options(args, on_incumbent=None):
+    options = {"presolve": args.presolve, "heuristics": args.heuristics}
+    if args.backend != "auto":
+        options["backend"] = args.backend
+    values = (args.time_limit, args.gap_rel, args.gap_abs, args.node_limit)
+    if any(value is not None for value in values):
+        from optimax.limits import SolveLimits
+        options["limits"] = SolveLimits(*values, on_incumbent=on_incumbent)
+    return options
+
+def log_incumbent(event):
+    bound = "N/A" if event["bound"] is None else f"{event['bound']:.6g}"
+    gap = "N/A" if event["gap"] is None else f"{event['gap']:.2%}"
+    print(f"Incumbent {event['objective_value']:.6g} (bound {bound}, gap {gap}) at {event['time']:.2f}s", file=sys.stderr)
+
+def build_cache(args):
+    if args.cache is None:
+        return None
+    from optimax.cache import SolutionCache
+    return SolutionCache(max_entries=args.cache_entries, max_bytes=int(args.cache_mb * 1024 * 1024), path=args.cache or None)
+
+def run_batch(args, cache=None):
+    from optimax.batch import iter_problem_sources, solve_batch, to_jsonl
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    failures = 0
+    cache_hits = 0
     try:
-        problem = ProblemInstance.from_json(json_input)
-    except Exception as e:
-        print("Error parsing JSON input:", e)
-        sys.exit(1)
-    
-    # Determine the best algorithm to use based on the problem
-    algorithm = AlgorithmSelector.select_algorithm(problem)
-    print(f"Selected algorithm: {algorithm}")
-    
-    # Solve the problem using the selected algorithm
-    solution = Solver.solve(problem, algorithm)
-    result_status = solution.get("status")
-    iterations = solution.get("iterations", None)
-    objective_values = solution.get("objective_values", None)
-    
+        results = solve_batch(iter_problem_sources(args.batch), workers=args.workers, ordered=args.order == "input",
+                              cache=cache, solve_options=solve_options(args), plot_dir=args.plots,
+                              collect_metrics=args.metrics is not None)
+        for result in results:
+            failures += "error" in result
+            cache_hits += result.get("cached", False)
+            out.write(to_jsonl(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if cache is not None:
+        print(f"Cache hits: {cache_hits}", file=sys.stderr)
+    return failures
+
+def main():
+    args = parse_args()
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    cache = build_cache(args)
+
+    if args.serve:
+        from optimax.service import serve
+        if not args.verbose:
+            logging.basicConfig(level=logging.WARNING, format="%(name)s: %(message)s")
+        print(f"Serving on {args.serve}", file=sys.stderr)
+        serve(args.serve, workers=args.workers, max_queue=args.max_queue, timeout=args.timeout, cache=cache,
+              solve_options=solve_options(args))
+        return
+
+    if args.batch:
+        failures = run_batch(args, cache)
+        sys.exit(1 if failures else 0)
+
+    json_file_path = args.json_file.rstrip(os.sep)
+    metrics = Metrics() if args.metrics else None
+
+    from optimax.formats import is_model_file, read_problem
+    if is_model_file(json_file_path):
+        # Binary, MPS and LP problems are streamed or memory-mapped, so there is no separate read step
+        try:
+            with phase(metrics, "parse"):
+                problem = read_problem(json_file_path)
+        except Exception as e:
+            print("Error reading problem file:", e)
+            sys.exit(1)
+    else:
+        # Read the JSON input file
+        try:
+            with phase(metrics, "read"):
+                with open(json_file_path, 'r') as f:
+                    json_input = f.read()
+        except Exception as e:
+            print("Error reading file:", e)
+            sys.exit(1)
+
+        # Parse the problem instance from JSON
+        try:
+            with phase(metrics, "parse"):
+                problem = ProblemInstance.from_json(json_input)
+        except Exception as e:
+            print("Error parsing JSON input:", e)
+            sys.exit(1)
+
+    if args.decompose:
+        # Every block gets its own algorithm and backend from the selector inside the workers
+        from optimax.decompose import solve_decomposed
+        with phase(metrics, "solve"):
+            solution = solve_decomposed(problem, workers=args.workers, solve_options=solve_options(args), cache=cache,
+                                        metrics=metrics)
+        print(f"Decomposed into {solution['decomposition']['blocks']} independent blocks")
+    else:
+        # Determine the best algorithm to use based on the problem
+        with phase(metrics, "select"):
+            algorithm, backend = AlgorithmSelector.select(problem, metrics=metrics)
+        if args.trace and algorithm != "branch_and_bound":
+            algorithm = "revised_simplex"
+        print(f"Selected algorithm: {algorithm}")
+
+        recorder = None
+        if args.tree_log:
+            from optimax.tree import TreeRecorder
+            recorder = TreeRecorder(args.tree_log)
+            if args.backend == "auto":
+                backend = "native"
+
+        # Solve the problem using the selected algorithm
+        with phase(metrics, "solve"):
+            options = solve_options(args, on_incumbent=log_incumbent if args.verbose else None)
+            solution = Solver.solve(problem, algorithm, cache=cache, metrics=metrics, recorder=recorder,
+                                    **{"backend": backend, **options})
+        if recorder is not None:
+            recorder.close()
+
+    if cache is not None:
+        stats = cache.stats()
+        print(f"Cache: {'hit' if stats['hits'] else 'miss'}")
+
+    if "presolve" in solution:
+        summary = solution["presolve"]
+        print(f"Presolve: removed {summary['rows_removed']} rows and {summary['cols_removed']} columns "
+              f"in {summary['time'] * 1000:.1f} ms")
+
+    if "heuristics" in solution:
+        summary = solution["heuristics"]
+        found = "no incumbent" if summary["objective_value"] is None else \
+            f"incumbent {summary['objective_value']:.6g} by {summary['found_by']}"
+        pruned = "" if summary["nodes_pruned"] is None else f", {summary['nodes_pruned']} nodes pruned"
+        print(f"Heuristics: {found} in {summary['time'] * 1000:.1f} ms{pruned}")
+
     # Output the formatted solution
-    print(format_solution(solution))
-    
-    # Visualize if problem is 2D and has variables
-    if len(problem.function_objective) == 2 and "variables" in solution:
-        Visualizer.plot_feasible_region(problem, solution)
-    
-    # Plot convergence if iterations and objective values are available
-    if iterations and objective_values:
-        Visualizer.plot_convergence(iterations, objective_values)
+    with phase(metrics, "format"):
+        formatted = format_solution(solution)
+    print(formatted)
+
+    # Render the applicable plots off the main thread; closing waits for the files to be written
+    if args.plots is not None:
+        from optimax.render import RenderQueue
+        problem_id = os.path.splitext(os.path.basename(json_file_path))[0]
+        with phase(metrics, "render", track_memory=False):
+            with RenderQueue(args.plots, metrics=metrics) as renderer:
+                for path in renderer.submit(problem_id, problem, solution):
+                    print(f"Plot: {path}")
+        for path, error in renderer.errors:
+            print(f"Could not render {path}: {error}")
+
+    if metrics is not None:
+        print(json.dumps(metrics.as_dict()))
 
 if __name__ == "__main__":
     main()
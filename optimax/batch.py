@@ -0,0 +1,154 @@
+import glob
+import json
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, Optional, Tuple
+
+from optimax.metrics import Metrics, phase
+from optimax.parser import ProblemInstance
+from optimax.selector import AlgorithmSelector
+from optimax.solver import Solver
+
+# Per-process solution cache and render queue, installed in each worker by _init_worker
+_worker_cache = None
+_worker_renderer = None
+
+def _init_worker(cache, plot_dir=None):
+    global _worker_cache, _worker_renderer
+    _worker_cache = cache
+    if plot_dir is not None:
+        from multiprocessing.util import Finalize
+        from optimax.render import RenderQueue
+        _worker_renderer = RenderQueue(plot_dir)
+        # Pool workers skip atexit handlers; a Finalize runs before the process exits
+        Finalize(_worker_renderer, _worker_renderer.close, exitpriority=10)
+
+def iter_problem_sources(source: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (problem_id, json_input) pairs from a batch source.
+
+    Parameters:
+        source (str): A directory (every *.json file in it), a .jsonl file (one problem
+            per non-empty line) or a glob pattern matching JSON files.
+
+    Yields:
+        tuple: The problem identifier and its raw JSON text.
+    """
+    if os.path.isdir(source):
+        paths = sorted(glob.glob(os.path.join(source, "*.json")))
+    elif source.endswith(".jsonl") and os.path.isfile(source):
+        with open(source, "r") as f:
+            for line_number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield f"{source}:{line_number}", line
+        return
+    else:
+        paths = sorted(glob.glob(source))
+
+    for path in paths:
+        with open(path, "r") as f:
+            yield path, f.read()
+
+def solve_problem(problem_id: str, json_input: str, solve_options: Optional[dict] = None, collect_metrics: bool = False) -> dict:
+    """
+    Parses, selects an algorithm for and solves a single problem.
+    Runs inside the batch worker processes, so errors are returned instead of raised.
+
+    Parameters:
+        problem_id (str): Identifier echoed back in the result.
+        json_input (str): The problem in the JSON input format.
+        solve_options (dict): Extra keyword arguments for Solver.solve (e.g. backend, presolve);
+            without 'backend', the backend chosen by AlgorithmSelector.select is used.
+        collect_metrics (bool): Time the parse, select and solve phases and return them under 'metrics'.
+
+    Returns:
+        dict: {'id', 'algorithm', 'solution'} on success or {'id', 'error'} on failure.
+            When the worker has a cache, 'cached' tells whether the solution came from it;
+            when it renders plots, 'plots' lists the files queued for this problem.
+    """
+    metrics = Metrics() if collect_metrics else None
+    try:
+        with phase(metrics, "parse"):
+            problem = ProblemInstance.from_json(json_input)
+        with phase(metrics, "select"):
+            algorithm, backend = AlgorithmSelector.select(problem, metrics=metrics)
+        # An explicit backend in solve_options overrides the selector's choice
+        options = {"backend": backend, **(solve_options or {})}
+        hits_before = _worker_cache.hits if _worker_cache is not None else 0
+        with phase(metrics, "solve"):
+            solution = Solver.solve(problem, algorithm, cache=_worker_cache, metrics=metrics, **options)
+    except Exception as e:
+        return {"id": problem_id, "error": f"{type(e).__name__}: {e}"}
+    result = {"id": problem_id, "algorithm": algorithm, "solution": solution}
+    if metrics is not None:
+        result["metrics"] = metrics.as_dict()
+    if _worker_cache is not None:
+        result["cached"] = _worker_cache.hits > hits_before
+    if _worker_renderer is not None:
+        result["plots"] = _worker_renderer.submit(problem_id, problem, solution)
+    return result
+
+def solve_batch(problems: Iterable[Tuple[str, str]], workers: Optional[int] = None, ordered: bool = True, cache=None,
+                solve_options: Optional[dict] = None, plot_dir: Optional[str] = None,
+                collect_metrics: bool = False) -> Iterator[dict]:
+    """
+    Solves many problems across a pool of worker processes and yields results as they become available.
+    At most a few tasks per worker are in flight at once, so arbitrarily long inputs are streamed.
+
+    Parameters:
+        problems (iterable): (problem_id, json_input) pairs, e.g. from iter_problem_sources.
+        workers (int): Number of worker processes (defaults to the CPU count).
+        ordered (bool): If True, results are yielded in input order; otherwise in completion order.
+        cache (SolutionCache): Optional cache copied into every worker; give it a disk path to share
+            solutions between workers and across runs.
+        solve_options (dict): Extra keyword arguments for Solver.solve (e.g. backend, presolve).
+        plot_dir (str): If given, each worker renders plots for its problems in the background into this
+            directory, with one file name per problem.
+        collect_metrics (bool): Add per-problem phase timings under 'metrics' in each result.
+
+    Yields:
+        dict: One result per problem, as returned by solve_problem.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+    problems = iter(problems)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cache, plot_dir)) as executor:
+        pending = deque()
+
+        def submit_next() -> bool:
+            item = next(problems, None)
+            if item is None:
+                return False
+            problem_id, json_input = item
+            pending.append((problem_id, executor.submit(solve_problem, problem_id, json_input, solve_options, collect_metrics)))
+            return True
+
+        while len(pending) < max_in_flight and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                problem_id, future = pending.popleft()
+                yield _collect(problem_id, future)
+            else:
+                done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                for item in [item for item in pending if item[1] in done]:
+                    pending.remove(item)
+                    yield _collect(*item)
+            while len(pending) < max_in_flight and submit_next():
+                pass
+
+def _collect(problem_id: str, future) -> dict:
+    # A crashed worker process surfaces here rather than in solve_problem
+    try:
+        return future.result()
+    except Exception as e:
+        return {"id": problem_id, "error": f"{type(e).__name__}: {e}"}
+
+def to_jsonl(result: dict) -> str:
+    """
+    Serializes a batch result as a single JSON line, converting NumPy values to plain Python types.
+    """
+    return json.dumps(result, default=lambda value: value.tolist() if hasattr(value, "tolist") else str(value))
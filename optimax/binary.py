@@ -0,0 +1,154 @@
+"""
+Binary problem format: a directory holding one .npy file per array plus a small header.json.
+
+    problem.optimax/
+        header.json     {"format": "optimax", "version": 1, "objetivo": ..., "num_variables": ..., ...}
+        c.npy           objective coefficients, float64 (n,)
+        indptr.npy      CSR row pointers (m + 1,)
+        indices.npy     CSR column indices (nnz,)
+        data.npy        CSR values, float64 (nnz,)
+        b.npy           right-hand sides, float64 (m,)
+        senses.npy      sense codes (SENSE_LE, SENSE_GE, SENSE_EQ), int8 (m,)
+        integrality.npy integer mask, bool (n,)
+        lower.npy       variable lower bounds, float64 (n,)
+        upper.npy       variable upper bounds, float64 (n,)
+
+read_binary memory-maps the arrays, so loading takes the same few milliseconds whatever the
+problem size and pages are only read from disk when the solver touches them. Convert with
+
+    python -m optimax.binary problem.json problem.optimax
+    python -m optimax.binary problem.optimax problem.json
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+import scipy.sparse as sp
+
+from optimax.parser import ProblemInstance
+
+FORMAT = "optimax"
+VERSION = 1
+HEADER = "header.json"
+ARRAYS = ("c", "indptr", "indices", "data", "b", "senses", "integrality", "lower", "upper")
+
+def is_binary(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, HEADER))
+
+def write_binary(problem: ProblemInstance, path: str):
+    """
+    Writes a problem in the binary format. The header is written last, so an interrupted
+    write never leaves a directory that read_binary accepts.
+
+    Parameters:
+        problem (ProblemInstance): The problem to write.
+        path (str): Output directory; created if needed, existing files are overwritten.
+    """
+    A = problem.A.tocsr()
+    A.sort_indices()
+    # indptr and indices share one dtype, so scipy can wrap the mapped arrays without converting them
+    index_dtype = np.int32 if max(A.nnz, A.shape[1]) < np.iinfo(np.int32).max else np.int64
+    arrays = {
+        "c": np.asarray(problem.c, dtype=np.float64),
+        "indptr": A.indptr.astype(index_dtype, copy=False),
+        "indices": A.indices.astype(index_dtype, copy=False),
+        "data": A.data.astype(np.float64, copy=False),
+        "b": np.asarray(problem.b, dtype=np.float64),
+        "senses": np.asarray(problem.senses, dtype=np.int8),
+        "integrality": np.asarray(problem.integrality, dtype=bool),
+        "lower": np.asarray(problem.lower, dtype=np.float64),
+        "upper": np.asarray(problem.upper, dtype=np.float64),
+    }
+    os.makedirs(path, exist_ok=True)
+    header_path = os.path.join(path, HEADER)
+    if os.path.exists(header_path):
+        os.remove(header_path)
+    for name, array in arrays.items():
+        np.save(os.path.join(path, f"{name}.npy"), array, allow_pickle=False)
+    header = {
+        "format": FORMAT,
+        "version": VERSION,
+        "objetivo": problem.objective,
+        "num_variables": problem.num_variables,
+        "num_constraints": problem.num_constraints,
+        "nnz": int(A.nnz),
+    }
+    with open(header_path, "w") as f:
+        json.dump(header, f, indent=1)
+
+def read_binary(path: str, mmap: bool = True) -> ProblemInstance:
+    """
+    Loads a problem written by write_binary.
+
+    Parameters:
+        path (str): The problem directory.
+        mmap (bool): Memory-map the arrays instead of reading them into memory. The maps are
+            copy-on-write: code that modifies the arrays never changes the files.
+
+    Returns:
+        ProblemInstance: The problem instance.
+
+    Raises:
+        ValueError: If the directory is not in a supported version of the format.
+    """
+    try:
+        with open(os.path.join(path, HEADER)) as f:
+            header = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"Unsupported binary problem: {path} has no {HEADER}")
+    if header.get("format") != FORMAT or header.get("version") != VERSION:
+        raise ValueError(f"Unsupported binary problem format: {header.get('format')} version {header.get('version')}")
+
+    mmap_mode = "c" if mmap else None
+    arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode, allow_pickle=False) for name in ARRAYS}
+    shape = (header["num_constraints"], header["num_variables"])
+    if len(arrays["indptr"]) != shape[0] + 1 or len(arrays["indices"]) != header["nnz"] or len(arrays["data"]) != header["nnz"]:
+        raise ValueError(f"Corrupt binary problem: {path} does not match its header")
+    A = sp.csr_matrix((arrays["data"], arrays["indices"], arrays["indptr"]), shape=shape, copy=False)
+    return ProblemInstance.from_arrays(
+        header["objetivo"], arrays["c"], A, arrays["b"], arrays["senses"], arrays["integrality"],
+        lower=arrays["lower"], upper=arrays["upper"],
+    )
+
+def to_json(problem: ProblemInstance) -> dict:
+    """
+    Returns:
+        dict: The problem in the JSON input format, with rows in the sparse 'indices' form.
+
+    Raises:
+        ValueError: If the problem has variable bounds other than x >= 0, which JSON cannot express.
+    """
+    if np.any(problem.lower != 0) or np.any(np.isfinite(problem.upper)):
+        raise ValueError("Unsupported conversion: the JSON format cannot express variable bounds other than x >= 0")
+    return {
+        "objetivo": problem.objective,
+        "funcion_objetivo": problem.function_objective,
+        "restricciones": problem.constraints,
+        "variables_enteras": problem.variables_integer,
+    }
+
+def convert(source: str, destination: str):
+    """
+    Converts a JSON problem file to the binary format, or a binary problem directory to JSON.
+
+    Parameters:
+        source (str): A JSON file or a binary problem directory.
+        destination (str): The file or directory to write.
+    """
+    if is_binary(source):
+        with open(destination, "w") as f:
+            json.dump(to_json(read_binary(source)), f)
+    else:
+        with open(source) as f:
+            write_binary(ProblemInstance.from_json(f.read()), destination)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert OPTIMAX problems between JSON and the binary format.")
+    parser.add_argument("source", help="JSON file or binary problem directory.")
+    parser.add_argument("destination", help="Binary problem directory or JSON file to write.")
+    args = parser.parse_args(argv)
+    convert(args.source, args.destination)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+import heapq
+import itertools
+import math
+import time
+
+import highspy
+import numpy as np
+from optimax.limits import relative_gap
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE
+
+INF = highspy.kHighsInf
+
+NODE_SELECTIONS = ("best_bound", "depth_first")
+BRANCHING_RULES = ("most_fractional", "pseudo_cost")
+# Nodes between rescans of the open list for the search bound in depth-first mode
+BOUND_STRIDE = 64
+
+class BranchAndBound:
+    """
+    Branch & Bound for mixed-integer problems built on HiGHS LP relaxations.
+
+    A single HiGHS model is kept for the whole search. Each node only changes the bounds of the
+    integer variables and restarts dual simplex from its parent's optimal basis, which stays
+    dual feasible after a bound change, so most nodes need just a few pivots.
+
+    Every node processed is recorded in 'branch_tree_data' using the schema expected by
+    Visualizer.plot_branch_and_bound_tree. Large searches should pass a TreeRecorder instead:
+    it streams the nodes to a file and keeps only bounded summaries, returned as 'tree_summary'.
+    """
+
+    def __init__(self, problem: ProblemInstance, node_selection: str = "best_bound", branching: str = "most_fractional",
+                 integrality_tolerance: float = 1e-6, recorder=None, limits=None, heuristics=None):
+        """
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            node_selection (str): 'best_bound' (explore the node with the best LP bound first) or
+                'depth_first' (dive into the most recent child first).
+            branching (str): 'most_fractional' or 'pseudo_cost'.
+            integrality_tolerance (float): Distance to the nearest integer accepted as integral.
+            recorder (TreeRecorder): Optional sink for the node events. When given, the nodes are not
+                collected in 'branch_tree_data'; the recorder's summary is returned as 'tree_summary'.
+            limits (SolveLimits): Optional time, node and gap limits and incumbent callback. The time
+                and node limits are checked between nodes.
+            heuristics (PrimalHeuristics): Optional primal heuristics, run on the LP solution of the
+                root and then periodically on fractional nodes; better solutions they find become
+                the incumbent.
+        """
+        if node_selection not in NODE_SELECTIONS:
+            raise ValueError(f"Unsupported node selection: {node_selection}")
+        if branching not in BRANCHING_RULES:
+            raise ValueError(f"Unsupported branching rule: {branching}")
+        self.problem = problem
+        self.node_selection = node_selection
+        self.branching = branching
+        self.integrality_tolerance = integrality_tolerance
+        self.recorder = recorder
+        self.limits = limits
+        self.heuristics = heuristics
+
+        self.maximize = problem.objective == "maximizar"
+        # The search minimizes internally; maximization problems are negated
+        self._c = -problem.c if self.maximize else problem.c.copy()
+        self._integer = np.flatnonzero(problem.integrality)
+        num_vars = problem.num_variables
+        self._columns = np.arange(num_vars, dtype=np.int32)
+        self._root_lower = np.maximum(problem.lower, -INF)
+        self._root_upper = np.minimum(problem.upper, INF)
+
+        # Pseudo-cost statistics: objective degradation per unit of fractionality, down and up branches
+        self._pc_sum = np.zeros((2, num_vars))
+        self._pc_count = np.zeros((2, num_vars))
+
+        self._highs = highspy.Highs()
+        self._highs.silent()
+        self._highs.setOptionValue("presolve", "off")
+        self._highs.setOptionValue("simplex_strategy", 1)
+        self._highs.passModel(self._build_lp())
+
+    def _build_lp(self):
+        problem = self.problem
+        A = problem.A.tocsc()
+        lp = highspy.HighsLp()
+        lp.num_col_ = problem.num_variables
+        lp.num_row_ = problem.num_constraints
+        lp.col_cost_ = self._c
+        lp.col_lower_ = self._root_lower
+        lp.col_upper_ = self._root_upper
+        lp.row_lower_ = np.where(problem.senses == SENSE_LE, -INF, problem.b)
+        lp.row_upper_ = np.where(problem.senses == SENSE_GE, INF, problem.b)
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.start_ = A.indptr.astype(np.int32)
+        lp.a_matrix_.index_ = A.indices.astype(np.int32)
+        lp.a_matrix_.value_ = A.data.astype(float)
+        return lp
+
+    def _solve_relaxation(self, lower, upper, basis):
+        """
+        Solves the LP relaxation with the given bounds, warm-started from basis when given.
+
+        Returns:
+            tuple: (status, objective in min-form, x, basis) where status is 'optimal',
+                'infeasible', 'unbounded' or 'failed' (HiGHS stopped without an answer, e.g. on a
+                numerical error or an iteration limit, even after a cold restart).
+        """
+        statuses = highspy.HighsModelStatus
+        highs = self._highs
+        highs.changeColsBounds(len(self._columns), self._columns, lower, upper)
+        if basis is not None:
+            highs.setBasis(basis)
+        highs.run()
+        model_status = highs.getModelStatus()
+        if model_status not in (statuses.kOptimal, statuses.kInfeasible, statuses.kUnbounded, statuses.kUnboundedOrInfeasible):
+            # Retry from scratch, without the warm-start basis, before giving up on the node
+            highs.clearSolver()
+            highs.run()
+            model_status = highs.getModelStatus()
+        if model_status == statuses.kOptimal:
+            x = np.asarray(highs.getSolution().col_value)
+            return "optimal", highs.getInfo().objective_function_value, x, highs.getBasis()
+        if model_status in (statuses.kUnbounded, statuses.kUnboundedOrInfeasible):
+            return "unbounded", -math.inf, None, None
+        if model_status == statuses.kInfeasible:
+            return "infeasible", math.inf, None, None
+        return "failed", -math.inf, None, None
+
+    def _select_branch_variable(self, x, fractional):
+        values = x[fractional]
+        frac = values - np.floor(values)
+        if self.branching == "most_fractional":
+            return fractional[np.argmax(np.minimum(frac, 1 - frac))]
+        # Pseudo-cost product rule; variables never branched on use the average pseudo-cost
+        counts = self._pc_count[:, fractional]
+        sums = self._pc_sum[:, fractional]
+        total = self._pc_count.sum(axis=1)
+        average = np.where(total > 0, self._pc_sum.sum(axis=1) / np.maximum(total, 1), 1.0)
+        pseudo = np.where(counts > 0, sums / np.maximum(counts, 1), average[:, None])
+        score = np.maximum(pseudo[0] * frac, 1e-6) * np.maximum(pseudo[1] * (1 - frac), 1e-6)
+        return fractional[np.argmax(score)]
+
+    def _update_pseudo_cost(self, direction, var, fraction, parent_bound, child_bound):
+        if var is None or not math.isfinite(child_bound) or fraction <= 0:
+            return
+        self._pc_sum[direction, var] += (child_bound - parent_bound) / fraction
+        self._pc_count[direction, var] += 1
+
+    def _search_bound(self, open_nodes, incumbent_value, previous, nodes):
+        """
+        Returns:
+            float: Best bound (min-form) of the whole search: the smallest parent bound of the open
+                nodes, or the incumbent when none are left. Depth-first search keeps its open nodes
+                unsorted, so there it is rescanned every BOUND_STRIDE nodes only.
+        """
+        if not open_nodes:
+            return incumbent_value
+        if self.node_selection == "best_bound":
+            return min(open_nodes[0][0], incumbent_value)
+        if nodes % BOUND_STRIDE and math.isfinite(previous):
+            return previous
+        return min(min(node[0] for node in open_nodes), incumbent_value)
+
+    def _user_sense(self, *values):
+        return tuple(-value if self.maximize else value for value in values)
+
+    def _open_bound(self, open_nodes, incumbent_value):
+        # Best bound (min-form) over the open nodes, scanning all of them
+        return min(min((node[0] for node in open_nodes), default=math.inf), incumbent_value)
+
+    def _is_pruned(self, bound, incumbent_value):
+        tolerance = 1e-6 * max(1.0, abs(incumbent_value))
+        if self.limits is not None:
+            tolerance = max(tolerance, self.limits.gap_tolerance(incumbent_value))
+        return bound >= incumbent_value - tolerance
+
+    def solve(self) -> dict:
+        """
+        Runs the search.
+
+        Returns:
+            dict: 'status', 'optimal_value' and 'variables' (when a solution is found), 'bound' and
+                'gap' (when known), 'limit' (when a limit stopped the search), 'nodes' and
+                'branch_tree_data', or 'tree_summary' when a recorder is attached. With heuristics,
+                also their summary as 'heuristics'. An LP relaxation that fails stops the search like
+                a limit named 'lp_failure': the incumbent is returned as 'Feasible', or the status is
+                'Undefined' when there is none, since the search can then prove nothing.
+        """
+        start = time.perf_counter()
+        limits = self.limits
+        limit = None
+        tol = self.integrality_tolerance
+        incumbent = None
+        incumbent_value = math.inf
+        heuristics = self.heuristics
+        if heuristics is not None:
+            heuristics.nodes_pruned = 0
+        # Whether the incumbent came from the heuristics; the nodes it prunes are counted as saved
+        heuristic_incumbent = False
+        recorder = self.recorder
+        tree = []
+        nodes = 0
+        search_bound = -math.inf
+        node_ids = itertools.count()
+        unbounded = False
+        # Smallest bound of the nodes pruned only thanks to the gap tolerance; the final bound cannot exceed it
+        pruned_bound = math.inf
+
+        # Open node: (parent bound, tie-break counter, node_id, parent_id, depth, lower, upper, basis,
+        #             branch decision, branched variable, branch direction, fraction moved)
+        counter = itertools.count()
+        root = (-math.inf, next(counter), next(node_ids), None, 0, self._root_lower, self._root_upper, None, "root", None, 0, 0.0)
+        open_nodes = [root]
+
+        while open_nodes:
+            if limits is not None:
+                limit = limits.reached(start, nodes)
+                if limit is not None:
+                    break
+            if self.node_selection == "best_bound":
+                node = heapq.heappop(open_nodes)
+            else:
+                node = open_nodes.pop()
+            parent_bound, _, node_id, parent_id, depth, lower, upper, basis, decision, var, direction, fraction = node
+
+            record = {"node_id": node_id, "parent_id": parent_id, "depth": depth, "branch_decision": decision}
+            nodes += 1
+            if recorder is None:
+                tree.append(record)
+            # The finally block reports the node however its processing ends (continue, break or fall-through)
+            try:
+                if self._is_pruned(parent_bound, incumbent_value):
+                    record.update(objective_value=None, status="pruned")
+                    pruned_bound = min(pruned_bound, parent_bound)
+                    if heuristic_incumbent:
+                        heuristics.nodes_pruned += 1
+                    continue
+
+                status, bound, x, node_basis = self._solve_relaxation(lower, upper, basis)
+                record["objective_value"] = (-bound if self.maximize else bound) if math.isfinite(bound) else None
+                if self.branching == "pseudo_cost":
+                    self._update_pseudo_cost(direction, var, fraction, parent_bound, bound)
+
+                if status == "unbounded":
+                    record["status"] = "unbounded"
+                    unbounded = True
+                    break
+                if status == "failed":
+                    # The subtree cannot be pruned safely, so the search stops; its parent's bound still holds
+                    record["status"] = "failed"
+                    pruned_bound = min(pruned_bound, parent_bound)
+                    limit = "lp_failure"
+                    break
+                if status == "infeasible":
+                    record["status"] = "infeasible"
+                    continue
+                if self._is_pruned(bound, incumbent_value):
+                    record["status"] = "pruned"
+                    pruned_bound = min(pruned_bound, bound)
+                    if heuristic_incumbent:
+                        heuristics.nodes_pruned += 1
+                    continue
+
+                values = x[self._integer]
+                fractional = self._integer[np.abs(values - np.round(values)) > tol]
+                if len(fractional) and heuristics is not None and \
+                        heuristics.at_node(x, lower, upper, nodes, incumbent_value):
+                    incumbent, incumbent_value = heuristics.incumbent.copy(), heuristics.incumbent_value
+                    heuristic_incumbent = True
+                    if self._is_pruned(bound, incumbent_value):
+                        record["status"] = "pruned"
+                        pruned_bound = min(pruned_bound, bound)
+                        heuristics.nodes_pruned += 1
+                        continue
+                if len(fractional) == 0:
+                    incumbent = x.copy()
+                    incumbent[self._integer] = np.round(incumbent[self._integer])
+                    incumbent_value = float(self._c @ incumbent)
+                    heuristic_incumbent = False
+                    record["status"] = "integer"
+                    if limits is not None:
+                        found_bound = min(self._open_bound(open_nodes, incumbent_value), pruned_bound)
+                        limits.report(start, *self._user_sense(incumbent_value, found_bound), variables=incumbent.tolist())
+                    continue
+
+                record["status"] = "branched"
+                j = int(self._select_branch_variable(x, fractional))
+                value = x[j]
+                down_upper = upper.copy()
+                down_upper[j] = math.floor(value)
+                up_lower = lower.copy()
+                up_lower[j] = math.ceil(value)
+                down = (bound, next(counter), next(node_ids), node_id, depth + 1, lower, down_upper, node_basis,
+                        f"x{j} <= {math.floor(value)}", j, 0, value - math.floor(value))
+                up = (bound, next(counter), next(node_ids), node_id, depth + 1, up_lower, upper, node_basis,
+                      f"x{j} >= {math.ceil(value)}", j, 1, math.ceil(value) - value)
+                if self.node_selection == "best_bound":
+                    heapq.heappush(open_nodes, down)
+                    heapq.heappush(open_nodes, up)
+                else:
+                    # Dive first into the child on the side the LP value is closer to
+                    first, second = (down, up) if value - math.floor(value) < 0.5 else (up, down)
+                    open_nodes.append(second)
+                    open_nodes.append(first)
+            finally:
+                if recorder is not None:
+                    search_bound = self._search_bound(open_nodes, incumbent_value, search_bound, nodes)
+                    recorder.add(record, *self._user_sense(search_bound, incumbent_value))
+
+        result = {"nodes": nodes}
+        if heuristics is not None:
+            result["heuristics"] = heuristics.summary()
+        if recorder is None:
+            result["branch_tree_data"] = tree
+        else:
+            recorder.close()
+            result["tree_summary"] = recorder.summary()
+        if unbounded:
+            result["status"] = "Unbounded"
+            return result
+        if limit is not None:
+            result["limit"] = limit
+        if limit == "lp_failure" and incumbent is None:
+            result["status"] = "Undefined"
+            return result
+        if incumbent is None:
+            result["status"] = "Infeasible" if limit is None else "Not Solved"
+        else:
+            result["status"] = "Optimal" if limit is None else "Feasible"
+            result["optimal_value"] = -incumbent_value if self.maximize else incumbent_value
+            result["variables"] = incumbent.tolist()
+        final_bound = min(self._open_bound(open_nodes, incumbent_value), pruned_bound)
+        if math.isfinite(final_bound):
+            result["bound"] = -final_bound if self.maximize else final_bound
+            result["gap"] = relative_gap(result.get("optimal_value"), result["bound"])
+        return result
@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+import scipy.sparse as sp
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE, SENSE_EQ
+
+def problem_key(problem: ProblemInstance) -> str:
+    """
+    Computes a canonical hash of a problem, so that equivalent instances share a cache entry.
+
+    The key covers the objective sense, objective coefficients, integrality flags, variable
+    bounds and the constraint rows. Rows are normalized before hashing: '>=' rows are negated into '<=' rows,
+    '==' rows are scaled so their first nonzero is positive, and the rows are sorted, so the
+    original row order and orientation do not affect the key.
+
+    Parameters:
+        problem (ProblemInstance): The problem instance.
+
+    Returns:
+        str: Hex digest identifying the problem.
+    """
+    A = problem.A.tocsr(copy=True)
+    A.sort_indices()
+    b = problem.b.copy()
+    senses = problem.senses.copy()
+
+    # Orient every row: '>=' becomes '<=', '==' rows start with a positive coefficient
+    first = np.zeros(A.shape[0])
+    has_entries = np.diff(A.indptr) > 0
+    first[has_entries] = A.data[A.indptr[:-1][has_entries]]
+    flip = (senses == SENSE_GE) | ((senses == SENSE_EQ) & (first < 0))
+    sign = np.where(flip, -1.0, 1.0)
+    A = sp.diags(sign) @ A
+    b *= sign
+    senses[senses == SENSE_GE] = SENSE_LE
+
+    # Adding 0.0 turns -0.0 into 0.0 so both spellings hash the same
+    data = A.data + 0.0
+    b = b + 0.0
+    row_digests = sorted(
+        hashlib.blake2b(
+            senses[i:i + 1].tobytes() + b[i:i + 1].tobytes()
+            + A.indices[A.indptr[i]:A.indptr[i + 1]].astype(np.int64).tobytes()
+            + data[A.indptr[i]:A.indptr[i + 1]].tobytes(),
+            digest_size=16,
+        ).digest()
+        for i in range(A.shape[0])
+    )
+
+    h = hashlib.sha256()
+    h.update(problem.objective.encode())
+    h.update(np.int64(problem.num_variables).tobytes())
+    h.update((problem.c + 0.0).tobytes())
+    h.update(problem.integrality.tobytes())
+    h.update((problem.lower + 0.0).tobytes())
+    h.update((problem.upper + 0.0).tobytes())
+    for digest in row_digests:
+        h.update(digest)
+    return h.hexdigest()
+
+class SolutionCache:
+    """
+    Two-tier cache of solutions keyed by problem_key and the solve options.
+
+    The memory tier is an LRU bounded both by entry count and by the total size of the stored
+    solutions. The optional disk tier is an sqlite database that survives across runs; sqlite's
+    own locking makes it safe to share between processes, and each process opens its own connection.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+    def __getstate__(self):
+        # Connections and locks cannot cross process boundaries; the child reopens them
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_conn"] = None
+        state["_conn_pid"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def key_for(self, problem: ProblemInstance, options: Optional[dict] = None) -> str:
+        """
+        Computes the cache key of a problem solved with the given options.
+
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            options (dict): Solve options that change the returned solution (algorithm, backend,
+                presolve, heuristics...); the same problem solved with other options gets another key.
+
+        Returns:
+            str: Hex digest identifying the problem and the options.
+        """
+        key = problem_key(problem)
+        if options:
+            key = hashlib.sha256((key + json.dumps(options, sort_keys=True, default=str)).encode()).hexdigest()
+        return key
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Looks up a solution, checking memory first and then disk.
+
+        Returns:
+            dict: A fresh copy of the cached solution, or None on a miss.
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return json.loads(payload)
+
+            payload = self._disk_get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, payload)
+        return json.loads(payload)
+
+    def put(self, key: str, solution: dict):
+        """
+        Stores a solution in the memory tier and, if configured, the disk tier.
+        """
+        payload = json.dumps(solution, default=lambda value: value.tolist() if hasattr(value, "tolist") else str(value))
+        with self._lock:
+            self._remember(key, payload)
+            self._disk_put(key, payload)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self):
+        """
+        Empties the memory tier and the disk tier.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM solutions")
+
+    def _remember(self, key: str, payload: str):
+        # Caller holds the lock
+        if key in self._entries:
+            self._bytes -= len(self._entries.pop(key))
+        if len(payload) > self.max_bytes:
+            return
+        self._entries[key] = payload
+        self._bytes += len(payload)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def _connection(self):
+        # Caller holds the lock; a forked child must not reuse its parent's connection
+        if self.path is None:
+            return None
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, solution TEXT NOT NULL)")
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute("SELECT solution FROM solutions WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _disk_put(self, key: str, payload: str):
+        conn = self._connection()
+        if conn is None:
+            return
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO solutions (key, solution) VALUES (?, ?)", (key, payload))
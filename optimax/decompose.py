@@ -0,0 +1,256 @@
+"""
+Decomposition of problems made of independent blocks.
+
+Two variables belong to the same block when some constraint involves both, so the blocks are the
+connected components of the bipartite constraint-variable graph. Blocks share no constraint and no
+variable: each one is solved on its own, in a process pool, and the solutions are merged back.
+"""
+import copy
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from optimax.metrics import phase
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE
+
+TOLERANCE = 1e-9
+
+# Failed blocks decide the merged status in this order; LP statuses are linprog messages, so they are matched by keyword
+FAILURE_PRECEDENCE = ("infeasible", "unbounded")
+
+class Decomposition:
+    """
+    The independent blocks of a problem.
+
+    Attributes:
+        problem (ProblemInstance): The decomposed problem.
+        blocks (list): (rows, cols) pairs of original indices, one per block, largest first. Variables
+            that appear in no constraint are gathered in one extra block without rows.
+        status (str): None, or 'Infeasible' when a constraint without variables cannot be satisfied.
+        summary (dict): Block count, size of the largest block and time spent finding the blocks.
+    """
+
+    def __init__(self, problem, blocks, status, summary):
+        self.problem = problem
+        self.blocks = blocks
+        self.status = status
+        self.summary = summary
+
+    def subproblem(self, k: int) -> ProblemInstance:
+        """
+        Returns:
+            ProblemInstance: Block k as a problem of its own.
+        """
+        problem = self.problem
+        rows, cols = self.blocks[k]
+        return ProblemInstance.from_arrays(
+            problem.objective, problem.c[cols], problem.A[rows][:, cols], problem.b[rows], problem.senses[rows],
+            problem.integrality[cols], lower=problem.lower[cols], upper=problem.upper[cols],
+        )
+
+    def merge(self, solutions: List[dict]) -> dict:
+        """
+        Merges the solutions of the blocks, in block order, into a solution of the whole problem.
+
+        The problem is solved only when every block is. Otherwise the status of a failed block is
+        returned, an infeasible block first, then an unbounded one. Iteration and node counts are added up.
+        If a limit (see SolveLimits) stopped any block, the merged solution is 'Feasible' and names that limit.
+
+        Returns:
+            dict: 'status' (shared by the blocks, or 'Optimal' when they differ), 'optimal_value' and
+                'variables' (when every block is solved), 'nit' and 'nodes' when the backends report
+                them, and 'decomposition' (the summary).
+        """
+        result = {}
+        failed = [str(solution.get("status")) for solution in solutions if "variables" not in solution]
+        if failed:
+            def rank(status):
+                words = [word for word in FAILURE_PRECEDENCE if word in status.lower()]
+                return FAILURE_PRECEDENCE.index(words[0]) if words else len(FAILURE_PRECEDENCE)
+            result["status"] = min(failed, key=rank)
+        else:
+            x = np.zeros(self.problem.num_variables)
+            for (_, cols), solution in zip(self.blocks, solutions):
+                x[cols] = solution["variables"]
+            statuses = {str(solution.get("status")) for solution in solutions}
+            result["status"] = statuses.pop() if len(statuses) == 1 else "Optimal"
+            if any("limit" in solution for solution in solutions):
+                result["status"] = "Feasible"
+            result["optimal_value"] = float(sum(solution["optimal_value"] for solution in solutions))
+            result["variables"] = x.tolist()
+        stopped = [solution["limit"] for solution in solutions if "limit" in solution]
+        if stopped:
+            result["limit"] = stopped[0]
+        for key in ("nit", "nodes"):
+            counts = [solution.get(key) for solution in solutions]
+            if any(count is not None for count in counts):
+                result[key] = int(sum(count or 0 for count in counts))
+        result["decomposition"] = self.summary
+        return result
+
+def decompose(problem: ProblemInstance) -> Decomposition:
+    """
+    Finds the independent blocks of a problem.
+
+    Parameters:
+        problem (ProblemInstance): The problem instance.
+
+    Returns:
+        Decomposition: The blocks, largest (by nonzeros) first.
+    """
+    start = time.perf_counter()
+    num_rows, num_vars = problem.A.shape
+    A = problem.A.tocsr()
+    # Graph nodes 0..m-1 are the rows, m..m+n-1 the variables; every nonzero is an edge
+    pattern = sp.csr_matrix((np.ones(A.nnz, dtype=np.int8), A.indices, A.indptr), shape=A.shape)
+    graph = sp.bmat([[None, pattern], [pattern.T, None]], format="csr")
+    _, labels = connected_components(graph, directed=False)
+    row_labels, col_labels = labels[:num_rows], labels[num_rows:]
+
+    row_nnz = np.diff(A.indptr)
+    col_nnz = np.bincount(A.indices, minlength=num_vars)
+    status = None
+    # Rows without variables are a block of their own: either always satisfied or infeasible
+    empty_rows = row_nnz == 0
+    b = problem.b[empty_rows]
+    senses = problem.senses[empty_rows]
+    violated = np.where(senses == SENSE_LE, b < -TOLERANCE, np.where(senses == SENSE_GE, b > TOLERANCE, np.abs(b) > TOLERANCE))
+    if np.any(violated):
+        status = "Infeasible"
+
+    used_rows = np.flatnonzero(~empty_rows)
+    used_cols = np.flatnonzero(col_nnz > 0)
+    # Group row and column indices by component with one stable sort each
+    row_order = used_rows[np.argsort(row_labels[used_rows], kind="stable")]
+    col_order = used_cols[np.argsort(col_labels[used_cols], kind="stable")]
+    components, row_starts = np.unique(row_labels[row_order], return_index=True)
+    _, col_starts = np.unique(col_labels[col_order], return_index=True)
+    rows = np.split(row_order, row_starts[1:]) if len(components) else []
+    cols = np.split(col_order, col_starts[1:]) if len(components) else []
+    blocks = sorted(zip(rows, cols), key=lambda block: -int(row_nnz[block[0]].sum()))
+
+    unused = np.flatnonzero(col_nnz == 0)
+    if len(unused):
+        blocks.append((np.zeros(0, dtype=np.int64), unused))
+
+    largest = blocks[0] if blocks else (np.zeros(0), np.zeros(0))
+    summary = {
+        "blocks": len(blocks),
+        "largest_rows": len(largest[0]),
+        "largest_cols": len(largest[1]),
+        "time": time.perf_counter() - start,
+    }
+    return Decomposition(problem, blocks, status, summary)
+
+def solve_block(problem: ProblemInstance, solve_options: Optional[dict] = None, deadline: Optional[float] = None) -> dict:
+    """
+    Selects an algorithm for a block and solves it. Runs in the pool workers.
+
+    Parameters:
+        problem (ProblemInstance): The block.
+        solve_options (dict): Extra keyword arguments for Solver.solve (e.g. backend, presolve);
+            without 'backend', the backend chosen by AlgorithmSelector.select is used.
+        deadline (float): time.time() by which the whole decomposed solve must end; the block's time
+            limit is cut down to what is left of it.
+
+    Returns:
+        dict: The solution, without the per-block plotting data.
+    """
+    from optimax.selector import AlgorithmSelector
+    from optimax.solver import Solver
+
+    algorithm, backend = AlgorithmSelector.select(problem)
+    if deadline is not None:
+        limits = copy.copy(solve_options["limits"])
+        limits.time_limit = max(deadline - time.time(), 0.0)
+        solve_options = dict(solve_options, limits=limits)
+    solution = Solver.solve(problem, algorithm, **{"backend": backend, **(solve_options or {})})
+    solution = dict(solution, algorithm=algorithm)
+    for key in ("iterations", "objective_values", "branch_tree_data"):
+        solution.pop(key, None)
+    return solution
+
+def _solve_chunk(problems: List[ProblemInstance], solve_options: Optional[dict], deadline: Optional[float] = None) -> List[dict]:
+    return [solve_block(problem, solve_options, deadline) for problem in problems]
+
+def _chunks(sizes: np.ndarray, count: int) -> List[List[int]]:
+    # Longest processing time first: each block, largest first, goes to the lightest chunk so far
+    heap = [(0, k) for k in range(count)]
+    chunks = [[] for _ in range(count)]
+    for index in np.argsort(-sizes, kind="stable").tolist():
+        load, k = heapq.heappop(heap)
+        chunks[k].append(index)
+        heapq.heappush(heap, (load + int(sizes[index]), k))
+    return [chunk for chunk in chunks if chunk]
+
+def solve_decomposed(problem: ProblemInstance, workers: Optional[int] = None, solve_options: Optional[dict] = None,
+                     cache=None, metrics=None) -> dict:
+    """
+    Solves a problem block by block. Each block gets its own algorithm and backend from the
+    selector; the blocks are packed into a few chunks per worker, balanced by their nonzeros, so
+    that many small blocks do not pay one inter-process round trip each. A problem with a single
+    block, or a single worker, is solved in this process.
+
+    A time limit in solve_options covers the whole call: blocks solved one after another share it.
+    As in Solver.solve, any time, node or gap limit bypasses the cache.
+
+    Parameters:
+        problem (ProblemInstance): The problem instance.
+        workers (int): Number of worker processes (defaults to the CPU count).
+        solve_options (dict): Extra keyword arguments for Solver.solve in every block.
+        cache (SolutionCache): Optional cache for the whole problem.
+        metrics (Metrics): Optional collector for the 'decompose.*' phases and the block summary.
+
+    Returns:
+        dict: The merged solution (see Decomposition.merge), with 'algorithm' set to the algorithm of
+            the largest block.
+    """
+    limits = (solve_options or {}).get("limits")
+    if limits is not None and limits.active:
+        cache = None
+    # Wall-clock time, comparable across the worker processes
+    deadline = time.time() + limits.time_limit if limits is not None and limits.time_limit is not None else None
+    if cache is not None:
+        # A decomposed solution carries its own fields, so it never shares an entry with Solver.solve
+        options = {name: value for name, value in (solve_options or {}).items() if name != "limits"}
+        key = cache.key_for(problem, dict(options, decompose=True))
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    with phase(metrics, "decompose.detect"):
+        decomposition = decompose(problem)
+    if metrics is not None:
+        metrics.record("decomposition", decomposition.summary)
+    if decomposition.status is not None:
+        return {"status": decomposition.status, "decomposition": decomposition.summary}
+
+    with phase(metrics, "decompose.solve", track_memory=False):
+        subproblems = [decomposition.subproblem(k) for k in range(len(decomposition.blocks))]
+        workers = min(workers or os.cpu_count() or 1, len(subproblems))
+        if workers <= 1:
+            solutions = _solve_chunk(subproblems, solve_options, deadline)
+        else:
+            sizes = np.array([max(sub.A.nnz, sub.num_variables) for sub in subproblems])
+            chunks = _chunks(sizes, min(len(subproblems), workers * 4))
+            solutions = [None] * len(subproblems)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [(chunk, executor.submit(_solve_chunk, [subproblems[k] for k in chunk], solve_options,
+                                                       deadline))
+                           for chunk in chunks]
+                for chunk, future in futures:
+                    for k, solution in zip(chunk, future.result()):
+                        solutions[k] = solution
+
+    with phase(metrics, "decompose.merge"):
+        solution = decomposition.merge(solutions)
+    if solutions:
+        solution["algorithm"] = solutions[0]["algorithm"]
+    if cache is not None and "limit" not in solution:
+        cache.put(key, solution)
+    return solution
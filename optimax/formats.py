@@ -0,0 +1,818 @@
+"""
+Readers and writers for the standard model file formats, plus a converter between every format OPTIMAX reads.
+
+    MPS       fixed or free MPS (.mps, .fmps, optionally gzipped)
+    LP        CPLEX LP (.lp, optionally gzipped)
+    JSON      the OPTIMAX input format (.json)
+    binary    the memory-mapped directory format of optimax.binary
+
+    python -m optimax.formats model.mps model.optimax
+    python -m optimax.formats model.lp model.mps
+
+The readers work line by line and never hold the file or a Python object per nonzero: coefficients
+go straight into typed arrays (about 24 bytes per nonzero) and the CSR matrix is built from them
+once at the end. Ranged rows (MPS RANGES, 'lo <= expr <= hi' in LP files) become two rows, since
+ProblemInstance rows have a single right-hand side. Objective constants are not supported by
+ProblemInstance and are dropped with a warning. Files with quadratic terms, SOS or semi-continuous
+variables are rejected.
+
+Problems read from MPS or LP files keep the names from the file in 'variable_names' and
+'constraint_names'; the writers use them when present.
+"""
+import argparse
+import gzip
+import json
+import logging
+import math
+import re
+from array import array
+
+import numpy as np
+import scipy.sparse as sp
+
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE, SENSE_EQ
+
+logger = logging.getLogger(__name__)
+
+# MPS treats any magnitude from 1e30 up as infinite
+MPS_INFINITY = 1e30
+
+MPS_SENSES = {"L": SENSE_LE, "G": SENSE_GE, "E": SENSE_EQ}
+# Row indices given to the objective and to other free ('N') rows
+_OBJECTIVE_ROW = -1
+_FREE_ROW = -2
+MPS_SECTIONS = {"NAME", "OBJSENSE", "OBJSENCE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"}
+MPS_UNSUPPORTED = {"QUADOBJ", "QSECTION", "QMATRIX", "QCMATRIX", "CSECTION", "SOS", "INDICATORS", "GENCONS", "PWLOBJ"}
+LP_OPERATORS = {"<=": SENSE_LE, "=<": SENSE_LE, "<": SENSE_LE, ">=": SENSE_GE, "=>": SENSE_GE, ">": SENSE_GE, "=": SENSE_EQ}
+
+def _open(path: str, mode: str = "r"):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t")
+    return open(path, mode)
+
+class _ModelBuilder:
+    """
+    Accumulates a model entry by entry in typed arrays, then builds the ProblemInstance.
+    """
+
+    def __init__(self):
+        self.columns = {}
+        self.rows = {}
+        self.column_names = []
+        self.row_names = []
+        self.c = array("d")
+        self.integer = array("b")
+        self.lower = array("d")
+        self.upper = array("d")
+        self.lower_given = set()
+        self.senses = array("b")
+        self.rhs = array("d")
+        self.ranges = {}
+        self.entry_rows = array("q")
+        self.entry_columns = array("q")
+        self.entry_values = array("d")
+        self.offset = 0.0
+
+    def column(self, name: str) -> int:
+        j = self.columns.get(name)
+        if j is None:
+            j = self.columns[name] = len(self.column_names)
+            self.column_names.append(name)
+            self.c.append(0.0)
+            self.integer.append(0)
+            self.lower.append(0.0)
+            self.upper.append(math.inf)
+        return j
+
+    def add_row(self, name: str, sense: int, rhs: float = 0.0) -> int:
+        if name in self.rows:
+            raise ValueError(f"Duplicate row name: {name}")
+        i = self.rows[name] = len(self.row_names)
+        self.row_names.append(name)
+        self.senses.append(sense)
+        self.rhs.append(rhs)
+        return i
+
+    def add_entry(self, row: int, column: int, value: float):
+        self.entry_rows.append(row)
+        self.entry_columns.append(column)
+        self.entry_values.append(value)
+
+    def set_bound(self, column: int, kind: str, value: float = 0.0):
+        """Applies one bound in MPS terms: UP, LO, FX, FR, MI, PL, BV, LI or UI."""
+        if kind in ("UP", "UI"):
+            # A negative upper bound on a variable without an explicit lower bound makes it unbounded below
+            if value < 0 and column not in self.lower_given and self.lower[column] == 0:
+                logger.warning("Negative upper bound on %s without a lower bound; lower bound set to -inf",
+                               self.column_names[column])
+                self.lower[column] = -math.inf
+            self.upper[column] = value
+        elif kind in ("LO", "LI"):
+            self.lower[column] = value
+            self.lower_given.add(column)
+        elif kind == "FX":
+            self.lower[column] = self.upper[column] = value
+            self.lower_given.add(column)
+        elif kind == "FR":
+            self.lower[column], self.upper[column] = -math.inf, math.inf
+            self.lower_given.add(column)
+        elif kind == "MI":
+            self.lower[column] = -math.inf
+            self.lower_given.add(column)
+        elif kind == "PL":
+            self.upper[column] = math.inf
+        elif kind == "BV":
+            self.lower[column], self.upper[column] = 0.0, 1.0
+            self.integer[column] = 1
+        else:
+            raise ValueError(f"Unsupported bound type: {kind}")
+        if kind in ("LI", "UI"):
+            self.integer[column] = 1
+
+    def build(self, objective: str) -> ProblemInstance:
+        if self.offset:
+            logger.warning("Objective constant %g dropped; optimal values exclude it", self.offset)
+        num_rows, num_vars = len(self.row_names), len(self.column_names)
+        A = sp.csr_matrix(
+            (np.frombuffer(self.entry_values, dtype=np.float64),
+             (np.frombuffer(self.entry_rows, dtype=np.int64), np.frombuffer(self.entry_columns, dtype=np.int64))),
+            shape=(num_rows, num_vars),
+        )
+        senses = np.frombuffer(self.senses, dtype=np.int8).copy()
+        b = np.frombuffer(self.rhs, dtype=np.float64).copy()
+        row_names = self.row_names
+
+        if self.ranges:
+            # A ranged row keeps one side of its interval and a copy of the row takes the other
+            ranged = np.fromiter(self.ranges, dtype=np.int64, count=len(self.ranges))
+            widths = np.fromiter(self.ranges.values(), dtype=np.float64, count=len(self.ranges))
+            rhs = b[ranged]
+            row_senses = senses[ranged]
+            low = np.where(row_senses == SENSE_LE, rhs - np.abs(widths),
+                           np.where(row_senses == SENSE_GE, rhs, np.where(widths >= 0, rhs, rhs + widths)))
+            high = low + np.abs(widths)
+            senses[ranged] = SENSE_GE
+            b[ranged] = low
+            A = sp.vstack([A, A[ranged]], format="csr")
+            senses = np.concatenate([senses, np.full(len(ranged), SENSE_LE, dtype=np.int8)])
+            b = np.concatenate([b, high])
+            row_names = row_names + [f"{row_names[i]}.range" for i in ranged.tolist()]
+
+        problem = ProblemInstance.from_arrays(
+            objective, np.frombuffer(self.c, dtype=np.float64).copy(), A, b, senses,
+            np.frombuffer(self.integer, dtype=np.int8).astype(bool),
+            lower=np.frombuffer(self.lower, dtype=np.float64).copy(),
+            upper=np.frombuffer(self.upper, dtype=np.float64).copy(),
+        )
+        problem.variable_names = self.column_names
+        problem.constraint_names = row_names
+        return problem
+
+def _mps_number(text: str) -> float:
+    value = float(text)
+    if value >= MPS_INFINITY:
+        return math.inf
+    if value <= -MPS_INFINITY:
+        return -math.inf
+    return value
+
+def _mps_fields(line: str, fixed: bool) -> list:
+    if not fixed:
+        return line.split()
+    # Fixed MPS columns: 2-3, 5-12, 15-22, 25-36, 40-47, 50-61
+    fields = [line[1:3], line[4:12], line[14:22], line[24:36], line[39:47], line[49:61]]
+    fields = [field.strip() for field in fields]
+    while fields and not fields[-1]:
+        fields.pop()
+    return fields
+
+def read_mps(path: str, fixed: bool = False) -> ProblemInstance:
+    """
+    Reads an MPS file line by line.
+
+    Parameters:
+        path (str): The file; '.gz' files are decompressed on the fly.
+        fixed (bool): Parse fixed-column MPS, where names may contain spaces. The default free
+            format splits fields on whitespace, which also reads fixed files whose names have no spaces.
+
+    Returns:
+        ProblemInstance: The problem, with 'variable_names' and 'constraint_names' from the file.
+
+    Raises:
+        ValueError: If the file uses an unsupported section or bound type, or is malformed.
+    """
+    model = _ModelBuilder()
+    rows = model.rows
+    objective = "minimizar"
+    section = None
+    integer_block = False
+    has_objective = False
+    column_name, j = None, -1
+    # COLUMNS entries are buffered as text and converted a chunk at a time
+    pending_columns, pending_rows, pending_values = [], [], []
+
+    def flush():
+        row_ids = np.fromiter((rows[row] for row in pending_rows), dtype=np.int64, count=len(pending_rows))
+        values = np.array(pending_values, dtype=np.float64)
+        column_ids = np.array(pending_columns, dtype=np.int64)
+        in_objective = row_ids == _OBJECTIVE_ROW
+        for k, value in zip(column_ids[in_objective].tolist(), values[in_objective].tolist()):
+            model.c[k] += value
+        keep = row_ids >= 0
+        model.entry_rows.frombytes(row_ids[keep].tobytes())
+        model.entry_columns.frombytes(column_ids[keep].tobytes())
+        model.entry_values.frombytes(values[keep].tobytes())
+        pending_columns.clear()
+        pending_rows.clear()
+        pending_values.clear()
+
+    with _open(path) as f:
+        for number, line in enumerate(f, 1):
+            try:
+                if not line[0].isspace():
+                    if line[0] == "*":
+                        continue
+                    tokens = line.split()
+                    keyword = tokens[0].upper()
+                    if keyword in MPS_UNSUPPORTED or keyword not in MPS_SECTIONS and (fixed or section in (None, "NAME")):
+                        raise ValueError(f"Unsupported MPS section {tokens[0]}")
+                    if keyword not in MPS_SECTIONS:
+                        # Free MPS data lines need not be indented
+                        tokens = None
+                    if tokens is not None:
+                        if section == "COLUMNS" and pending_values:
+                            flush()
+                        section = keyword
+                        if section in ("OBJSENSE", "OBJSENCE") and len(tokens) > 1:
+                            objective = "maximizar" if tokens[1].upper().startswith("MAX") else "minimizar"
+                        if section == "ENDATA":
+                            break
+                        continue
+
+                fields = _mps_fields(line, fixed) if fixed else line.split()
+                if not fields:
+                    continue
+                if section == "COLUMNS":
+                    if fixed:
+                        fields = fields[1:]
+                    if len(fields) > 1 and fields[1] == "'MARKER'":
+                        if "'INTORG'" in fields:
+                            integer_block = True
+                        elif "'INTEND'" in fields:
+                            integer_block = False
+                        continue
+                    if fields[0] != column_name:
+                        column_name = fields[0]
+                        j = model.column(column_name)
+                        if integer_block:
+                            model.integer[j] = 1
+                    if len(fields) == 3:
+                        pending_columns.append(j)
+                        pending_rows.append(fields[1])
+                        pending_values.append(fields[2])
+                    else:
+                        pending_columns.extend((j, j))
+                        pending_rows.extend(fields[1::2])
+                        pending_values.extend(fields[2::2])
+                    if len(pending_values) >= 65536:
+                        flush()
+                elif section == "ROWS":
+                    kind, name = fields[0].upper(), fields[1]
+                    if kind == "N":
+                        # The first free row is the objective; any others carry no constraint
+                        if name in rows:
+                            raise ValueError(f"Duplicate row name: {name}")
+                        rows[name] = _FREE_ROW if has_objective else _OBJECTIVE_ROW
+                        has_objective = True
+                    else:
+                        model.add_row(name, MPS_SENSES[kind])
+                elif section in ("RHS", "RANGES"):
+                    if fixed:
+                        fields = fields[1:]
+                    # The set name is optional in free MPS
+                    for k in range(len(fields) % 2, len(fields) - 1, 2):
+                        i, value = rows[fields[k]], float(fields[k + 1])
+                        if section == "RHS" and i == _OBJECTIVE_ROW:
+                            model.offset = -value
+                        elif section == "RHS" and i >= 0:
+                            model.rhs[i] = value
+                        elif i >= 0:
+                            model.ranges[i] = value
+                elif section == "BOUNDS":
+                    kind = fields[0].upper()
+                    if fixed:
+                        column, value = fields[2], fields[3] if len(fields) > 3 else None
+                    elif kind in ("FR", "MI", "PL", "BV"):
+                        # 'TYPE [set] column', though some writers add a value anyway
+                        named = len(fields) > 2 and not (fields[1] in model.columns and fields[2] not in model.columns)
+                        column, value = fields[2 if named else 1], None
+                    else:
+                        column, value = (fields[1], fields[2]) if len(fields) == 3 else (fields[2], fields[3])
+                    model.set_bound(model.column(column), kind, 0.0 if value is None else _mps_number(value))
+                elif section in ("OBJSENSE", "OBJSENCE"):
+                    objective = "maximizar" if fields[0].upper().startswith("MAX") else "minimizar"
+                elif section != "NAME":
+                    raise ValueError("data outside a section")
+            except (KeyError, IndexError, ValueError) as e:
+                raise ValueError(f"Malformed MPS line {number}: {line.strip()!r} ({e})") from e
+        if pending_values:
+            try:
+                flush()
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"Malformed MPS COLUMNS section ({e})") from e
+    return model.build(objective)
+
+def _names(problem: ProblemInstance, attribute: str, prefix: str, count: int, pattern=None) -> list:
+    names = getattr(problem, attribute, None)
+    if names is None or len(names) != count or len(set(names)) != count or \
+            (pattern is not None and not all(pattern.fullmatch(name) for name in names)):
+        return [f"{prefix}{i}" for i in range(count)]
+    return names
+
+def _number(value: float) -> str:
+    return f"{value:.17g}"
+
+def write_mps(problem: ProblemInstance, path: str, name: str = "OPTIMAX"):
+    """
+    Writes a problem in free MPS format, column by column.
+
+    Parameters:
+        problem (ProblemInstance): The problem to write.
+        path (str): Output file; '.gz' files are compressed.
+        name (str): Model name for the NAME record.
+    """
+    mps_name = re.compile(r"\S+")
+    columns = _names(problem, "variable_names", "x", problem.num_variables, mps_name)
+    rows = _names(problem, "constraint_names", "R", problem.num_constraints, mps_name)
+    objective_row = "obj"
+    while objective_row in rows:
+        objective_row += "_"
+    A = problem.A.tocsc()
+    A.sort_indices()
+    c = np.asarray(problem.c, dtype=float)
+    integrality = np.asarray(problem.integrality, dtype=bool)
+    letters = {SENSE_LE: "L", SENSE_GE: "G", SENSE_EQ: "E"}
+
+    with _open(path, "w") as f:
+        f.write(f"NAME {name}\n")
+        if problem.objective == "maximizar":
+            f.write("OBJSENSE\n    MAX\n")
+        f.write(f"ROWS\n N  {objective_row}\n")
+        f.writelines(f" {letters[sense]}  {row}\n" for sense, row in zip(problem.senses.tolist(), rows))
+
+        f.write("COLUMNS\n")
+        in_integer_block = False
+        markers = 0
+        for j, column in enumerate(columns):
+            if integrality[j] != in_integer_block:
+                f.write(f"    M{markers} 'MARKER' '{'INTORG' if integrality[j] else 'INTEND'}'\n")
+                markers += 1
+                in_integer_block = bool(integrality[j])
+            start, end = A.indptr[j], A.indptr[j + 1]
+            lines = [f"    {column} {objective_row} {_number(c[j])}\n"] if c[j] != 0 or start == end else []
+            lines.extend(f"    {column} {rows[i]} {_number(value)}\n"
+                         for i, value in zip(A.indices[start:end].tolist(), A.data[start:end].tolist()))
+            f.writelines(lines)
+        if in_integer_block:
+            f.write(f"    M{markers} 'MARKER' 'INTEND'\n")
+
+        f.write("RHS\n")
+        f.writelines(f"    RHS {rows[i]} {_number(value)}\n" for i, value in enumerate(problem.b.tolist()) if value != 0)
+
+        f.write("BOUNDS\n")
+        for j, (low, high) in enumerate(zip(problem.lower.tolist(), problem.upper.tolist())):
+            column = columns[j]
+            if low == high:
+                f.write(f" FX BND {column} {_number(low)}\n")
+                continue
+            if low == -math.inf:
+                f.write(f" {'FR' if high == math.inf else 'MI'} BND {column}\n")
+            elif low != 0:
+                f.write(f" LO BND {column} {_number(low)}\n")
+            if high != math.inf:
+                f.write(f" UP BND {column} {_number(high)}\n")
+        f.write("ENDATA\n")
+
+# CPLEX LP names: letters, digits and !"#$%&()/,.;?@_`'{}|~, not starting with a digit or a period
+_LP_NAME = r"[A-Za-z!\"#$%&()/,;?@_`'{}|~][A-Za-z0-9!\"#$%&()/,.;?@_`'{}|~]*"
+_NUMBER = r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+# One 'sign coefficient name' term; after the first term the sign is required, so names are never split
+_LP_TERM = re.compile(r"\s*([+-]?)\s*(" + _NUMBER + r")?\s*(" + _LP_NAME + r")")
+_LP_EXPRESSION = (r"\s*[+-]?\s*(?:" + _NUMBER + r")?\s*" + _LP_NAME
+                  + r"(?:\s*[+-]\s*(?:" + _NUMBER + r")?\s*" + _LP_NAME + r")*")
+# Fast paths for the usual 'name: expression <= rhs' constraints and objective lines without constants
+_LP_CONSTRAINT = re.compile(
+    r"\s*(?:(" + _LP_NAME + r")\s*:)?(" + _LP_EXPRESSION + r")\s*(<=|>=|=<|=>|<|>|=)"
+    r"\s*([+-]?\s*(?:" + _NUMBER + r"|(?i:inf(?:inity)?)))\s*"
+)
+_LP_OBJECTIVE_LINE = re.compile(r"\s*(?:" + _LP_NAME + r"\s*:)?((?:" + _LP_EXPRESSION + r")?)\s*")
+_LP_COMPARISON = re.compile(r"[<>=]")
+_LP_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<label>" + _LP_NAME + r")\s*:"
+    r"|(?P<inf>[+-]?inf(?:inity)?)(?![A-Za-z0-9!\"#$%&()/,.;?@_`'{}|~])"
+    r"|(?P<number>" + _NUMBER + r")"
+    r"|(?P<op><=|>=|=<|=>|<|>|=)"
+    r"|(?P<sign>[+-])"
+    r"|(?P<name>" + _LP_NAME + r")"
+    r"|(?P<other>\S))",
+    re.IGNORECASE,
+)
+_LP_SECTION = re.compile(
+    r"\s*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject\s+to|such\s+that|s\.t\.|st|bounds?"
+    r"|generals?|gen|integers?|binar(?:y|ies)|bin|semi-continuous|semis?|sos|end)(?=\s|$)",
+    re.IGNORECASE,
+)
+_LP_SECTION_NAMES = {
+    "max": "objective", "maximize": "objective", "maximise": "objective", "maximum": "objective",
+    "min": "objective", "minimize": "objective", "minimise": "objective", "minimum": "objective",
+    "subject to": "constraints", "such that": "constraints", "s.t.": "constraints", "st": "constraints",
+    "bound": "bounds", "bounds": "bounds",
+    "general": "generals", "generals": "generals", "gen": "generals", "integer": "generals", "integers": "generals",
+    "binary": "binaries", "binaries": "binaries", "bin": "binaries",
+    "semi-continuous": "unsupported", "semi": "unsupported", "semis": "unsupported", "sos": "unsupported",
+    "end": "end",
+}
+
+def _lp_tokens(text: str) -> list:
+    tokens = []
+    for match in _LP_TOKEN.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "other":
+            raise ValueError(f"Unsupported LP syntax: {value!r} (quadratic terms are not supported)")
+        if kind in ("number", "inf"):
+            value = float(value)
+            # Fold a sign into the number that follows it
+            if tokens and tokens[-1][0] == "sign":
+                value = -value if tokens.pop()[1] == "-" else value
+            kind = "number"
+        tokens.append((kind, value))
+    return tokens
+
+class _LPStatement:
+    """
+    Collects one linear expression, with an optional label, comparison and constant bounds.
+    """
+
+    def __init__(self):
+        self.label = None
+        self.terms = []
+        self.lower = None
+        self.operator = None
+        self.constant = 0.0
+        self.sign = 1.0
+        self.coefficient = None
+
+    def feed(self, kind: str, value):
+        """
+        Adds a token. Returns the right-hand side when the statement is complete, otherwise None.
+        """
+        if kind == "label":
+            self.label = value
+        elif kind == "sign":
+            if value == "-":
+                self.sign = -self.sign
+        elif kind == "number":
+            value *= self.sign
+            self.sign = 1.0
+            if self.operator is not None:
+                return value
+            if self.coefficient is not None:
+                raise ValueError("two numbers in a row")
+            self.coefficient = value
+        elif kind == "name":
+            coefficient = 1.0 if self.coefficient is None else self.coefficient
+            self.terms.append((value, coefficient * self.sign))
+            self.coefficient = None
+            self.sign = 1.0
+        elif kind == "op":
+            if self.coefficient is not None and not self.terms and self.lower is None:
+                # 'lo <= expr <= hi': the number before the first comparison is one side of a range
+                self.lower = (self.coefficient, value)
+            else:
+                if self.coefficient is not None:
+                    self.constant += self.coefficient
+                self.operator = value
+            self.coefficient = None
+        return None
+
+    @property
+    def pending(self) -> bool:
+        """True while a sign or coefficient waits for its variable."""
+        return self.coefficient is not None or self.sign != 1.0
+
+    @property
+    def empty(self) -> bool:
+        return not (self.label or self.terms or self.lower or self.operator or self.pending)
+
+    def finish(self):
+        if self.coefficient is not None:
+            self.constant += self.coefficient
+            self.coefficient = None
+
+def _lp_constraint(model: _ModelBuilder, statement: _LPStatement, rhs: float):
+    name = statement.label or f"R{len(model.row_names)}"
+    rhs -= statement.constant
+    if statement.lower is None:
+        row = model.add_row(name, LP_OPERATORS[statement.operator], rhs)
+    else:
+        bound, operator = statement.lower
+        bound -= statement.constant
+        if LP_OPERATORS[operator] != LP_OPERATORS[statement.operator] or LP_OPERATORS[operator] == SENSE_EQ:
+            raise ValueError(f"Unsupported ranged constraint {name}")
+        low, high = (bound, rhs) if LP_OPERATORS[operator] == SENSE_LE else (rhs, bound)
+        if low == high:
+            row = model.add_row(name, SENSE_EQ, low)
+        else:
+            row = model.add_row(name, SENSE_GE, low)
+            model.ranges[row] = high - low
+    for column, coefficient in statement.terms:
+        model.add_entry(row, model.column(column), coefficient)
+
+def _lp_bound(model: _ModelBuilder, tokens: list):
+    kinds = [kind for kind, _ in tokens]
+    values = [value for _, value in tokens]
+    if kinds == ["name", "name"] and values[1].lower() == "free":
+        model.set_bound(model.column(values[0]), "FR")
+    elif kinds == ["name", "op", "number"]:
+        _lp_bound_side(model, model.column(values[0]), LP_OPERATORS[values[1]], values[2])
+    elif kinds == ["number", "op", "name"]:
+        # '3 <= x' bounds x from the side opposite to the operator
+        sense = {SENSE_LE: SENSE_GE, SENSE_GE: SENSE_LE, SENSE_EQ: SENSE_EQ}[LP_OPERATORS[values[1]]]
+        _lp_bound_side(model, model.column(values[2]), sense, values[0])
+    elif kinds == ["number", "op", "name", "op", "number"] and LP_OPERATORS[values[1]] == LP_OPERATORS[values[3]] != SENSE_EQ:
+        column = model.column(values[2])
+        low, high = (values[0], values[4]) if LP_OPERATORS[values[1]] == SENSE_LE else (values[4], values[0])
+        model.set_bound(column, "MI" if low == -math.inf else "LO", low)
+        model.set_bound(column, "PL" if high == math.inf else "UP", high)
+    else:
+        raise ValueError("unrecognised bound")
+
+def _lp_bound_side(model: _ModelBuilder, column: int, sense: int, value: float):
+    if sense == SENSE_EQ:
+        model.set_bound(column, "FX", value)
+    elif sense == SENSE_LE:
+        model.set_bound(column, "PL" if value == math.inf else "UP", value)
+    else:
+        model.set_bound(column, "MI" if value == -math.inf else "LO", value)
+
+def read_lp(path: str) -> ProblemInstance:
+    """
+    Reads a CPLEX LP file line by line. Objective and constraint expressions may span lines;
+    bounds are one per line.
+
+    Parameters:
+        path (str): The file; '.gz' files are decompressed on the fly.
+
+    Returns:
+        ProblemInstance: The problem, with 'variable_names' and 'constraint_names' from the file.
+
+    Raises:
+        ValueError: If the file uses quadratic terms, SOS or semi-continuous variables, or is malformed.
+    """
+    model = _ModelBuilder()
+    columns = model.columns
+    objective = None
+    section = None
+    statement = _LPStatement()
+    # Constraint lines waiting for their comparison, and entries waiting for conversion
+    lines = []
+    pending_rows, pending_columns, pending_values = [], [], []
+
+    def flush():
+        model.entry_rows.extend(pending_rows)
+        model.entry_columns.extend(pending_columns)
+        model.entry_values.frombytes(np.array(pending_values, dtype=np.float64).tobytes())
+        pending_rows.clear()
+        pending_columns.clear()
+        pending_values.clear()
+
+    def add_terms(row, expression):
+        for sign, coefficient, name in _LP_TERM.findall(expression):
+            j = columns.get(name)
+            if j is None:
+                j = model.column(name)
+            pending_rows.append(row)
+            pending_columns.append(j)
+            pending_values.append(sign + (coefficient or "1"))
+        if len(pending_values) >= 65536:
+            flush()
+
+    def feed(text):
+        # General path: token by token, for ranges, constants and statements sharing a line
+        nonlocal statement
+        for kind, value in _lp_tokens(text):
+            rhs = statement.feed(kind, value)
+            if rhs is not None:
+                _lp_constraint(model, statement, rhs)
+                statement = _LPStatement()
+
+    with _open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.split("\\", 1)[0]
+            if not line.strip():
+                continue
+            try:
+                match = _LP_SECTION.match(line)
+                if match:
+                    keyword = " ".join(match.group(1).lower().split())
+                    new_section = _LP_SECTION_NAMES[keyword]
+                    if new_section == "unsupported":
+                        raise ValueError(f"Unsupported LP section {match.group(1)}")
+                    if section == "objective":
+                        statement.finish()
+                        model.offset = statement.constant
+                    elif section == "constraints":
+                        if lines:
+                            feed(" ".join(lines))
+                            lines.clear()
+                        if not statement.empty:
+                            raise ValueError("incomplete constraint before this section")
+                    section = new_section
+                    statement = _LPStatement()
+                    if section == "objective":
+                        objective = "maximizar" if keyword.startswith("max") else "minimizar"
+                    if section == "end":
+                        break
+                    line = line[match.end():]
+                    if not line.strip():
+                        continue
+
+                if section == "constraints":
+                    if not statement.empty:
+                        feed(line)
+                        continue
+                    lines.append(line)
+                    if not _LP_COMPARISON.search(line):
+                        continue
+                    text = " ".join(lines) if len(lines) > 1 else line
+                    lines.clear()
+                    fast = _LP_CONSTRAINT.fullmatch(text)
+                    if fast:
+                        name, expression, operator, rhs = fast.groups()
+                        row = model.add_row(name or f"R{len(model.row_names)}", LP_OPERATORS[operator],
+                                            float(rhs.replace(" ", "")))
+                        add_terms(row, expression)
+                    else:
+                        feed(text)
+                elif section == "objective":
+                    fast = None if statement.pending else _LP_OBJECTIVE_LINE.fullmatch(line)
+                    if fast:
+                        for sign, coefficient, name in _LP_TERM.findall(fast.group(1)):
+                            model.c[model.column(name)] += float(sign + (coefficient or "1"))
+                        continue
+                    for kind, value in _lp_tokens(line):
+                        statement.feed(kind, value)
+                        if kind == "name":
+                            column, coefficient = statement.terms.pop()
+                            model.c[model.column(column)] += coefficient
+                elif section == "bounds":
+                    _lp_bound(model, _lp_tokens(line))
+                elif section in ("generals", "binaries"):
+                    for kind, value in _lp_tokens(line):
+                        if kind != "name":
+                            raise ValueError("expected variable names")
+                        column = model.column(value)
+                        if section == "binaries":
+                            model.set_bound(column, "BV")
+                        else:
+                            model.integer[column] = 1
+                else:
+                    raise ValueError("text outside a section")
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"Malformed LP line {number}: {line.strip()!r} ({e})") from e
+
+    if objective is None:
+        raise ValueError("LP file has no objective section")
+    if section == "objective":
+        statement.finish()
+        model.offset = statement.constant
+    elif section == "constraints" and (lines or not statement.empty):
+        raise ValueError("LP file ends inside a constraint")
+    if pending_values:
+        flush()
+    return model.build(objective)
+
+def _lp_expression(terms, names) -> list:
+    # Eight terms per line keeps lines well under the 255 characters CPLEX allows
+    parts = [f"{'-' if value < 0 else '+'} {_number(abs(value))} {names[j]}" for j, value in terms]
+    if not parts:
+        # An empty expression still needs a term
+        return [f"0 {names[0]}"]
+    if parts[0].startswith("+ "):
+        parts[0] = parts[0][2:]
+    return [" ".join(parts[k:k + 8]) for k in range(0, len(parts), 8)]
+
+def write_lp(problem: ProblemInstance, path: str):
+    """
+    Writes a problem in CPLEX LP format.
+
+    Parameters:
+        problem (ProblemInstance): The problem to write.
+        path (str): Output file; '.gz' files are compressed.
+    """
+    lp_name = re.compile(_LP_NAME)
+    columns = _names(problem, "variable_names", "x", problem.num_variables, lp_name)
+    rows = _names(problem, "constraint_names", "R", problem.num_constraints, lp_name)
+    A = problem.A.tocsr()
+    c = np.asarray(problem.c, dtype=float)
+    operators = {SENSE_LE: "<=", SENSE_GE: ">=", SENSE_EQ: "="}
+
+    with _open(path, "w") as f:
+        f.write("Maximize\n" if problem.objective == "maximizar" else "Minimize\n")
+        lines = _lp_expression(((j, c[j]) for j in np.flatnonzero(c).tolist()), columns)
+        f.write(" obj: " + "\n      ".join(lines) + "\n")
+
+        f.write("Subject To\n")
+        for i, (sense, rhs) in enumerate(zip(problem.senses.tolist(), problem.b.tolist())):
+            start, end = A.indptr[i], A.indptr[i + 1]
+            lines = _lp_expression(zip(A.indices[start:end].tolist(), A.data[start:end].tolist()), columns)
+            f.write(f" {rows[i]}: " + "\n    ".join(lines) + f" {operators[sense]} {_number(rhs)}\n")
+
+        f.write("Bounds\n")
+        for j, (low, high) in enumerate(zip(problem.lower.tolist(), problem.upper.tolist())):
+            column = columns[j]
+            if low == high:
+                f.write(f" {column} = {_number(low)}\n")
+            elif low == -math.inf and high == math.inf:
+                f.write(f" {column} free\n")
+            elif low != 0 or high != math.inf:
+                f.write(f" {_number(low)} <= {column} <= {_number(high)}\n")
+
+        integer = np.flatnonzero(problem.integrality).tolist()
+        if integer:
+            f.write("Generals\n")
+            for k in range(0, len(integer), 10):
+                f.write(" " + " ".join(columns[j] for j in integer[k:k + 10]) + "\n")
+        f.write("End\n")
+
+def is_model_file(path: str) -> bool:
+    """True for binary problem directories and MPS or LP files, which read_problem loads without JSON."""
+    try:
+        return _kind(path) != "json"
+    except ValueError:
+        return False
+
+def _kind(path: str) -> str:
+    from optimax.binary import is_binary
+
+    if is_binary(path):
+        return "binary"
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    for extension, kind in ((".mps", "mps"), (".fmps", "mps"), (".lp", "lp"), (".json", "json"), (".optimax", "binary")):
+        if name.endswith(extension):
+            return kind
+    raise ValueError(f"Unsupported problem file: {path}")
+
+def read_problem(path: str) -> ProblemInstance:
+    """
+    Reads a problem in any supported format, chosen by the file extension
+    (.mps, .fmps, .lp, .json, optionally .gz) or a binary problem directory.
+
+    Parameters:
+        path (str): The problem file or directory.
+
+    Returns:
+        ProblemInstance: The problem instance.
+    """
+    kind = _kind(path)
+    if kind == "binary":
+        from optimax.binary import read_binary
+        return read_binary(path)
+    if kind == "mps":
+        return read_mps(path)
+    if kind == "lp":
+        return read_lp(path)
+    with _open(path) as f:
+        return ProblemInstance.from_json(f.read())
+
+def write_problem(problem: ProblemInstance, path: str):
+    """
+    Writes a problem in the format given by the extension of path (see read_problem);
+    '.optimax' writes a binary problem directory.
+    """
+    kind = _kind(path)
+    if kind == "binary":
+        from optimax.binary import write_binary
+        write_binary(problem, path)
+    elif kind == "mps":
+        write_mps(problem, path)
+    elif kind == "lp":
+        write_lp(problem, path)
+    else:
+        from optimax.binary import to_json
+        with _open(path, "w") as f:
+            json.dump(to_json(problem), f)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert problems between MPS, CPLEX LP, JSON and the binary format.")
+    parser.add_argument("source", help="Problem file (.mps, .fmps, .lp, .json, optionally .gz) or binary directory.")
+    parser.add_argument("destination", help="File or .optimax directory to write; the extension picks the format.")
+    args = parser.parse_args(argv)
+    write_problem(read_problem(args.source), args.destination)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+Exact feasible regions of 2-variable problems.
+
+The region is the intersection of the constraint half-planes and the variable bounds, computed
+by sorting the half-planes by angle and sweeping them with a deque, in O(m log m) time and O(m)
+memory. Equality rows restrict the region to a line, where the inequalities leave an interval.
+Unbounded regions are closed by a large box; vertices created by the box are flagged, so plots
+can show where the region continues.
+"""
+from collections import deque
+
+import numpy as np
+
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE, SENSE_EQ
+
+# The box closing unbounded regions is this many times the scale of the problem data
+BOX_FACTOR = 1e6
+# Relative tolerance for containment and parallelism tests
+TOLERANCE = 1e-9
+
+class FeasibleRegion:
+    """
+    Feasible region of a 2-variable problem.
+
+    Attributes:
+        kind (str): 'polygon', 'segment', 'point' or 'empty'.
+        vertices (np.ndarray): (k, 2) corners in counter-clockwise order for a polygon, the two ends
+            of a segment, or the single point.
+        exact (np.ndarray): Boolean mask of the vertices that are true vertices of the region, as
+            opposed to corners cut by the bounding box.
+        box (float): Half-width of the box used to close unbounded regions.
+        scale (float): Magnitude of the problem data, used to size plots of unbounded or empty regions.
+        lines (tuple): (A, b) of the constraint rows as lines a . x = b, for plotting.
+    """
+
+    def __init__(self, kind: str, vertices: np.ndarray, exact: np.ndarray, box: float, scale: float, lines: tuple):
+        self.kind = kind
+        self.vertices = vertices
+        self.exact = exact
+        self.box = box
+        self.scale = scale
+        self.lines = lines
+
+    @property
+    def bounded(self) -> bool:
+        return bool(np.all(self.exact))
+
+    def axis_limits(self, points=None, margin: float = 0.1) -> tuple:
+        """
+        Chooses plot limits that show every vertex and the given points (e.g. the optimum). Sides on
+        which the region is unbounded get extra room, so the open end is visible.
+
+        Parameters:
+            points (array-like): Extra (x, y) points to include.
+            margin (float): Padding as a fraction of the larger span.
+
+        Returns:
+            tuple: ((xmin, xmax), (ymin, ymax)).
+        """
+        shown = [self.vertices[self.exact]]
+        if points is not None:
+            shown.append(np.asarray(points, dtype=float).reshape(-1, 2))
+        shown = np.vstack(shown)
+        if not len(shown):
+            # No vertex to anchor on: show the points of the constraint lines closest to the origin
+            A, b = self.lines
+            norms = np.einsum("ij,ij->i", A, A)
+            valid = norms > 0
+            shown = A[valid] * (b[valid] / norms[valid])[:, None]
+            if not len(shown):
+                shown = np.zeros((1, 2))
+        low, high = shown.min(axis=0), shown.max(axis=0)
+        span = max(float(np.max(high - low)), self.scale)
+        low, high = low - margin * span, high + margin * span
+
+        if self.kind != "empty" and not self.bounded:
+            # Box corners far out along an axis mean the region runs off in that direction
+            reach = 0.5 * self.box
+            open_low = self.vertices[~self.exact].min(axis=0) <= -reach
+            open_high = self.vertices[~self.exact].max(axis=0) >= reach
+            low = np.where(open_low, low - 0.5 * span, low)
+            high = np.where(open_high, high + 0.5 * span, high)
+        return (float(low[0]), float(high[0])), (float(low[1]), float(high[1]))
+
+    def clip(self, xlim: tuple, ylim: tuple) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The region's vertices clipped to the rectangle xlim x ylim (for a polygon, the
+                clipped polygon; for a segment, its visible part; possibly empty).
+        """
+        if self.kind == "polygon":
+            return clip_polygon(self.vertices, xlim, ylim)
+        if self.kind == "segment":
+            start, end = self.vertices
+            return clip_segment(start, end - start, 0.0, 1.0, xlim, ylim)
+        if self.kind == "point":
+            (x, y), = self.vertices
+            inside = xlim[0] <= x <= xlim[1] and ylim[0] <= y <= ylim[1]
+            return self.vertices if inside else np.zeros((0, 2))
+        return np.zeros((0, 2))
+
+def _rows(problem: ProblemInstance):
+    """
+    Returns the constraint rows and finite variable bounds as (A, b, senses), A dense (k, 2).
+    """
+    A = problem.A.toarray()
+    b = np.asarray(problem.b, dtype=float)
+    senses = np.asarray(problem.senses)
+    bound_rows, bound_b, bound_senses = [], [], []
+    for j, unit in enumerate(np.eye(2)):
+        low, high = float(problem.lower[j]), float(problem.upper[j])
+        if low == high:
+            bounds = [(low, SENSE_EQ)]
+        else:
+            bounds = [(value, sense) for value, sense in ((low, SENSE_GE), (high, SENSE_LE)) if np.isfinite(value)]
+        for value, sense in bounds:
+            bound_rows.append(unit)
+            bound_b.append(value)
+            bound_senses.append(sense)
+    if bound_rows:
+        A = np.vstack([A, bound_rows])
+        b = np.concatenate([b, bound_b])
+        senses = np.concatenate([senses, bound_senses])
+    return A, b, senses
+
+def _empty(box, scale, lines) -> FeasibleRegion:
+    return FeasibleRegion("empty", np.zeros((0, 2)), np.zeros(0, dtype=bool), box, scale, lines)
+
+def _intersect(a1, b1, a2, b2) -> np.ndarray:
+    det = a1[0] * a2[1] - a1[1] * a2[0]
+    return np.array([(b1 * a2[1] - b2 * a1[1]) / det, (a1[0] * b2 - a2[0] * b1) / det])
+
+def half_plane_intersection(A: np.ndarray, b: np.ndarray, eps: float) -> list:
+    """
+    Intersects the half-planes a . x <= b, whose intersection must be bounded.
+
+    Parameters:
+        A (np.ndarray): (k, 2) normals, each of unit length.
+        b (np.ndarray): (k,) offsets.
+        eps (float): Absolute tolerance of the containment test.
+
+    Returns:
+        list: Indices of the half-planes forming the boundary in counter-clockwise order; vertex i is
+            the intersection of boundary lines i and i + 1. Empty if the intersection is empty.
+    """
+    angles = np.arctan2(A[:, 1], A[:, 0])
+    angles[angles <= -np.pi + 1e-15] = np.pi
+    # For parallel half-planes only the most restrictive (smallest b) one matters
+    order = np.lexsort((b, angles))
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = np.diff(angles[order]) > 1e-12
+    order = order[keep]
+
+    # Plain floats: the sweep does a few operations per half-plane, where numpy calls cost more than the arithmetic
+    ax, ay, offsets = A[:, 0].tolist(), A[:, 1].tolist(), b.tolist()
+    lines = deque()
+    points = deque()
+    for k in order.tolist():
+        a0, a1, offset = ax[k], ay[k], offsets[k]
+        while len(lines) >= 2 and a0 * points[-1][0] + a1 * points[-1][1] - offset > eps:
+            lines.pop()
+            points.pop()
+        while len(lines) >= 2 and a0 * points[0][0] + a1 * points[0][1] - offset > eps:
+            lines.popleft()
+            points.popleft()
+        if lines:
+            back = lines[-1]
+            det = ax[back] * a1 - ay[back] * a0
+            if abs(det) < 1e-12:
+                # Opposite half-planes became neighbours: everything between them was cut away
+                return []
+            points.append(((offsets[back] * a1 - offset * ay[back]) / det, (ax[back] * offset - a0 * offsets[back]) / det))
+        lines.append(k)
+    first = lines[0] if lines else None
+    while len(lines) >= 3 and ax[first] * points[-1][0] + ay[first] * points[-1][1] - offsets[first] > eps:
+        lines.pop()
+        points.pop()
+    while len(lines) >= 3 and ax[lines[-1]] * points[0][0] + ay[lines[-1]] * points[0][1] - offsets[lines[-1]] > eps:
+        lines.popleft()
+        points.popleft()
+    if len(lines) < 3:
+        return []
+    # The sweep only tests half-planes against neighbouring vertices, so an empty intersection can
+    # leave a cycle of lines behind; keep the boundary only if its vertices satisfy every half-plane
+    boundary = np.array(lines)
+    vertices = _vertices(A, b, boundary)
+    # Edge i runs from vertex i - 1 to vertex i along line i, in the line's direction (-a_y, a_x)
+    edges = vertices - np.roll(vertices, 1, axis=0)
+    if np.all(edges[:, 1] * A[boundary, 0] - edges[:, 0] * A[boundary, 1] >= -eps):
+        # A proper convex polygon: each half-plane only needs testing at its support vertex, the
+        # one between the boundary lines whose angles bracket its own
+        support = np.searchsorted(angles[boundary], angles, side="right") - 1
+        violation = np.einsum("ij,ij->i", A, vertices[support]) - b
+    else:
+        violation = (A @ vertices.T - b[:, None]).max(axis=1)
+    return boundary.tolist() if violation.max() <= eps else []
+
+def _vertices(A: np.ndarray, b: np.ndarray, boundary: np.ndarray) -> np.ndarray:
+    # Vertex i is the intersection of boundary lines i and i + 1
+    i, j = boundary, np.roll(boundary, -1)
+    det = A[i, 0] * A[j, 1] - A[i, 1] * A[j, 0]
+    return np.column_stack([(b[i] * A[j, 1] - b[j] * A[i, 1]) / det, (A[i, 0] * b[j] - A[j, 0] * b[i]) / det])
+
+def feasible_region(problem: ProblemInstance) -> FeasibleRegion:
+    """
+    Computes the exact feasible region of a 2-variable problem, including its variable bounds.
+
+    Parameters:
+        problem (ProblemInstance): A problem with exactly two variables.
+
+    Returns:
+        FeasibleRegion: The region.
+
+    Raises:
+        ValueError: If the problem does not have two variables.
+    """
+    if problem.num_variables != 2:
+        raise ValueError(f"Unsupported feasible region: the problem has {problem.num_variables} variables, not 2")
+    A, b, senses = _rows(problem)
+    lines = (problem.A.toarray(), np.asarray(problem.b, dtype=float))
+
+    norms = np.hypot(A[:, 0], A[:, 1])
+    nonzero = norms > 0
+    scale = max(1.0, float(np.max(np.abs(b[nonzero]) / norms[nonzero], initial=0.0)))
+    box = BOX_FACTOR * scale
+    eps = TOLERANCE * scale
+
+    # Rows without coefficients are either always satisfied or make the problem infeasible
+    zero = ~nonzero
+    if np.any(zero & (((senses == SENSE_LE) & (b < -eps)) | ((senses == SENSE_GE) & (b > eps))
+                      | ((senses == SENSE_EQ) & (np.abs(b) > eps)))):
+        return _empty(box, scale, lines)
+    A, b, senses, norms = A[nonzero] / norms[nonzero, None], b[nonzero] / norms[nonzero], senses[nonzero], norms[nonzero]
+
+    # Every row as a . x <= b, with equalities kept apart
+    ge = senses == SENSE_GE
+    A[ge], b[ge] = -A[ge], -b[ge]
+    equal = senses == SENSE_EQ
+    A_in, b_in = A[~equal], b[~equal]
+    squeezed, infeasible = _opposite_pairs(A_in, b_in, eps)
+    if infeasible:
+        return _empty(box, scale, lines)
+    A_eq, b_eq = np.vstack([A[equal], A_in[squeezed]]), np.concatenate([b[equal], b_in[squeezed]])
+
+    # The closing box, marked so that its corners are not reported as vertices
+    A_box = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+    A_all = np.vstack([A_in, A_box])
+    b_all = np.concatenate([b_in, np.full(4, box)])
+    real = np.arange(len(b_all)) < len(b_in)
+
+    if len(b_eq):
+        return _on_lines(A_eq, b_eq, A_all, b_all, real, eps, box, scale, lines)
+
+    boundary = half_plane_intersection(A_all, b_all, eps)
+    if not boundary:
+        return _empty(box, scale, lines)
+    following = boundary[1:] + boundary[:1]
+    vertices = _vertices(A_all, b_all, np.array(boundary))
+    exact = real[boundary] & real[following]
+    area = 0.5 * abs(np.dot(vertices[:, 0], np.roll(vertices[:, 1], -1)) - np.dot(vertices[:, 1], np.roll(vertices[:, 0], -1)))
+    if area <= eps * scale:
+        # The inequalities pinch the region to a point or a segment: keep its two farthest vertices
+        distances = np.linalg.norm(vertices[:, None, :] - vertices[None, :, :], axis=2)
+        lo, hi = np.unravel_index(np.argmax(distances), distances.shape)
+        if distances[lo, hi] <= eps:
+            return FeasibleRegion("point", vertices[:1], np.ones(1, dtype=bool), box, scale, lines)
+        return FeasibleRegion("segment", vertices[[lo, hi]], exact[[lo, hi]], box, scale, lines)
+    return FeasibleRegion("polygon", vertices, exact, box, scale, lines)
+
+def _opposite_pairs(A: np.ndarray, b: np.ndarray, eps: float):
+    """
+    Finds opposite half-planes a . x <= b and -a . x <= b' whose strip has no width.
+
+    Returns:
+        tuple: (indices of half-planes that are really equalities, True if some strip has negative width).
+    """
+    if not len(b):
+        return np.zeros(0, dtype=np.int64), False
+    angles = np.arctan2(A[:, 1], A[:, 0])
+    order = np.lexsort((b, angles))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = np.diff(angles[order]) > 1e-12
+    # The most restrictive half-plane at each angle, and the one at the opposite angle if there is one
+    tightest = order[first]
+    tight_angles = angles[tightest]
+    opposite = np.where(tight_angles > 0, tight_angles - np.pi, tight_angles + np.pi)
+    position = np.clip(np.searchsorted(tight_angles, opposite - 1e-12), 0, len(tightest) - 1)
+    matched = np.abs(tight_angles[position] - opposite) <= 1e-12
+    width = b[tightest] + b[tightest[position]]
+    if np.any(matched & (width < -eps)):
+        return np.zeros(0, dtype=np.int64), True
+    return tightest[matched & (width <= eps)], False
+
+def _on_lines(A_eq, b_eq, A_in, b_in, real, eps, box, scale, lines) -> FeasibleRegion:
+    # All equalities must describe the same line, or meet in a single point
+    a0, b0 = A_eq[0], b_eq[0]
+    crossing = np.abs(A_eq[:, 0] * a0[1] - A_eq[:, 1] * a0[0]) > 1e-12
+    if np.any(crossing):
+        k = int(np.argmax(crossing))
+        point = _intersect(a0, b0, A_eq[k], b_eq[k])
+        if np.all(np.abs(A_eq @ point - b_eq) <= eps) and np.all(A_in @ point - b_in <= eps):
+            return FeasibleRegion("point", point[None, :], np.ones(1, dtype=bool), box, scale, lines)
+        return _empty(box, scale, lines)
+    # Parallel equalities: the same line only if their normalized offsets agree
+    same_side = A_eq @ a0
+    if np.any(np.abs(b_eq - same_side * b0) > eps):
+        return _empty(box, scale, lines)
+
+    # Points on the line are origin + t * direction; each inequality bounds t from one side
+    origin = a0 * b0
+    direction = np.array([-a0[1], a0[0]])
+    slope = A_in @ direction
+    room = b_in - A_in @ origin
+    flat = np.abs(slope) < 1e-12
+    if np.any(flat & (room < -eps)):
+        return _empty(box, scale, lines)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        limit = room / slope
+    upper = ~flat & (slope > 0)
+    lower = ~flat & (slope < 0)
+    hi = int(np.flatnonzero(upper)[np.argmin(limit[upper])])
+    lo = int(np.flatnonzero(lower)[np.argmax(limit[lower])])
+    t_low, t_high = limit[lo], limit[hi]
+    if t_low > t_high + eps:
+        return _empty(box, scale, lines)
+    if t_high - t_low <= eps:
+        point = origin + t_low * direction
+        return FeasibleRegion("point", point[None, :], np.ones(1, dtype=bool), box, scale, lines)
+    vertices = np.array([origin + t_low * direction, origin + t_high * direction])
+    return FeasibleRegion("segment", vertices, np.array([real[lo], real[hi]]), box, scale, lines)
+
+def clip_polygon(vertices: np.ndarray, xlim: tuple, ylim: tuple) -> np.ndarray:
+    """
+    Clips a convex polygon to a rectangle (Sutherland-Hodgman).
+
+    Returns:
+        np.ndarray: The clipped polygon's vertices, possibly empty.
+    """
+    polygon = [tuple(v) for v in vertices]
+    for axis, limit, keep_below in ((0, xlim[1], True), (0, xlim[0], False), (1, ylim[1], True), (1, ylim[0], False)):
+        if not polygon:
+            break
+        inside = (lambda p: p[axis] <= limit) if keep_below else (lambda p: p[axis] >= limit)
+        clipped = []
+        for k, current in enumerate(polygon):
+            previous = polygon[k - 1]
+            if inside(current):
+                if not inside(previous):
+                    clipped.append(_cut(previous, current, axis, limit))
+                clipped.append(current)
+            elif inside(previous):
+                clipped.append(_cut(previous, current, axis, limit))
+        polygon = clipped
+    return np.array(polygon).reshape(-1, 2)
+
+def _cut(p, q, axis, limit):
+    t = (limit - p[axis]) / (q[axis] - p[axis])
+    return (p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1]))
+
+def clip_segment(origin, direction, t_low, t_high, xlim: tuple, ylim: tuple) -> np.ndarray:
+    """
+    Clips origin + t * direction, t_low <= t <= t_high, to a rectangle (Liang-Barsky).
+    Infinite t limits describe rays and whole lines.
+
+    Returns:
+        np.ndarray: The two ends of the visible part, or an empty (0, 2) array.
+    """
+    origin, direction = np.asarray(origin, dtype=float), np.asarray(direction, dtype=float)
+    for axis, (low, high) in enumerate((xlim, ylim)):
+        if direction[axis] == 0:
+            if not low <= origin[axis] <= high:
+                return np.zeros((0, 2))
+            continue
+        t1, t2 = (low - origin[axis]) / direction[axis], (high - origin[axis]) / direction[axis]
+        t_low, t_high = max(t_low, min(t1, t2)), min(t_high, max(t1, t2))
+    if t_low > t_high:
+        return np.zeros((0, 2))
+    return np.array([origin + t_low * direction, origin + t_high * direction])
+
+def line_segment(a, rhs: float, xlim: tuple, ylim: tuple) -> np.ndarray:
+    """
+    Returns:
+        np.ndarray: The ends of the visible part of the line a . x = rhs, or an empty (0, 2) array.
+    """
+    a = np.asarray(a, dtype=float)
+    norm = a @ a
+    if norm == 0:
+        return np.zeros((0, 2))
+    return clip_segment(a * rhs / norm, np.array([-a[1], a[0]]), -np.inf, np.inf, xlim, ylim)
@@ -0,0 +1,476 @@
+"""
+Primal heuristics: ways to find good feasible solutions of integer problems quickly, before and
+during the Branch & Bound search.
+
+- Rounding rounds an LP solution and repairs it: while an all-integer row is violated, the
+  integer move that most reduces the total violation is applied, scoring every candidate of the
+  row at once on the columns of A. Continuous variables are then recomputed by an LP with the
+  integers fixed.
+- Diving repeatedly fixes the least fractional integer variable to its nearest integer and
+  re-solves the LP warm, trying the other side once when that makes it infeasible.
+- The feasibility pump alternates between rounding the LP point and finding the LP point closest
+  (in L1 distance, linearized around the current point) to the rounding, mixing in a vanishing
+  share of the objective. Stalls flip the integers furthest from their rounding, and cycles are
+  broken with random flips.
+
+Every operation works on the problem's arrays (CSR and CSC copies of A, the row and column
+bounds) and on a single HiGHS LP that the heuristics keep for themselves. The best solution found
+serves as a cutoff: the backends prune everything that cannot beat it.
+"""
+import math
+import time
+from typing import Optional
+
+import highspy
+import numpy as np
+from optimax.limits import relative_gap
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE
+
+INF = highspy.kHighsInf
+
+HEURISTICS = ("rounding", "diving", "feasibility_pump")
+INTEGRALITY_TOLERANCE = 1e-6
+# Row violations up to this much (relative to the row's bound) count as feasible
+FEASIBILITY_TOLERANCE = 1e-6
+# Repair moves per rounding, and feasibility pump iterations, at most
+REPAIR_MOVES = 200
+PUMP_ITERATIONS = 50
+# Share of the objective in the feasibility pump's LP, reduced by this factor every iteration
+PUMP_OBJECTIVE_DECAY = 0.9
+# Branch & Bound nodes between rounding calls and between dives during the search
+ROUNDING_FREQUENCY = 5
+DIVING_FREQUENCY = 50
+
+class PrimalHeuristics:
+    """
+    Runs primal heuristics on one integer problem and keeps the best solution they find.
+
+    Typical use:
+        heuristics = PrimalHeuristics(problem)
+        heuristics.run()             # before the search, from the LP relaxation
+        heuristics.cutoff            # objective the search must beat, in minimization form
+        heuristics.merge(solution)   # backend solution plus the incumbent and a 'heuristics' summary
+
+    BranchAndBound also calls at_node on the LP solutions of its nodes.
+
+    Attributes:
+        incumbent (np.ndarray): Best solution found, or None.
+        incumbent_value (float): Its objective in minimization form (inf when there is none).
+        nodes_pruned (int): Nodes the native Branch & Bound pruned while its incumbent came from here
+            (None when no native search ran).
+    """
+
+    def __init__(self, problem: ProblemInstance, methods=HEURISTICS, time_limit: Optional[float] = None, limits=None,
+                 seed: int = 0):
+        """
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            methods (iterable): Heuristics to run, among 'rounding', 'diving' and 'feasibility_pump'.
+            time_limit (float): Seconds the heuristics may spend in total; unlimited by default.
+            limits (SolveLimits): Optional limits of the solve. Their time limit also bounds the
+                heuristics, and every improving solution is reported to their on_incumbent.
+            seed (int): Seed of the feasibility pump's random flips.
+
+        Raises:
+            ValueError: If a heuristic is not supported.
+        """
+        for name in methods:
+            if name not in HEURISTICS:
+                raise ValueError(f"Unsupported heuristic: {name}")
+        self.problem = problem
+        self.methods = tuple(methods)
+        self.time_limit = time_limit
+        self.limits = limits
+        self._rng = np.random.default_rng(seed)
+        self._start = time.perf_counter()
+
+        self.maximize = problem.objective == "maximizar"
+        self._c = (-problem.c if self.maximize else problem.c).astype(float)
+        self._A = problem.A.tocsr()
+        self._AC = problem.A.tocsc()
+        self._row_lower = np.where(problem.senses == SENSE_LE, -np.inf, problem.b).astype(float)
+        self._row_upper = np.where(problem.senses == SENSE_GE, np.inf, problem.b).astype(float)
+        self._row_tolerance = FEASIBILITY_TOLERANCE * np.maximum(1.0, np.abs(problem.b))
+        self._lower = problem.lower.astype(float)
+        self._upper = problem.upper.astype(float)
+        self._integer = np.flatnonzero(problem.integrality)
+        self._integer_lower = np.ceil(self._lower[self._integer] - INTEGRALITY_TOLERANCE)
+        self._integer_upper = np.floor(self._upper[self._integer] + INTEGRALITY_TOLERANCE)
+        self._mixed = len(self._integer) < problem.num_variables
+        # Repair only moves integers, so it only fixes rows without continuous variables
+        self._repairable = np.ones(problem.num_constraints, dtype=bool) if not self._mixed else \
+            (abs(self._A) @ (~problem.integrality).astype(float)) == 0
+        self._columns = np.arange(problem.num_variables, dtype=np.int32)
+        self._highs = None
+
+        self.incumbent = None
+        self.incumbent_value = math.inf
+        self.nodes_pruned = None
+        self._external_cutoff = math.inf
+        self._found_by = None
+        self._found_at = None
+        self._time = 0.0
+        self._calls = {name: 0 for name in self.methods}
+        self._improvements = {name: 0 for name in self.methods}
+
+    # LP relaxation
+
+    def _lp(self):
+        if self._highs is None:
+            problem = self.problem
+            A = self._AC
+            highs = highspy.Highs()
+            highs.silent()
+            highs.setOptionValue("presolve", "off")
+            lp = highspy.HighsLp()
+            lp.num_col_ = problem.num_variables
+            lp.num_row_ = problem.num_constraints
+            lp.col_cost_ = self._c
+            lp.col_lower_ = np.maximum(self._lower, -INF)
+            lp.col_upper_ = np.minimum(self._upper, INF)
+            lp.row_lower_ = np.maximum(self._row_lower, -INF)
+            lp.row_upper_ = np.minimum(self._row_upper, INF)
+            lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+            lp.a_matrix_.start_ = A.indptr.astype(np.int32)
+            lp.a_matrix_.index_ = A.indices.astype(np.int32)
+            lp.a_matrix_.value_ = A.data.astype(float)
+            highs.passModel(lp)
+            self._highs = highs
+        return self._highs
+
+    def _solve_lp(self, lower: np.ndarray, upper: np.ndarray, cost: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        # Optimal x of the LP with these bounds (and costs), warm-started from the previous solve; None if infeasible
+        highs = self._lp()
+        n = len(self._columns)
+        highs.changeColsBounds(n, self._columns, np.maximum(lower, -INF), np.minimum(upper, INF))
+        if cost is not None:
+            highs.changeColsCost(n, self._columns, cost)
+        highs.run()
+        if highs.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+            return None
+        return np.asarray(highs.getSolution().col_value)
+
+    # Feasibility and incumbents
+
+    @property
+    def cutoff(self) -> float:
+        """
+        Returns:
+            float: Objective (minimization form) a solution must beat to be of any use: the best of
+                the incumbent and the cutoff given to at_node.
+        """
+        return min(self.incumbent_value, self._external_cutoff)
+
+    def _violation(self, activity: np.ndarray, rows=slice(None)) -> np.ndarray:
+        return np.maximum(np.maximum(self._row_lower[rows] - activity, activity - self._row_upper[rows]), 0.0)
+
+    def is_feasible(self, x: np.ndarray) -> bool:
+        """
+        Returns:
+            bool: Whether x satisfies every row, bound and integrality requirement within tolerance.
+        """
+        if np.any(x < self._lower - FEASIBILITY_TOLERANCE) or np.any(x > self._upper + FEASIBILITY_TOLERANCE):
+            return False
+        values = x[self._integer]
+        if np.any(np.abs(values - np.round(values)) > INTEGRALITY_TOLERANCE):
+            return False
+        return bool(np.all(self._violation(self._A @ x) <= self._row_tolerance))
+
+    def _offer(self, x: np.ndarray, method: str) -> bool:
+        value = float(self._c @ x)
+        if value >= self.cutoff - 1e-9 * max(1.0, abs(value)) or not self.is_feasible(x):
+            return False
+        self.incumbent = x.copy()
+        self.incumbent_value = value
+        self._found_by = method
+        self._found_at = time.perf_counter() - self._start
+        self._improvements[method] += 1
+        if self.limits is not None:
+            self.limits.report(self._start, -value if self.maximize else value, variables=self.incumbent.tolist())
+        return True
+
+    def _complete(self, x: np.ndarray) -> Optional[np.ndarray]:
+        # Fixes the integers of x at their rounded values and recomputes the continuous variables
+        x = x.copy()
+        x[self._integer] = np.round(x[self._integer])
+        if not self._mixed:
+            return x
+        lower, upper = self._lower.copy(), self._upper.copy()
+        lower[self._integer] = upper[self._integer] = x[self._integer]
+        completed = self._solve_lp(lower, upper)
+        if completed is None:
+            return None
+        completed[self._integer] = x[self._integer]
+        return completed
+
+    def _deadline(self) -> float:
+        deadline = math.inf
+        if self.time_limit is not None:
+            deadline = time.perf_counter() + max(self.time_limit - self._time, 0.0)
+        if self.limits is not None and self.limits.time_limit is not None:
+            deadline = min(deadline, self._start + self.limits.time_limit)
+        return deadline
+
+    # Heuristics
+
+    def _repair(self, x: np.ndarray, deadline: float) -> Optional[np.ndarray]:
+        A, AC = self._A, self._AC
+        activity = A @ x
+        violation = np.where(self._repairable, self._violation(activity), 0.0)
+        for _ in range(REPAIR_MOVES):
+            excess = violation - self._row_tolerance
+            i = int(np.argmax(excess))
+            if excess[i] <= 0:
+                return x
+            if time.perf_counter() > deadline:
+                return None
+            start, end = A.indptr[i], A.indptr[i + 1]
+            columns, coefficients = A.indices[start:end], A.data[start:end]
+            # Integer moves of the row's variables toward satisfying it, as large as the row needs
+            raise_activity = activity[i] < self._row_lower[i]
+            direction = np.sign(coefficients) * (1.0 if raise_activity else -1.0)
+            room = np.where(direction > 0, self._upper[columns] - x[columns], x[columns] - self._lower[columns])
+            size = np.minimum(np.ceil(violation[i] / np.abs(coefficients) - INTEGRALITY_TOLERANCE), np.floor(room))
+            movable = (size >= 1) & self.problem.integrality[columns]
+            if not movable.any():
+                return None
+            columns, step = columns[movable], (direction * size)[movable]
+            # Total violation change of every move, summed over the rows each column touches
+            block = AC[:, columns]
+            owner = np.repeat(np.arange(len(columns)), np.diff(block.indptr))
+            rows = block.indices
+            moved = self._violation(activity[rows] + block.data * step[owner], rows)
+            change = np.where(self._repairable[rows], moved - violation[rows], 0.0)
+            delta = np.bincount(owner, change, minlength=len(columns))
+            # Among the moves that reduce the violation most, the cheapest for the objective
+            best = np.lexsort((self._c[columns] * step, delta))[0]
+            if delta[best] >= -FEASIBILITY_TOLERANCE:
+                return None
+            j = columns[best]
+            x[j] += step[best]
+            start, end = AC.indptr[j], AC.indptr[j + 1]
+            touched = AC.indices[start:end]
+            activity[touched] += AC.data[start:end] * step[best]
+            violation[touched] = np.where(self._repairable[touched], self._violation(activity[touched], touched), 0.0)
+        return None
+
+    def round(self, x: np.ndarray) -> bool:
+        """
+        Rounds the integer variables of an LP solution, repairs the violated rows and completes the
+        continuous variables.
+
+        Returns:
+            bool: Whether this produced a new incumbent.
+        """
+        if "rounding" not in self.methods:
+            return False
+        self._calls["rounding"] += 1
+        rounded = x.copy()
+        rounded[self._integer] = np.clip(np.round(x[self._integer]), self._integer_lower, self._integer_upper)
+        repaired = self._repair(rounded, self._deadline())
+        if repaired is None:
+            return False
+        completed = self._complete(repaired)
+        return completed is not None and self._offer(completed, "rounding")
+
+    def dive(self, x: np.ndarray, lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None) -> bool:
+        """
+        Fractional diving from an LP solution x, optimal for the given bounds (the problem's by default).
+
+        Returns:
+            bool: Whether this produced a new incumbent.
+        """
+        if "diving" not in self.methods:
+            return False
+        self._calls["diving"] += 1
+        deadline = self._deadline()
+        lower = self._lower.copy() if lower is None else np.asarray(lower, dtype=float).copy()
+        upper = self._upper.copy() if upper is None else np.asarray(upper, dtype=float).copy()
+        for _ in range(len(self._integer) + 1):
+            values = x[self._integer]
+            fraction = np.abs(values - np.round(values))
+            fractional = fraction > INTEGRALITY_TOLERANCE
+            if not fractional.any():
+                completed = self._complete(x)
+                return completed is not None and self._offer(completed, "diving")
+            if time.perf_counter() > deadline or self._c @ x >= self.cutoff:
+                return False
+            k = int(np.argmin(np.where(fractional, fraction, np.inf)))
+            j = self._integer[k]
+            down = x[j] - math.floor(x[j]) < 0.5
+            for side in (down, not down):
+                child_lower, child_upper = lower.copy(), upper.copy()
+                child_lower[j] = child_upper[j] = math.floor(x[j]) if side else math.ceil(x[j])
+                child = self._solve_lp(child_lower, child_upper)
+                if child is not None:
+                    break
+            else:
+                return False
+            lower, upper, x = child_lower, child_upper, child
+        return False
+
+    def pump(self, x: np.ndarray) -> bool:
+        """
+        Feasibility pump from an LP solution x.
+
+        Returns:
+            bool: Whether this produced a new incumbent.
+        """
+        if "feasibility_pump" not in self.methods or not len(self._integer):
+            return False
+        self._calls["feasibility_pump"] += 1
+        deadline = self._deadline()
+        integer = self._integer
+        norm = float(np.linalg.norm(self._c))
+        weight = 1.0
+        target = np.clip(np.round(x[integer]), self._integer_lower, self._integer_upper)
+        seen = set()
+        try:
+            for _ in range(PUMP_ITERATIONS):
+                point = x.copy()
+                point[integer] = target
+                completed = self._complete(point)
+                if completed is not None and self.is_feasible(completed):
+                    return self._offer(completed, "feasibility_pump")
+                if time.perf_counter() > deadline:
+                    return False
+                # L1 distance to the rounding: exact at the bounds, linearized around x elsewhere
+                distance = np.where(target <= self._integer_lower, 1.0,
+                                    np.where(target >= self._integer_upper, -1.0, np.sign(x[integer] - target)))
+                cost = np.zeros(len(x))
+                cost[integer] = distance
+                if norm > 0:
+                    cost = (1 - weight) * cost + weight * math.sqrt(len(integer)) * self._c / norm
+                weight *= PUMP_OBJECTIVE_DECAY
+                x = self._solve_lp(self._lower, self._upper, cost)
+                if x is None:
+                    return False
+                values = x[integer]
+                if np.all(np.abs(values - np.round(values)) <= INTEGRALITY_TOLERANCE):
+                    completed = self._complete(x)
+                    return completed is not None and self._offer(completed, "feasibility_pump")
+                rounded = np.clip(np.round(values), self._integer_lower, self._integer_upper)
+                score = np.abs(values - rounded)
+                if np.array_equal(rounded, target):
+                    # Stalled: flip the integers furthest from their rounding toward the LP point
+                    flips = int(self._rng.integers(len(integer) // 20 + 1, len(integer) // 10 + 2))
+                    furthest = np.argsort(-score)[:flips]
+                    furthest = furthest[score[furthest] > INTEGRALITY_TOLERANCE]
+                    rounded[furthest] += np.sign(values[furthest] - rounded[furthest])
+                if rounded.tobytes() in seen:
+                    # Cycling: random flips, more likely for integers far from their rounding
+                    flip = score + np.maximum(self._rng.uniform(-0.3, 0.7, len(integer)), 0) > 0.5
+                    rounded[flip] += np.where(values[flip] >= rounded[flip], 1.0, -1.0)
+                target = np.clip(rounded, self._integer_lower, self._integer_upper)
+                seen.add(target.tobytes())
+            return False
+        finally:
+            self._lp().changeColsCost(len(self._columns), self._columns, self._c)
+
+    # Stages
+
+    def run(self, x: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Runs the heuristics before the search: rounding and diving, then the feasibility pump if
+        they found nothing.
+
+        Parameters:
+            x (np.ndarray): Optimal solution of the LP relaxation; solved here when omitted.
+
+        Returns:
+            np.ndarray: The incumbent, or None if no feasible solution was found.
+        """
+        start = time.perf_counter()
+        try:
+            if x is None:
+                x = self._solve_lp(self._lower, self._upper)
+                if x is None:
+                    return None
+            self.round(x)
+            self.dive(x)
+            if self.incumbent is None:
+                self.pump(x)
+        finally:
+            self._time += time.perf_counter() - start
+        return self.incumbent
+
+    def at_node(self, x: np.ndarray, lower: np.ndarray, upper: np.ndarray, nodes: int, cutoff: float = math.inf) -> bool:
+        """
+        Runs the heuristics on the fractional LP solution of a Branch & Bound node: the whole
+        stage at the root, then rounding every ROUNDING_FREQUENCY nodes and a dive within the
+        node's bounds every DIVING_FREQUENCY nodes.
+
+        Parameters:
+            x (np.ndarray): The node's LP solution.
+            lower (np.ndarray): The node's lower bounds.
+            upper (np.ndarray): The node's upper bounds.
+            nodes (int): Nodes processed so far, this one included.
+            cutoff (float): Objective (minimization form) of the search's own incumbent.
+
+        Returns:
+            bool: Whether this produced a new incumbent.
+        """
+        self._external_cutoff = min(self._external_cutoff, cutoff)
+        if nodes == 1:
+            return self.run(x) is not None and self.incumbent_value < cutoff
+        if self.time_limit is not None and self._time >= self.time_limit:
+            return False
+        start = time.perf_counter()
+        improved = False
+        try:
+            if nodes % ROUNDING_FREQUENCY == 0:
+                improved = self.round(x)
+            if nodes % DIVING_FREQUENCY == 0:
+                improved = self.dive(x, lower, upper) or improved
+        finally:
+            self._time += time.perf_counter() - start
+        return improved
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: 'objective_value' and 'found_by' of the best heuristic solution (None when there is
+                none), 'found_at' (seconds after the heuristics started), 'time' spent in them, and
+                per-heuristic 'calls' and 'improvements', and 'nodes_pruned' (see the attribute).
+        """
+        value = None
+        if self.incumbent is not None:
+            value = -self.incumbent_value if self.maximize else self.incumbent_value
+        return {
+            "objective_value": value,
+            "found_by": self._found_by,
+            "found_at": self._found_at,
+            "time": self._time,
+            "calls": dict(self._calls),
+            "improvements": dict(self._improvements),
+            "nodes_pruned": self.nodes_pruned,
+        }
+
+    def merge(self, solution: dict) -> dict:
+        """
+        Combines a backend's solution, found with cutoff() as its cutoff, with the heuristic incumbent.
+
+        A backend told to beat the incumbent may report 'Infeasible' (nothing better exists: the
+        incumbent is optimal) or stop on a limit with nothing better; the incumbent is returned then.
+
+        Returns:
+            dict: The better of both solutions, with the 'heuristics' summary.
+        """
+        result = dict(solution, heuristics=self.summary())
+        if self.incumbent is None:
+            return result
+        value = -self.incumbent_value if self.maximize else self.incumbent_value
+        if "variables" in solution:
+            worse = solution["optimal_value"] < value if self.maximize else solution["optimal_value"] > value
+            if not worse:
+                return result
+        result["variables"] = self.incumbent.tolist()
+        result["optimal_value"] = value
+        if solution["status"] in ("Infeasible", "Optimal"):
+            result["status"] = "Optimal"
+            result["bound"], result["gap"] = value, 0.0
+        else:
+            result["status"] = "Feasible"
+            if result.get("bound") is not None:
+                result["gap"] = relative_gap(value, result["bound"])
+        return result
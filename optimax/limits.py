@@ -0,0 +1,153 @@
+import math
+import re
+import time
+from typing import Callable, Optional
+
+# CBC log lines: improving solutions and search bounds are printed in minimization form
+CBC_INCUMBENT = re.compile(r"Integer solution of (\S+) found .*\((\S+) seconds\)")
+CBC_BEST_POSSIBLE = re.compile(r"best possible (-?[0-9.eE+-]+)")
+CBC_INFINITY = 1e50
+CBC_LIMITS = {"Stopped on time limit": "time_limit", "Stopped on node limit": "node_limit"}
+
+class SolveLimits:
+    """
+    Stopping rules for integer solves, understood by every ILP backend.
+
+    A solve stopped by the time or node limit returns its best incumbent with status 'Feasible'
+    (or 'Not Solved' if it found none) and names the limit under 'limit'. Gap tolerances instead
+    let the search finish early: it reports 'Optimal' once the incumbent is provably within them.
+    ILP solutions carry 'bound' (the best bound of the search) and 'gap' whenever the backend knows them.
+
+    Attributes:
+        time_limit (float): Wall-clock seconds for the solve.
+        gap_rel (float): Relative gap |incumbent - bound| / |incumbent| accepted as optimal.
+        gap_abs (float): Absolute gap |incumbent - bound| accepted as optimal.
+        node_limit (int): Maximum Branch & Bound nodes.
+        on_incumbent (callable): Called as on_incumbent(event) for every improving solution while the
+            search runs, from the thread that called Solver.solve. The event holds 'objective_value',
+            'bound' and 'gap' (None when unknown), 'time' (seconds since the solve started) and
+            'variables' (None for PuLP, which only reports values).
+    """
+
+    def __init__(self, time_limit: Optional[float] = None, gap_rel: Optional[float] = None, gap_abs: Optional[float] = None,
+                 node_limit: Optional[int] = None, on_incumbent: Optional[Callable[[dict], None]] = None):
+        for name, value in (("time_limit", time_limit), ("gap_rel", gap_rel), ("gap_abs", gap_abs), ("node_limit", node_limit)):
+            if value is not None and not value >= 0:
+                raise ValueError(f"Unsupported {name}: {value}")
+        self.time_limit = time_limit
+        self.gap_rel = gap_rel
+        self.gap_abs = gap_abs
+        self.node_limit = node_limit
+        self.on_incumbent = on_incumbent
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns:
+            bool: Whether a time, node or gap limit is set, so that an 'Optimal' answer may be inexact.
+        """
+        return any(value is not None for value in (self.time_limit, self.gap_rel, self.gap_abs, self.node_limit))
+
+    def gap_tolerance(self, incumbent: float) -> float:
+        """
+        Returns:
+            float: The largest |incumbent - bound| accepted as optimal for this incumbent.
+        """
+        tolerance = self.gap_abs or 0.0
+        if self.gap_rel is not None and math.isfinite(incumbent):
+            tolerance = max(tolerance, self.gap_rel * abs(incumbent))
+        return tolerance
+
+    def reached(self, start: float, nodes: int) -> Optional[str]:
+        """
+        Returns:
+            str: 'time_limit' or 'node_limit' when that limit is reached, else None.
+        """
+        if self.time_limit is not None and time.perf_counter() - start >= self.time_limit:
+            return "time_limit"
+        if self.node_limit is not None and nodes >= self.node_limit:
+            return "node_limit"
+        return None
+
+    def report(self, start: float, objective_value: float, bound: Optional[float] = None, variables=None,
+               elapsed: Optional[float] = None):
+        """
+        Sends an improving solution to on_incumbent, if set. Values are in the problem's own objective sense.
+        'elapsed' overrides the time since start when the backend reports when the solution was found.
+        """
+        if self.on_incumbent is None:
+            return
+        bound = bound if bound is not None and math.isfinite(bound) else None
+        self.on_incumbent({
+            "objective_value": objective_value,
+            "bound": bound,
+            "gap": relative_gap(objective_value, bound),
+            "time": time.perf_counter() - start if elapsed is None else elapsed,
+            "variables": None if variables is None else list(variables),
+        })
+
+class CbcLog:
+    """
+    Follows the log CBC writes through PuLP's logPath: reports improving solutions to the limits'
+    on_incumbent as their lines arrive and collects the result summary at the end.
+
+    CBC buffers its output, so lines may arrive in bursts; each event still carries the time CBC
+    printed for it.
+
+    Attributes:
+        bound (float): Best bound of the search in the problem's own sense, once known.
+        nodes (int): Enumerated nodes, from the final summary.
+        limit (str): 'time_limit' or 'node_limit' when CBC stopped on that limit.
+    """
+
+    def __init__(self, maximize: bool, limits: SolveLimits, start: float):
+        self.maximize = maximize
+        self.limits = limits
+        self.start = start
+        self.bound = None
+        self.nodes = None
+        self.limit = None
+        self._partial = ""
+
+    def _user_sense(self, text: str) -> Optional[float]:
+        value = float(text)
+        if abs(value) >= CBC_INFINITY:
+            return None
+        return -value if self.maximize else value
+
+    def feed(self, text: str):
+        """
+        Parses the complete lines of a chunk of log text; an unfinished last line waits for the next chunk.
+        """
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            match = CBC_BEST_POSSIBLE.search(line)
+            if match:
+                self.bound = self._user_sense(match.group(1))
+            match = CBC_INCUMBENT.search(line)
+            if match:
+                self.limits.report(self.start, self._user_sense(match.group(1)), self.bound, elapsed=float(match.group(2)))
+            elif line.startswith("Result - "):
+                self.limit = next((name for text, name in CBC_LIMITS.items() if text in line), None)
+            elif line.startswith(("Upper bound:", "Lower bound:")):
+                # The summary is in the problem's own sense
+                self.bound = float(line.split(":")[1])
+            elif line.startswith("Enumerated nodes:"):
+                self.nodes = int(line.split(":")[1])
+
+    def close(self):
+        self.feed("\n")
+
+def relative_gap(incumbent: Optional[float], bound: Optional[float]) -> Optional[float]:
+    """
+    Returns:
+        float: |incumbent - bound| / |incumbent| as HiGHS and CBC define it, 0 when they are equal,
+            or None when either is unknown or the gap is infinite.
+    """
+    if incumbent is None or bound is None or not math.isfinite(incumbent) or not math.isfinite(bound):
+        return None
+    difference = abs(incumbent - bound)
+    if difference == 0:
+        return 0.0
+    return difference / abs(incumbent) if incumbent != 0 else None
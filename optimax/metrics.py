@@ -0,0 +1,132 @@
+import contextlib
+import threading
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+
+# Shared no-op context returned by phase() when metrics are disabled
+_DISABLED = contextlib.nullcontext()
+
+def phase(metrics: Optional["Metrics"], name: str, track_memory: bool = True):
+    """
+    Times a block of code when metrics are enabled; does nothing (and costs almost nothing) otherwise.
+
+        with phase(metrics, "solve.backend"):
+            ...
+
+    Parameters:
+        metrics (Metrics): The collector, or None when metrics are disabled.
+        name (str): Phase name; nested phases are usually named 'outer.inner'.
+        track_memory (bool): Set to False for phases that mostly wait on other threads, which
+            tracemalloc would slow down without measuring anything useful.
+    """
+    return _DISABLED if metrics is None else metrics.phase(name, track_memory)
+
+class _PhaseTimer:
+    def __init__(self, metrics: "Metrics", name: str, track_memory: bool):
+        self.metrics = metrics
+        self.name = name
+        self.track_memory = track_memory
+        self.memory = False
+        self.start_memory = 0
+        self.max_memory = 0
+
+    def __enter__(self):
+        metrics = self.metrics
+        # Memory is traced on the collector's own thread only; tracemalloc has a single global peak
+        self.memory = self.track_memory and metrics.track_memory and threading.get_ident() == metrics._owner
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                metrics._started_tracing = True
+            current, peak = tracemalloc.get_traced_memory()
+            # The peak is reset for this phase, so the enclosing phases keep what they reached so far
+            for outer in metrics._stack:
+                outer.max_memory = max(outer.max_memory, peak)
+            tracemalloc.reset_peak()
+            self.start_memory = self.max_memory = current
+            metrics._stack.append(self)
+        self.start_cpu = time.process_time()
+        self.start_wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall = time.perf_counter() - self.start_wall
+        cpu = time.process_time() - self.start_cpu
+        peak_kb = None
+        metrics = self.metrics
+        if self.memory:
+            metrics._stack.pop()
+            self.max_memory = max(self.max_memory, tracemalloc.get_traced_memory()[1])
+            for outer in metrics._stack:
+                outer.max_memory = max(outer.max_memory, self.max_memory)
+            tracemalloc.reset_peak()
+            peak_kb = (self.max_memory - self.start_memory) / 1024
+            if not metrics._stack and metrics._started_tracing:
+                tracemalloc.stop()
+                metrics._started_tracing = False
+        metrics._add_phase(self.name, wall, cpu, peak_kb)
+        return False
+
+class Metrics:
+    """
+    Collects per-phase timings and solve statistics for one run.
+
+    Phases record wall time, CPU time (of the whole process, so it includes solver threads) and,
+    with track_memory, the tracemalloc peak above the memory in use when the phase started.
+    Phases that run several times accumulate. Other sections hold plain values: problem
+    dimensions, the selector's decision, backend iterations and cache or presolve statistics.
+
+    Hooks are called as hook(event, name, data) for every finished phase (event 'phase') and every
+    recorded section (event 'record'), so the data can be forwarded to an external collector.
+    """
+
+    def __init__(self, track_memory: bool = True, hooks: Optional[List[Callable]] = None):
+        """
+        Parameters:
+            track_memory (bool): Measure peak memory with tracemalloc (slows down Python-heavy phases).
+            hooks (list): Callables invoked as hook(event, name, data).
+        """
+        self.track_memory = track_memory
+        self.hooks = list(hooks or [])
+        self.phases = {}
+        self.sections = {}
+        self._lock = threading.Lock()
+        self._owner = threading.get_ident()
+        self._stack = []
+        self._started_tracing = False
+
+    def add_hook(self, hook: Callable):
+        self.hooks.append(hook)
+
+    def phase(self, name: str, track_memory: bool = True) -> _PhaseTimer:
+        return _PhaseTimer(self, name, track_memory)
+
+    def _add_phase(self, name: str, wall: float, cpu: float, peak_kb: Optional[float]):
+        with self._lock:
+            entry = self.phases.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0, "calls": 0})
+            entry["wall_s"] += wall
+            entry["cpu_s"] += cpu
+            entry["calls"] += 1
+            if peak_kb is not None:
+                entry["peak_kb"] = max(entry.get("peak_kb", 0.0), round(peak_kb, 1))
+        self._emit("phase", name, {"wall_s": wall, "cpu_s": cpu, "peak_kb": peak_kb})
+
+    def record(self, section: str, values: dict):
+        with self._lock:
+            self.sections.setdefault(section, {}).update(values)
+        self._emit("record", section, values)
+
+    def _emit(self, event: str, name: str, data: dict):
+        for hook in self.hooks:
+            hook(event, name, data)
+
+    def as_dict(self) -> dict:
+        """
+        Returns:
+            dict: {'phases': {name: {'wall_s', 'cpu_s', 'calls', 'peak_kb'}}, plus one key per recorded section}.
+        """
+        with self._lock:
+            result = {"phases": {name: dict(entry) for name, entry in self.phases.items()}}
+            result.update({section: dict(values) for section, values in self.sections.items()})
+        return result
@@ -1,6 +1,16 @@
 import json
 from typing import Dict, List
 
+import numpy as np
+import scipy.sparse as sp
+
+# Integer codes used for the constraint sense array
+SENSE_LE = 0
+SENSE_GE = 1
+SENSE_EQ = 2
+SENSE_CODES = {"<=": SENSE_LE, ">=": SENSE_GE, "==": SENSE_EQ}
+SENSE_SYMBOLS = {code: sign for sign, code in SENSE_CODES.items()}
+
 class ProblemInstance:
     def __init__(self, objective: str, function_objective: List[float], constraints: List[Dict], variables_integer: List[bool]):
         self.objective = objective.lower()
@@ -8,12 +18,161 @@ class ProblemInstance:
         self.constraints = constraints
         self.variables_integer = variables_integer
         self.validate()
+        self._build_arrays()
+        # Variable bounds; the JSON format always means x >= 0
+        self.lower = np.zeros(self.num_variables)
+        self.upper = np.full(self.num_variables, np.inf)
 
     def validate(self):
         assert self.objective in ["maximizar", "minimizar"], "Objective must be 'maximizar' or 'minimizar'"
         assert len(self.function_objective) == len(self.variables_integer), "Mismatch between objective function and variable count"
+        num_vars = len(self.function_objective)
         for constraint in self.constraints:
-            assert len(constraint["coeficientes"]) == len(self.function_objective), "Constraint coefficient count mismatch"
+            if "indices" in constraint:
+                # Sparse row: 'coeficientes' holds only the nonzeros, aligned with 'indices'
+                assert len(constraint["indices"]) == len(constraint["coeficientes"]), "Constraint indices/coefficients length mismatch"
+                assert all(0 <= j < num_vars for j in constraint["indices"]), "Constraint index out of range"
+            else:
+                assert len(constraint["coeficientes"]) == num_vars, "Constraint coefficient count mismatch"
+
+    def _build_arrays(self):
+        """
+        Builds the array representation of the problem once, so that the selector,
+        solver and visualizer can work on whole blocks of rows at a time.
+
+        Rows may be given densely ('coeficientes' with one entry per variable) or
+        sparsely ('indices' plus the matching nonzero 'coeficientes'); either way
+        only the nonzeros are stored.
+
+        Attributes set:
+            c (np.ndarray): Objective coefficients, shape (n,).
+            A (scipy.sparse.csr_matrix): Constraint coefficient matrix, shape (m, n).
+            b (np.ndarray): Right-hand side vector, shape (m,).
+            senses (np.ndarray): Sense code per row (SENSE_LE, SENSE_GE or SENSE_EQ), shape (m,).
+            integrality (np.ndarray): Boolean mask of integer variables, shape (n,).
+        """
+        num_vars = len(self.function_objective)
+        num_rows = len(self.constraints)
+        self.c = np.asarray(self.function_objective, dtype=float)
+        self.integrality = np.asarray(self.variables_integer, dtype=bool).reshape(num_vars)
+        
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        row_indices = []
+        row_values = []
+        for i, cons in enumerate(self.constraints):
+            values = np.asarray(cons["coeficientes"], dtype=float)
+            if "indices" in cons:
+                indices = np.asarray(cons["indices"], dtype=np.int64)
+            else:
+                indices = np.flatnonzero(values)
+                values = values[indices]
+            row_indices.append(indices)
+            row_values.append(values)
+            indptr[i + 1] = indptr[i] + len(indices)
+        indices = np.concatenate(row_indices) if num_rows else np.zeros(0, dtype=np.int64)
+        data = np.concatenate(row_values) if num_rows else np.zeros(0)
+        self.A = sp.csr_matrix((data, indices, indptr), shape=(num_rows, num_vars))
+        self.A.sum_duplicates()
+        self.A.eliminate_zeros()
+        
+        self.b = np.asarray([cons["valor"] for cons in self.constraints], dtype=float)
+        try:
+            self.senses = np.fromiter((SENSE_CODES[cons["signo"]] for cons in self.constraints), dtype=np.int8, count=num_rows)
+        except KeyError as e:
+            raise ValueError(f"Unsupported constraint sign: {e.args[0]}")
+
+    @classmethod
+    def from_arrays(cls, objective: str, c, A, b, senses, integrality, lower=None, upper=None):
+        """
+        Builds a problem directly from its array representation, without going through constraint dicts.
+        Used by presolve, decomposition and the binary/MPS readers.
+
+        Parameters:
+            objective (str): 'maximizar' or 'minimizar'.
+            c (array-like): Objective coefficients, shape (n,).
+            A (matrix): Constraint matrix, dense or sparse, shape (m, n).
+            b (array-like): Right-hand side, shape (m,).
+            senses (array-like): Sense codes (SENSE_LE, SENSE_GE, SENSE_EQ), shape (m,).
+            integrality (array-like): Boolean mask of integer variables, shape (n,).
+            lower (array-like): Variable lower bounds (default 0).
+            upper (array-like): Variable upper bounds (default inf).
+
+        Returns:
+            ProblemInstance: The problem instance.
+        """
+        problem = cls.__new__(cls)
+        problem.objective = objective.lower()
+        problem.c = np.asarray(c, dtype=float)
+        problem.A = A if sp.isspmatrix_csr(A) else sp.csr_matrix(A, dtype=float)
+        problem.b = np.asarray(b, dtype=float)
+        problem.senses = np.asarray(senses, dtype=np.int8)
+        problem.integrality = np.asarray(integrality, dtype=bool)
+        num_vars = len(problem.c)
+        problem.lower = np.zeros(num_vars) if lower is None else np.asarray(lower, dtype=float)
+        problem.upper = np.full(num_vars, np.inf) if upper is None else np.asarray(upper, dtype=float)
+        problem._function_objective = None
+        problem._variables_integer = None
+        problem._constraints = None
+
+        assert problem.objective in ["maximizar", "minimizar"], "Objective must be 'maximizar' or 'minimizar'"
+        assert problem.A.shape == (len(problem.b), num_vars), "Constraint matrix shape mismatch"
+        assert len(problem.senses) == len(problem.b), "Constraint sense count mismatch"
+        assert len(problem.integrality) == num_vars, "Mismatch between objective function and variable count"
+        assert len(problem.lower) == num_vars and len(problem.upper) == num_vars, "Bound count mismatch"
+        return problem
+
+    @property
+    def function_objective(self) -> List[float]:
+        """Objective coefficients as a list; built on first access for problems from from_arrays."""
+        if self._function_objective is None:
+            self._function_objective = self.c.tolist()
+        return self._function_objective
+
+    @function_objective.setter
+    def function_objective(self, function_objective: List[float]):
+        self._function_objective = function_objective
+
+    @property
+    def variables_integer(self) -> List[bool]:
+        """Integrality flags as a list; built on first access for problems from from_arrays."""
+        if self._variables_integer is None:
+            self._variables_integer = self.integrality.tolist()
+        return self._variables_integer
+
+    @variables_integer.setter
+    def variables_integer(self, variables_integer: List[bool]):
+        self._variables_integer = variables_integer
+
+    @property
+    def constraints(self) -> List[Dict]:
+        """
+        Constraint dicts as given in JSON. Problems built with from_arrays produce them
+        on first access, in the sparse 'indices' form.
+        """
+        if self._constraints is None:
+            A = self.A
+            self._constraints = [
+                {
+                    "indices": A.indices[A.indptr[i]:A.indptr[i + 1]].tolist(),
+                    "coeficientes": A.data[A.indptr[i]:A.indptr[i + 1]].tolist(),
+                    "signo": SENSE_SYMBOLS[sense],
+                    "valor": rhs,
+                }
+                for i, (sense, rhs) in enumerate(zip(self.senses.tolist(), self.b.tolist()))
+            ]
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: List[Dict]):
+        self._constraints = constraints
+
+    @property
+    def num_variables(self) -> int:
+        return self.A.shape[1]
+
+    @property
+    def num_constraints(self) -> int:
+        return self.A.shape[0]
 
     @classmethod
     def from_json(cls, json_input: str):
@@ -23,4 +182,4 @@ class ProblemInstance:
             function_objective=data["funcion_objetivo"],
             constraints=data["restricciones"],
             variables_integer=data.get("variables_enteras", [])
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,252 @@
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from optimax.limits import relative_gap
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE, SENSE_EQ
+
+TOLERANCE = 1e-9
+
+class PresolvedProblem:
+    """
+    Result of presolve: the reduced problem plus what is needed to map its solution back.
+
+    Attributes:
+        original (ProblemInstance): The problem given to presolve.
+        reduced (ProblemInstance): The reduced problem, or None if presolve already decided the outcome.
+        status (str): None, or 'Infeasible' when presolve proved it.
+        kept_columns (np.ndarray): Original indices of the variables left in the reduced problem.
+        fixed_values (np.ndarray): Values of the removed variables, in original variable order.
+        summary (dict): Reduction counts, problem sizes before and after, and time spent.
+    """
+
+    def __init__(self, original, reduced, status, kept_columns, fixed_values, summary):
+        self.original = original
+        self.reduced = reduced
+        self.status = status
+        self.kept_columns = kept_columns
+        self.fixed_values = fixed_values
+        self.summary = summary
+
+    def postsolve(self, solution: dict) -> dict:
+        """
+        Maps a solution of the reduced problem back to the original variable space.
+
+        Parameters:
+            solution (dict): The solution of the reduced problem.
+
+        Returns:
+            dict: A copy of the solution with 'variables', 'optimal_value', 'bound', 'gap', the convergence
+                trace 'objective_values' and the heuristic incumbent's objective for the original problem.
+        """
+        result = dict(solution)
+        if "variables" in solution:
+            x = self.fixed_values.copy()
+            x[self.kept_columns] = solution["variables"]
+            result["variables"] = x.tolist()
+            result["optimal_value"] = float(self.original.c @ x)
+        if solution.get("bound") is not None:
+            result["bound"] = solution["bound"] + self.objective_offset
+            result["gap"] = relative_gap(result.get("optimal_value"), result["bound"])
+        if solution.get("heuristics", {}).get("objective_value") is not None:
+            result["heuristics"] = dict(solution["heuristics"])
+            result["heuristics"]["objective_value"] += self.objective_offset
+        if solution.get("objective_values"):
+            result["objective_values"] = [value + self.objective_offset for value in solution["objective_values"]]
+        return result
+
+    @property
+    def objective_offset(self) -> float:
+        """
+        Objective contribution of the removed variables, the difference between original and reduced objective values.
+        """
+        return float(self.original.c @ self.fixed_values)
+
+    def postsolve_incumbent(self, event: dict) -> dict:
+        """
+        Maps an incumbent event of the reduced problem (see SolveLimits.on_incumbent) to the original problem.
+        """
+        result = dict(event)
+        result["objective_value"] = event["objective_value"] + self.objective_offset
+        if event.get("bound") is not None:
+            result["bound"] = event["bound"] + self.objective_offset
+        result["gap"] = relative_gap(result["objective_value"], result["bound"])
+        if event.get("variables") is not None:
+            x = self.fixed_values.copy()
+            x[self.kept_columns] = event["variables"]
+            result["variables"] = x.tolist()
+        return result
+
+def _row_hashes(A: sp.csr_matrix, orientation: np.ndarray) -> np.ndarray:
+    # Order-independent 64-bit hash of each oriented row; equal rows always collide, others rarely do
+    row_ids = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+    bits = (A.data * orientation[row_ids] + 0.0).view(np.uint64)
+    with np.errstate(over="ignore"):
+        entry_hash = bits * np.uint64(0x9E3779B97F4A7C15) ^ (A.indices.astype(np.uint64) + np.uint64(1)) * np.uint64(0xC2B2AE3D27D4EB4F)
+    hashes = np.zeros(A.shape[0], dtype=np.uint64)
+    np.add.at(hashes, row_ids, entry_hash)
+    return hashes
+
+def presolve(problem: ProblemInstance, max_passes: int = 20) -> PresolvedProblem:
+    """
+    Simplifies a problem before it is handed to a solver. Each pass works on whole arrays:
+
+        - empty rows are checked for feasibility and dropped;
+        - singleton rows become bounds on their variable (rounded for integer variables);
+        - variables whose bounds meet are fixed and substituted into the right-hand side;
+        - variables that appear in no remaining row are set to their best bound, when it is finite;
+        - duplicate rows (identical after turning '>=' into '<=') keep only the tightest one.
+
+    Passes repeat until nothing changes, since each reduction can enable the others.
+
+    Parameters:
+        problem (ProblemInstance): The problem instance.
+        max_passes (int): Maximum number of reduction passes.
+
+    Returns:
+        PresolvedProblem: The reduced problem and the postsolve information.
+    """
+    start = time.perf_counter()
+    num_rows, num_vars = problem.A.shape
+    A = problem.A.tocsr(copy=True)
+    A.sort_indices()
+    b = problem.b.copy()
+    senses = problem.senses
+    lower = problem.lower.copy()
+    upper = problem.upper.copy()
+    integer = problem.integrality
+    # Objective in minimization form, used to pick the best bound of unused variables
+    c_min = -problem.c if problem.objective == "maximizar" else problem.c
+
+    row_alive = np.ones(num_rows, dtype=bool)
+    col_alive = np.ones(num_vars, dtype=bool)
+    fixed_values = np.zeros(num_vars)
+    counts = {"empty_rows": 0, "singleton_rows": 0, "duplicate_rows": 0, "fixed_columns": 0, "empty_columns": 0}
+    status = None
+    le = senses == SENSE_LE
+    ge = senses == SENSE_GE
+    eq = senses == SENSE_EQ
+
+    for _ in range(max_passes):
+        changed = False
+        row_nnz = np.diff(A.indptr)
+
+        # Empty rows: 0 (sense) b must hold
+        empty = row_alive & (row_nnz == 0)
+        if empty.any():
+            violated = empty & ((le & (b < -TOLERANCE)) | (ge & (b > TOLERANCE)) | (eq & (np.abs(b) > TOLERANCE)))
+            if violated.any():
+                status = "Infeasible"
+                break
+            row_alive[empty] = False
+            counts["empty_rows"] += int(empty.sum())
+            changed = True
+
+        # Singleton rows: a * x_j (sense) b becomes a bound on x_j
+        singleton = np.flatnonzero(row_alive & (row_nnz == 1))
+        if len(singleton):
+            positions = A.indptr[singleton]
+            columns = A.indices[positions]
+            coefs = A.data[positions]
+            values = b[singleton] / coefs
+            # Dividing by a negative coefficient flips the inequality
+            bounds_above = np.where(coefs > 0, le[singleton], ge[singleton]) | eq[singleton]
+            bounds_below = np.where(coefs > 0, ge[singleton], le[singleton]) | eq[singleton]
+            np.minimum.at(upper, columns[bounds_above], values[bounds_above])
+            np.maximum.at(lower, columns[bounds_below], values[bounds_below])
+            row_alive[singleton] = False
+            counts["singleton_rows"] += len(singleton)
+            changed = True
+
+        # Integer variables can only take integer values within their bounds
+        lower[integer] = np.ceil(lower[integer] - 1e-6)
+        upper[integer] = np.floor(upper[integer] + 1e-6)
+        if np.any(lower > upper + TOLERANCE):
+            status = "Infeasible"
+            break
+
+        # Fixed variables: substitute their value into the right-hand side and drop the column
+        fixed = col_alive & (upper - lower <= TOLERANCE)
+        if fixed.any():
+            fixed_values[fixed] = lower[fixed]
+            b -= A @ np.where(fixed, lower, 0.0)
+            col_alive[fixed] = False
+            A = (A @ sp.diags(col_alive.astype(float))).tocsr()
+            A.eliminate_zeros()
+            A.sort_indices()
+            counts["fixed_columns"] += int(fixed.sum())
+            changed = True
+
+        # Empty columns: the variable only affects the objective, so it goes to its best bound. One that
+        # improves without limit stays: the problem is unbounded only if the other rows are feasible,
+        # which is for the solver to decide
+        col_nnz = np.bincount(A[row_alive].indices, minlength=num_vars)
+        best = np.where(c_min > 0, lower, np.where(c_min < 0, upper, np.clip(0.0, lower, upper)))
+        empty_cols = col_alive & (col_nnz == 0) & np.isfinite(best)
+        if empty_cols.any():
+            fixed_values[empty_cols] = best[empty_cols]
+            col_alive[empty_cols] = False
+            counts["empty_columns"] += int(empty_cols.sum())
+            changed = True
+
+        # Duplicate rows: group candidates by hash, then confirm exact equality within each group
+        orientation = np.where(ge, -1.0, 1.0)
+        candidates = np.flatnonzero(row_alive & (np.diff(A.indptr) > 0))
+        hashes = _row_hashes(A, orientation)[candidates]
+        order = np.argsort(hashes, kind="stable")
+        sorted_hashes = hashes[order]
+        group_starts = np.flatnonzero(np.r_[True, sorted_hashes[1:] != sorted_hashes[:-1]])
+        group_sizes = np.diff(np.r_[group_starts, len(order)])
+        for start_index, size in zip(group_starts[group_sizes > 1], group_sizes[group_sizes > 1]):
+            exact_groups = {}
+            for r in candidates[order[start_index:start_index + size]]:
+                lo, hi = A.indptr[r], A.indptr[r + 1]
+                key = A.indices[lo:hi].tobytes() + (A.data[lo:hi] * orientation[r] + 0.0).tobytes()
+                exact_groups.setdefault(key, []).append(r)
+            for rows in exact_groups.values():
+                if len(rows) < 2:
+                    continue
+                rows = np.array(rows)
+                rhs = b[rows] * orientation[rows]
+                is_eq = eq[rows]
+                if is_eq.any():
+                    eq_rhs = rhs[is_eq]
+                    if np.ptp(eq_rhs) > TOLERANCE or np.any(rhs[~is_eq] < eq_rhs[0] - TOLERANCE):
+                        status = "Infeasible"
+                        break
+                    keep = rows[is_eq][0]
+                else:
+                    keep = rows[np.argmin(rhs)]
+                row_alive[rows[rows != keep]] = False
+                counts["duplicate_rows"] += len(rows) - 1
+                changed = True
+            if status is not None:
+                break
+        if status is not None or not changed:
+            break
+
+    kept_columns = np.flatnonzero(col_alive)
+    reduced = None
+    if status is None:
+        reduced = ProblemInstance.from_arrays(
+            problem.objective,
+            problem.c[col_alive],
+            A[row_alive][:, col_alive],
+            b[row_alive],
+            senses[row_alive],
+            integer[col_alive],
+            lower[col_alive],
+            upper[col_alive],
+        )
+
+    summary = dict(counts)
+    summary.update(
+        rows_before=num_rows,
+        cols_before=num_vars,
+        rows_after=int(row_alive.sum()) if status is None else None,
+        cols_after=len(kept_columns) if status is None else None,
+        rows_removed=num_rows - int(row_alive.sum()),
+        cols_removed=num_vars - len(kept_columns),
+        time=time.perf_counter() - start,
+    )
+    return PresolvedProblem(problem, reduced, status, kept_columns, fixed_values, summary)
@@ -0,0 +1,112 @@
+import os
+import queue
+import re
+import threading
+from typing import List, Optional
+
+from optimax.metrics import phase
+from optimax.parser import ProblemInstance
+
+def plot_paths(output_dir: str, problem_id: str) -> dict:
+    """
+    Builds the output file names for one problem, so concurrent problems never share a file.
+
+    Parameters:
+        output_dir (str): Directory where the plots are written.
+        problem_id (str): Identifier of the problem (e.g. its file name); unsafe characters are replaced.
+
+    Returns:
+        dict: Paths keyed by plot kind ('feasible_region', 'convergence', 'branch_and_bound_tree', 'search_summary').
+    """
+    stem = re.sub(r"[^A-Za-z0-9_.-]+", "_", problem_id).strip("_.") or "problem"
+    return {
+        kind: os.path.join(output_dir, f"{stem}_{kind}.png")
+        for kind in ("feasible_region", "convergence", "branch_and_bound_tree", "search_summary")
+    }
+
+class RenderQueue:
+    """
+    Renders plots on a background thread so that solving never waits on matplotlib.
+
+    Jobs are queued with submit() and written to per-problem paths from plot_paths().
+    A job that fails is recorded in 'errors' instead of interrupting the caller.
+    close() (or leaving a 'with' block) waits for the queued plots to be written.
+    """
+
+    def __init__(self, output_dir: str = ".", max_pending: int = 256, metrics=None):
+        """
+        Parameters:
+            output_dir (str): Directory for the PNG files; created if missing.
+            max_pending (int): Maximum queued jobs; submit() blocks when the queue is full.
+            metrics (Metrics): Optional collector; each plot is timed as a 'render.<plot>' phase.
+        """
+        self.output_dir = output_dir
+        self.metrics = metrics
+        os.makedirs(output_dir, exist_ok=True)
+        self.errors = []
+        self.rendered = []
+        self._jobs = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="optimax-render", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, problem_id: str, problem: ProblemInstance, solution: dict) -> List[str]:
+        """
+        Queues every plot that applies to a solved problem.
+
+        Parameters:
+            problem_id (str): Identifier used to name the output files.
+            problem (ProblemInstance): The solved problem.
+            solution (dict): The solution returned by Solver.solve.
+
+        Returns:
+            list: Paths of the plots that will be written.
+        """
+        paths = plot_paths(self.output_dir, problem_id)
+        queued = []
+        if problem.num_variables == 2 and "variables" in solution:
+            self._jobs.put(("plot_feasible_region", (problem, solution), paths["feasible_region"]))
+            queued.append(paths["feasible_region"])
+        if solution.get("iterations") and solution.get("objective_values"):
+            args = (solution["iterations"], solution["objective_values"])
+            self._jobs.put(("plot_convergence", args, paths["convergence"]))
+            queued.append(paths["convergence"])
+        if solution.get("branch_tree_data"):
+            self._jobs.put(("plot_branch_and_bound_tree", (solution["branch_tree_data"],), paths["branch_and_bound_tree"]))
+            queued.append(paths["branch_and_bound_tree"])
+        elif solution.get("tree_summary"):
+            # Searches streamed through a TreeRecorder only return bounded summaries
+            summary = solution["tree_summary"]
+            self._jobs.put(("plot_branch_and_bound_tree", (summary,), paths["branch_and_bound_tree"]))
+            self._jobs.put(("plot_search_summary", (summary,), paths["search_summary"]))
+            queued.extend([paths["branch_and_bound_tree"], paths["search_summary"]])
+        return queued
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Waits until all queued plots have been written and stops the render thread.
+        """
+        if self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join(timeout)
+
+    def _run(self):
+        # matplotlib is imported on the render thread, never on the solving path
+        from optimax.visualizer import Visualizer
+
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            name, args, filename = job
+            try:
+                with phase(self.metrics, f"render.{name}"):
+                    getattr(Visualizer, name)(*args, filename=filename)
+                self.rendered.append(filename)
+            except Exception as e:
+                self.errors.append((filename, f"{type(e).__name__}: {e}"))
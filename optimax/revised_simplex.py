@@ -0,0 +1,419 @@
+"""
+Bounded-variable revised simplex in NumPy, with primal and dual variants.
+
+Every constraint gets a logical variable equal to its activity, so the model solved is
+
+    min c^T x   s.t.   A x - s = 0,   l <= (x, s) <= u
+
+and the starting basis is made of the logicals. The basis is kept as a sparse LU factorization
+(SuperLU, through scipy) of the basis at the last refactorization. Each pivot is a rank-one update
+applied through the Woodbury identity, so solves cost one pair of triangular solves plus a product
+with the update columns, and the basis is refactorized every REFACTOR_INTERVAL pivots.
+
+Primal simplex first minimizes the sum of infeasibilities (phase 1), then the objective. Dual
+simplex starts from the logical basis with costs randomly perturbed against stalling and shifted
+until it is dual feasible, and pivots until it is primal feasible; the costs are then restored and
+primal simplex removes whatever dual infeasibility that leaves. Pricing is Dantzig's rule or exact
+steepest edge, with a Harris two-pass ratio test.
+
+The objective value after every iteration goes into an array allocated before the first
+iteration, so tracing costs one dot product per iteration.
+"""
+import time
+from typing import Optional
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE
+from optimax.session import BASIS_BASIC, BASIS_LOWER, BASIS_UPPER, BASIS_ZERO
+
+SIMPLEX_METHODS = ("primal", "dual")
+PRICING_RULES = ("dantzig", "steepest_edge")
+
+PRIMAL_TOLERANCE = 1e-7
+DUAL_TOLERANCE = 1e-7
+PIVOT_TOLERANCE = 1e-9
+REFACTOR_INTERVAL = 64
+# Relative size of the random cost perturbation the dual simplex starts with
+COST_PERTURBATION = 1e-6
+# Consecutive degenerate pivots after which primal pricing falls back to Bland's rule until the objective moves
+DEGENERATE_LIMIT = 50
+
+class RevisedSimplex:
+    """
+    Solves a linear problem (integrality is ignored) with the revised simplex method.
+
+    Typical use:
+        result = RevisedSimplex(problem, method="dual", pricing="steepest_edge").solve()
+        result["objective_values"]  # objective after every iteration, for Visualizer.plot_convergence
+    """
+
+    def __init__(self, problem: ProblemInstance, method: str = "primal", pricing: str = "steepest_edge",
+                 max_iterations: Optional[int] = None):
+        """
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            method (str): 'primal' or 'dual'.
+            pricing (str): 'dantzig' or 'steepest_edge'.
+            max_iterations (int): Iteration limit; by default 20 * (rows + columns) + 1000.
+
+        Raises:
+            ValueError: If the method or pricing rule is not supported.
+        """
+        if method not in SIMPLEX_METHODS:
+            raise ValueError(f"Unsupported simplex method: {method}")
+        if pricing not in PRICING_RULES:
+            raise ValueError(f"Unsupported pricing rule: {pricing}")
+        self.problem = problem
+        self.method = method
+        self.pricing = pricing
+        m, n = problem.A.shape
+        self.m, self.n = m, n
+        self.max_iterations = max_iterations if max_iterations is not None else 20 * (m + n) + 1000
+
+        self.K = sp.hstack([problem.A.tocsc(), -sp.identity(m, format="csc")], format="csc")
+        # Rows of K^T are the columns of K, so K^T @ y prices every column at once
+        self.KT = self.K.T.tocsr()
+        self.maximize = problem.objective == "maximizar"
+        self.user_cost = problem.c.astype(float)
+        # Costs in minimization form; the dual simplex works on a shifted copy
+        self.min_cost = np.concatenate([-self.user_cost if self.maximize else self.user_cost, np.zeros(m)])
+        row_lower = np.where(problem.senses == SENSE_LE, -np.inf, problem.b)
+        row_upper = np.where(problem.senses == SENSE_GE, np.inf, problem.b)
+        self.lower = np.concatenate([problem.lower, row_lower]).astype(float)
+        self.upper = np.concatenate([problem.upper, row_upper]).astype(float)
+        self.movable = self.lower < self.upper
+
+        self.trace = np.empty(self.max_iterations)
+
+    # Basis factorization
+
+    def _refactor(self):
+        B = self.K[:, self.basic].tocsc()
+        self._lu = splu(B, permc_spec="COLAMD") if self.m else None
+        # Pivots since the factorization: B = B0 + W P^T, where P picks the replaced positions and
+        # Z = B0^-1 W; the inverse of the small matrix C = I + P^T Z is updated with each pivot
+        self._updates = 0
+        self._positions = []
+        self._slots = {}
+        self._Z = np.empty((self.m, REFACTOR_INTERVAL))
+        self._schur = None
+        # Recompute the basic values from the nonbasic ones to shed accumulated error
+        x = self.x.copy()
+        x[self.basic] = 0.0
+        self.x[self.basic] = self._ftran(-(self.K @ x))
+
+    def _ftran(self, v: np.ndarray, partial: bool = False):
+        # Woodbury: B^-1 v = z - Z C^-1 P^T z with z = B0^-1 v; 'partial' also returns z, which the pivot needs
+        z = self._lu.solve(v) if self._lu is not None else v.copy()
+        y = z
+        if self._positions:
+            r = len(self._positions)
+            y = z - self._Z[:, :r] @ (self._schur @ z[self._positions])
+        return (y, z) if partial else y
+
+    def _btran(self, v: np.ndarray) -> np.ndarray:
+        # B^-T v = B0^-T (v - P C^-T Z^T v)
+        if self._positions:
+            r = len(self._positions)
+            v = v.copy()
+            v[self._positions] -= (self._Z[:, :r].T @ v) @ self._schur
+        return self._lu.solve(v, trans="T") if self._lu is not None else v
+
+    def _column(self, j: int) -> np.ndarray:
+        column = np.zeros(self.m)
+        start, end = self.K.indptr[j], self.K.indptr[j + 1]
+        column[self.K.indices[start:end]] = self.K.data[start:end]
+        return column
+
+    def _pivot(self, p: int, q: int, z: np.ndarray):
+        # z = B0^-1 a_q, so replacing column p of B by a_q adds the column B0^-1 (a_q - B0 e_p) = z - e_p to Z
+        leaving = self.basic[p]
+        self.status[leaving] = BASIS_LOWER if self.x[leaving] <= self.lower[leaving] else BASIS_UPPER
+        self.status[q] = BASIS_BASIC
+        self.basic[p] = q
+        self._updates += 1
+        if self._updates >= REFACTOR_INTERVAL:
+            self._refactor()
+            return
+        w = z.copy()
+        w[p] -= 1.0
+        slot = self._slots.get(p)
+        if slot is None:
+            # A new position borders C with a row and a column: block inverse through the Schur complement
+            r = len(self._positions)
+            self._slots[p] = r
+            self._positions.append(p)
+            self._Z[:, r] = w
+            column = self._schur @ w[self._positions[:r]] if r else np.empty(0)
+            row = self._Z[p, :r] @ self._schur if r else np.empty(0)
+            pivot = 1.0 + w[p] - self._Z[p, :r] @ column
+            inverse = np.empty((r + 1, r + 1))
+            inverse[:r, :r] = self._schur + np.outer(column, row) / pivot if r else 0.0
+            inverse[:r, r] = -column / pivot
+            inverse[r, :r] = -row / pivot
+            inverse[r, r] = 1.0 / pivot
+            self._schur = inverse
+        else:
+            # A position replaced again changes one column of C: Sherman-Morrison
+            change = w[self._positions] - self._Z[self._positions, slot]
+            self._Z[:, slot] = w
+            column = self._schur @ change
+            self._schur -= np.outer(column, self._schur[slot]) / (1.0 + column[slot])
+
+    def _record(self):
+        self.trace[self.nit] = self.user_cost @ self.x[:self.n]
+        self.nit += 1
+
+    def _reduced_costs(self, cost: np.ndarray) -> np.ndarray:
+        d = cost - self.KT @ self._btran(cost[self.basic])
+        d[self.basic] = 0.0
+        return d
+
+    # Primal simplex
+
+    def _primal_candidates(self, d: np.ndarray) -> np.ndarray:
+        status = self.status
+        return self.movable & (((status == BASIS_LOWER) & (d < -DUAL_TOLERANCE))
+                               | ((status == BASIS_UPPER) & (d > DUAL_TOLERANCE))
+                               | ((status == BASIS_ZERO) & (np.abs(d) > DUAL_TOLERANCE)))
+
+    def _primal(self, phase_one: bool) -> str:
+        degenerate = 0
+        while True:
+            x_basic = self.x[self.basic]
+            lower, upper = self.lower[self.basic], self.upper[self.basic]
+            below = x_basic < lower - PRIMAL_TOLERANCE
+            above = x_basic > upper + PRIMAL_TOLERANCE
+            if phase_one:
+                if not (below.any() or above.any()):
+                    return "optimal"
+                cost = np.zeros(self.n + self.m)
+                cost[self.basic] = above.astype(float) - below
+            else:
+                cost = self.cost
+            d = self._reduced_costs(cost)
+            eligible = self._primal_candidates(d)
+            if not eligible.any():
+                if self._updates:
+                    # Confirm on a fresh factorization before stopping
+                    self._refactor()
+                    continue
+                return "infeasible" if phase_one else "optimal"
+            if self.nit >= self.max_iterations:
+                return "iteration_limit"
+
+            if degenerate > DEGENERATE_LIMIT:
+                q = int(np.flatnonzero(eligible)[0])
+            elif self.pricing == "steepest_edge":
+                q = int(np.argmax(np.where(eligible, d * d / self._gamma, -1.0)))
+            else:
+                q = int(np.argmax(np.where(eligible, np.abs(d), -1.0)))
+            direction = 1.0 if d[q] < 0 else -1.0
+            alpha, z = self._ftran(self._column(q), partial=True)
+            # Basic values move by -step * delta as the entering variable moves by step in its direction
+            delta = direction * alpha
+
+            falling = delta > PIVOT_TOLERANCE
+            rising = delta < -PIVOT_TOLERANCE
+            # Falling variables stop at their lower bound (or at the upper one while above it); rising ones
+            # at their upper bound (or the lower one while below it). Infeasible variables moving away from
+            # their bounds never block, which only happens in phase 1.
+            bound = np.full(self.m, np.nan)
+            bound[falling] = np.where(above, upper, np.where(below, -np.inf, lower))[falling]
+            bound[rising] = np.where(below, lower, np.where(above, np.inf, upper))[rising]
+            blocking = np.isfinite(bound)
+            step, p = np.inf, -1
+            if blocking.any():
+                rows = np.flatnonzero(blocking)
+                gap = (x_basic[rows] - bound[rows]) / delta[rows]
+                relaxed = gap + PRIMAL_TOLERANCE / np.abs(delta[rows])
+                # Harris: among the rows blocking before the relaxed limit, the largest pivot wins
+                limit = relaxed.min()
+                candidates = gap <= limit
+                best = np.argmax(np.where(candidates, np.abs(delta[rows]), -1.0))
+                p, step = int(rows[best]), max(float(gap[best]), 0.0)
+            span = self.upper[q] - self.lower[q]
+            if span <= step:
+                step, p = span, -1
+            if not np.isfinite(step):
+                return "infeasible" if phase_one else "unbounded"
+
+            degenerate = degenerate + 1 if step <= PRIMAL_TOLERANCE else 0
+            self.x[self.basic] -= step * delta
+            self.x[q] += direction * step
+            if p < 0:
+                # The entering variable reaches its other bound before any basic variable blocks
+                self.status[q] = BASIS_UPPER if direction > 0 else BASIS_LOWER
+                self.x[q] = self.upper[q] if direction > 0 else self.lower[q]
+            else:
+                if self.pricing == "steepest_edge":
+                    self._update_primal_weights(p, q, alpha)
+                leaving = self.basic[p]
+                self.x[leaving] = bound[p]
+                self._pivot(p, q, z)
+            self._record()
+            if phase_one:
+                self.phase_one_iterations += 1
+
+    def _update_primal_weights(self, p: int, q: int, alpha: np.ndarray):
+        # Goldfarb-Reid update of gamma_j = 1 + ||B^-1 a_j||^2, before the basis changes
+        row = self.KT @ self._btran(np.eye(1, self.m, p).ravel())
+        w = self.KT @ self._btran(alpha)
+        ratio = row / alpha[p]
+        gamma_q = self._gamma[q]
+        self._gamma = np.maximum(self._gamma - 2 * ratio * w + ratio * ratio * gamma_q, 1 + ratio * ratio)
+        self._gamma[self.basic[p]] = max(gamma_q / alpha[p] ** 2, 1.0)
+
+    # Dual simplex
+
+    def _shift_costs(self):
+        # Puts each nonbasic variable at the bound its reduced cost prefers, then perturbs the costs
+        # away from zero reduced costs and shifts those still of the wrong sign, which happens when
+        # the preferred bound is infinite
+        d = self._reduced_costs(self.cost)
+        nonbasic = self.status != BASIS_BASIC
+        to_upper = nonbasic & (d < 0) & np.isfinite(self.upper)
+        to_lower = nonbasic & (d >= 0) & np.isfinite(self.lower)
+        self.status[to_upper], self.x[to_upper] = BASIS_UPPER, self.upper[to_upper]
+        self.status[to_lower], self.x[to_lower] = BASIS_LOWER, self.lower[to_lower]
+        # Basic variables get a perturbation of random sign, so reduced costs stay away from zero after
+        # they leave the basis too; a fixed seed keeps the iteration count reproducible
+        rng = np.random.default_rng(0)
+        xi = COST_PERTURBATION * (1 + np.abs(self.cost)) * rng.uniform(0.5, 1.0, self.n + self.m)
+        xi *= np.where(self.status == BASIS_BASIC, rng.choice([-1.0, 1.0], self.n + self.m), 1.0)
+        xi[~self.movable | (self.status == BASIS_ZERO)] = 0.0
+        xi[self.status == BASIS_UPPER] *= -1
+        self.cost = self.cost + xi
+        d = self._reduced_costs(self.cost)
+        wrong = nonbasic & self.movable & (((self.status == BASIS_LOWER) & (d < 0)) | ((self.status == BASIS_UPPER) & (d > 0))
+                                           | (self.status == BASIS_ZERO))
+        # Shifted reduced costs land on the perturbation rather than on zero, which would stall the ratio test
+        self.cost[wrong] += xi[wrong] - d[wrong]
+        self._refactor()
+
+    def _dual(self) -> str:
+        beta = np.ones(self.m)
+        d = self._reduced_costs(self.cost)
+        while True:
+            x_basic = self.x[self.basic]
+            lower, upper = self.lower[self.basic], self.upper[self.basic]
+            infeasibility = np.maximum(lower - x_basic, x_basic - upper)
+            infeasible = infeasibility > PRIMAL_TOLERANCE
+            if not infeasible.any():
+                if self._updates:
+                    self._refactor()
+                    d = self._reduced_costs(self.cost)
+                    continue
+                return "optimal"
+            if self.nit >= self.max_iterations:
+                return "iteration_limit"
+
+            if self.pricing == "steepest_edge":
+                p = int(np.argmax(np.where(infeasible, infeasibility ** 2 / beta, -1.0)))
+            else:
+                p = int(np.argmax(np.where(infeasible, infeasibility, -1.0)))
+            leaving = self.basic[p]
+            rising = x_basic[p] < lower[p]
+            target = lower[p] if rising else upper[p]
+            rho = self._btran(np.eye(1, self.m, p).ravel())
+            row = self.KT @ rho
+
+            # Entering candidates move the leaving variable toward its bound: x_p changes by -row_j per unit of x_j
+            sign_row = row if rising else -row
+            status = self.status
+            candidates = self.movable & (((status == BASIS_LOWER) & (sign_row < -PIVOT_TOLERANCE))
+                                         | ((status == BASIS_UPPER) & (sign_row > PIVOT_TOLERANCE))
+                                         | ((status == BASIS_ZERO) & (np.abs(row) > PIVOT_TOLERANCE)))
+            if not candidates.any():
+                if self._updates:
+                    self._refactor()
+                    d = self._reduced_costs(self.cost)
+                    continue
+                return "infeasible"
+            columns = np.flatnonzero(candidates)
+            magnitude = np.abs(row[columns])
+            # Dual slack of each candidate: how far its reduced cost is from the wrong sign; Harris lets
+            # it go up to DUAL_TOLERANCE negative, so clip at zero before taking ratios
+            slack = np.where(status[columns] == BASIS_UPPER, -d[columns],
+                             np.where(status[columns] == BASIS_LOWER, d[columns], np.abs(d[columns])))
+            ratios = np.maximum(slack, 0.0) / magnitude
+            limit = max(((slack + DUAL_TOLERANCE) / magnitude).min(), 0.0)
+            best = np.argmax(np.where(ratios <= limit, magnitude, -1.0))
+            q = int(columns[best])
+            if slack[best] < 0:
+                # Shift the entering cost so its reduced cost is exactly zero instead of the wrong sign
+                self.cost[q] -= d[q]
+                d[q] = 0.0
+
+            alpha, z = self._ftran(self._column(q), partial=True)
+            step = (x_basic[p] - target) / alpha[p]
+            if self.pricing == "steepest_edge":
+                tau = self._ftran(rho)
+                beta_p = rho @ rho
+                ratio = alpha / alpha[p]
+                beta = np.maximum(beta - 2 * ratio * tau + ratio * ratio * beta_p, 1e-8)
+                beta[p] = max(beta_p / alpha[p] ** 2, 1e-8)
+            theta = d[q] / row[q]
+            d -= theta * row
+            d[q] = 0.0
+            self.x[self.basic] -= step * alpha
+            self.x[q] += step
+            self.x[leaving] = target
+            self._pivot(p, q, z)
+            if not self._updates:
+                # The pivot triggered a refactorization
+                d = self._reduced_costs(self.cost)
+            self._record()
+
+    # Driver
+
+    def solve(self) -> dict:
+        """
+        Returns:
+            dict: 'status' ('Optimal', 'Infeasible', 'Unbounded' or 'Not Solved' at the iteration limit),
+                'optimal_value' and 'variables' when optimal, 'nit', 'phase_one_iterations', 'time',
+                and 'iterations' and 'objective_values' (the objective after each iteration).
+        """
+        start = time.perf_counter()
+        m, n = self.m, self.n
+        self.cost = self.min_cost.copy()
+        self.nit = 0
+        self.phase_one_iterations = 0
+        self.basic = np.arange(n, n + m)
+        self.status = np.full(n + m, BASIS_BASIC, dtype=np.int8)
+        self.x = np.zeros(n + m)
+        structural = np.arange(n)
+        has_lower = np.isfinite(self.lower[:n])
+        has_upper = np.isfinite(self.upper[:n])
+        self.status[:n] = np.where(has_lower, BASIS_LOWER, np.where(has_upper, BASIS_UPPER, BASIS_ZERO))
+        self.x[structural] = np.where(has_lower, self.lower[:n], np.where(has_upper, self.upper[:n], 0.0))
+        self._gamma = np.ones(n + m)
+        self._gamma[:n] += np.asarray(self.K[:, :n].multiply(self.K[:, :n]).sum(axis=0)).ravel()
+        self._refactor()
+
+        if self.method == "dual":
+            self._shift_costs()
+            outcome = self._dual()
+            if outcome == "optimal":
+                self.cost = self.min_cost
+                outcome = self._primal(phase_one=False)
+        else:
+            outcome = self._primal(phase_one=True)
+            if outcome == "optimal":
+                outcome = self._primal(phase_one=False)
+
+        status = {"optimal": "Optimal", "infeasible": "Infeasible", "unbounded": "Unbounded"}.get(outcome, "Not Solved")
+        result = {
+            "status": status,
+            "nit": self.nit,
+            "phase_one_iterations": self.phase_one_iterations,
+            "iterations": list(range(1, self.nit + 1)),
+            "objective_values": self.trace[:self.nit].tolist(),
+            "time": time.perf_counter() - start,
+        }
+        if status == "Optimal":
+            result["optimal_value"] = float(self.user_cost @ self.x[:n])
+            result["variables"] = self.x[:n].tolist()
+        return result
@@ -0,0 +1,261 @@
+"""
+Scenario sweeps: one problem solved for many right-hand sides or objective vectors.
+
+The base problem is assembled once into a SolverSession and solved. Scenarios are then checked
+against its optimal basis: while the basis is fixed, the primal values are linear in the
+right-hand side and the duals are linear in the objective, so every pending scenario is evaluated
+at once with a single factorization of the basis. A scenario that stays primal and dual feasible
+keeps the basis and needs no simplex solve. The first one that does not is re-solved warm from the
+current basis (dual simplex after right-hand side changes, primal after objective changes), and
+the new basis is then tried on the scenarios still pending.
+"""
+import time
+from typing import Optional
+
+import numpy as np
+from scipy.sparse.linalg import splu
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE, SENSE_EQ
+from optimax.session import SolverSession, BASIS_BASIC, BASIS_LOWER, BASIS_UPPER
+
+# Feasibility tolerance of the basis checks, relative to the magnitude of the values checked
+TOLERANCE = 1e-7
+
+class ScenarioResults:
+    """
+    Results of a scenario sweep, one row per scenario.
+
+    Attributes:
+        status (np.ndarray): (S,) status strings, 'Optimal' for solved scenarios.
+        objective_value (np.ndarray): (S,) optimal values.
+        variables (np.ndarray): (S, n) variable values.
+        duals (np.ndarray): (S, m) shadow prices: change of the optimal value per unit increase of each right-hand side.
+        reduced_costs (np.ndarray): (S, n) change of the optimal value per unit increase of each variable.
+        slacks (np.ndarray): (S, m) distance of each constraint from binding: b - Ax for '<=', Ax - b for '>='
+            and '=='.
+        resolved (np.ndarray): (S,) True for the scenarios that needed a simplex solve.
+        summary (dict): Scenario, re-solve and basis counts, simplex iterations and time spent.
+
+    Values are NaN for scenarios that were not solved to optimality. Integer problems have no basis:
+    every scenario is re-solved and duals and reduced costs stay NaN.
+    """
+
+    def __init__(self, num_scenarios: int, num_variables: int, num_constraints: int):
+        self.status = np.full(num_scenarios, "Not Solved", dtype=object)
+        self.objective_value = np.full(num_scenarios, np.nan)
+        self.variables = np.full((num_scenarios, num_variables), np.nan)
+        self.duals = np.full((num_scenarios, num_constraints), np.nan)
+        self.reduced_costs = np.full((num_scenarios, num_variables), np.nan)
+        self.slacks = np.full((num_scenarios, num_constraints), np.nan)
+        self.resolved = np.zeros(num_scenarios, dtype=bool)
+        self.summary = {}
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def solution(self, k: int) -> dict:
+        """
+        Returns:
+            dict: Scenario k in the shape of Solver.solve's solutions, plus 'duals', 'reduced_costs' and 'slacks'.
+        """
+        solution = {"status": self.status[k]}
+        if not np.isnan(self.objective_value[k]):
+            solution["optimal_value"] = float(self.objective_value[k])
+            solution["variables"] = self.variables[k].tolist()
+            solution["slacks"] = self.slacks[k].tolist()
+            if not np.isnan(self.duals[k]).all():
+                solution["duals"] = self.duals[k].tolist()
+                solution["reduced_costs"] = self.reduced_costs[k].tolist()
+        return solution
+
+class _Basis:
+    # An optimal basis of the base model, factorized once and evaluated for any right-hand sides and objectives.
+    # With it fixed, the basic variables solve A[active, basic] x_B = b[active] - A[active, nonbasic] x_N,
+    # and the duals of the active rows solve A[active, basic]^T y = c_B; every other dual is zero.
+
+    def __init__(self, problem: ProblemInstance, col_status: np.ndarray, row_status: np.ndarray):
+        self.A = problem.A.tocsr()
+        self.senses = problem.senses
+        self.lower, self.upper = problem.lower, problem.upper
+        self.col_status, self.row_status = col_status, row_status
+        self.basic = np.flatnonzero(col_status == BASIS_BASIC)
+        self.nonbasic = np.flatnonzero(col_status != BASIS_BASIC)
+        self.active = np.flatnonzero(row_status != BASIS_BASIC)
+        self.inactive = np.flatnonzero(row_status == BASIS_BASIC)
+        self.lu = None
+        self.usable = len(self.basic) == len(self.active)
+        A_active = self.A[self.active]
+        if self.usable and len(self.basic):
+            try:
+                self.lu = splu(A_active[:, self.basic].tocsc())
+            except RuntimeError:
+                # Singular basis matrix: every scenario falls back to a simplex solve
+                self.usable = False
+        status = col_status[self.nonbasic]
+        self.x_nonbasic = np.where(status == BASIS_UPPER, self.upper[self.nonbasic],
+                                   np.where(status == BASIS_LOWER, self.lower[self.nonbasic], 0.0))
+        self.nonbasic_activity = A_active[:, self.nonbasic] @ self.x_nonbasic
+
+    def primal(self, b: np.ndarray):
+        """
+        Returns:
+            tuple: Variable values (len(b), n) with this basis and whether each row of b keeps it primal feasible.
+        """
+        X = np.empty((len(b), self.A.shape[1]))
+        X[:, self.nonbasic] = self.x_nonbasic
+        if self.lu is not None:
+            rhs = np.ascontiguousarray((b[:, self.active] - self.nonbasic_activity).T)
+            X[:, self.basic] = self.lu.solve(rhs).T
+        x_basic = X[:, self.basic]
+        lower, upper = self.lower[self.basic], self.upper[self.basic]
+        feasible = np.all((x_basic >= lower - TOLERANCE * (1 + np.abs(lower)))
+                          & (x_basic <= upper + TOLERANCE * (1 + np.abs(upper))), axis=1)
+        # Rows whose slack is basic may move freely, as long as they stay satisfied
+        activity = (self.A[self.inactive] @ X.T).T
+        rhs = b[:, self.inactive]
+        senses = self.senses[self.inactive]
+        tolerance = TOLERANCE * (1 + np.abs(rhs))
+        violated = np.where(senses == SENSE_LE, activity > rhs + tolerance,
+                            np.where(senses == SENSE_GE, activity < rhs - tolerance, np.abs(activity - rhs) > tolerance))
+        return X, feasible & ~violated.any(axis=1)
+
+    def dual(self, c: np.ndarray):
+        """
+        Returns:
+            tuple: Row duals (len(c), m) and reduced costs (len(c), n) of the minimization objectives c with this
+                basis, and whether each row of c keeps it dual feasible.
+        """
+        Y = np.zeros((len(c), self.A.shape[0]))
+        if self.lu is not None:
+            Y[:, self.active] = self.lu.solve(np.ascontiguousarray(c[:, self.basic].T), trans="T").T
+        D = c - (self.A.T @ Y.T).T
+        tolerance = TOLERANCE * (1 + np.abs(c).max(axis=1, keepdims=True))
+
+        # Nonbasic variables at their lower bound must not want to increase, at their upper bound not decrease
+        status = self.col_status[self.nonbasic]
+        movable = self.lower[self.nonbasic] < self.upper[self.nonbasic]
+        d = D[:, self.nonbasic]
+        wrong = movable & np.where(status == BASIS_LOWER, d < -tolerance,
+                                   np.where(status == BASIS_UPPER, d > tolerance, np.abs(d) > tolerance))
+        # Binding '>=' rows (at their lower bound) need y >= 0, binding '<=' rows y <= 0; '==' rows are free
+        y = Y[:, self.active]
+        free = self.senses[self.active] == SENSE_EQ
+        at_lower = self.row_status[self.active] == BASIS_LOWER
+        wrong_rows = ~free & np.where(at_lower, y < -tolerance, y > tolerance)
+        return Y, D, ~wrong.any(axis=1) & ~wrong_rows.any(axis=1)
+
+def _scenario_matrix(base: np.ndarray, values, indices, name: str) -> Optional[np.ndarray]:
+    if values is None:
+        return None
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    indices = np.arange(len(base)) if indices is None else np.asarray(indices, dtype=np.int64).ravel()
+    if values.shape[1] != len(indices):
+        raise ValueError(f"Mismatch in dimensions of the {name} scenarios: {values.shape[1]} values for {len(indices)} entries.")
+    matrix = np.repeat(base[None, :].astype(float), len(values), axis=0)
+    matrix[:, indices] = values
+    return matrix
+
+def sweep(problem: ProblemInstance, rhs=None, objective=None, rows=None, columns=None) -> ScenarioResults:
+    """
+    Solves a problem for many right-hand sides and/or objective vectors, reusing one assembled model
+    and its optimal bases (see the module docstring).
+
+    Parameters:
+        problem (ProblemInstance): The base problem.
+        rhs (array-like): (S, m) right-hand sides, or (S, len(rows)) values for the given rows.
+        objective (array-like): (S, n) objective vectors, or (S, len(columns)) coefficients for the given variables.
+        rows (array-like): Constraints whose right-hand sides rhs holds; all of them by default.
+        columns (array-like): Variables whose objective coefficients objective holds; all of them by default.
+
+    Returns:
+        ScenarioResults: The stacked results, in scenario order.
+
+    Raises:
+        ValueError: If neither rhs nor objective is given, or their shapes do not match the problem or each other.
+    """
+    start = time.perf_counter()
+    B = _scenario_matrix(problem.b, rhs, rows, "rhs")
+    C = _scenario_matrix(problem.c, objective, columns, "objective")
+    counts = {len(matrix) for matrix in (B, C) if matrix is not None}
+    if len(counts) != 1:
+        raise ValueError("Mismatch in dimensions of the scenarios: give rhs and/or objective with one row per scenario.")
+    num_scenarios = counts.pop()
+    vary_rhs, vary_objective = B is not None, C is not None
+    B = B if vary_rhs else problem.b[None, :].astype(float)
+    C = C if vary_objective else problem.c[None, :].astype(float)
+    # The basis checks work on the minimization form; duals are reported in the problem's own sense
+    sign = -1.0 if problem.objective == "maximizar" else 1.0
+    slack_sign = np.where(problem.senses == SENSE_LE, 1.0, -1.0)
+
+    results = ScenarioResults(num_scenarios, problem.num_variables, problem.num_constraints)
+    session = SolverSession(problem)
+    base = session.solve()
+    iterations = base["simplex_iterations"]
+    bases = 0
+
+    def rows_of(matrix, indices):
+        return matrix[indices] if len(matrix) > 1 else matrix
+
+    def store(indices, X, Y=None, D=None):
+        # Rows of X, Y and D are either one per scenario or a single one shared by all of them
+        X = np.broadcast_to(X, (len(indices), X.shape[1]))
+        b = rows_of(B, indices)
+        results.status[indices] = "Optimal"
+        results.variables[indices] = X
+        results.objective_value[indices] = np.einsum("ij,ij->i", np.broadcast_to(rows_of(C, indices), X.shape), X)
+        results.slacks[indices] = slack_sign * (b - (problem.A @ X.T).T)
+        if Y is not None:
+            results.duals[indices] = sign * np.broadcast_to(Y, (len(indices), Y.shape[1]))
+            results.reduced_costs[indices] = sign * np.broadcast_to(D, (len(indices), D.shape[1]))
+
+    def usable_basis():
+        status = session.basis()
+        if status is None:
+            return None
+        basis = _Basis(problem, *status)
+        return basis if basis.usable else None
+
+    basis = usable_basis() if base["status"] == "Optimal" else None
+    bases += basis is not None
+    pending = np.arange(num_scenarios)
+    while len(pending):
+        if basis is not None:
+            b, c = rows_of(B, pending), rows_of(C, pending) * sign
+            X, primal_ok = basis.primal(b)
+            Y, D, dual_ok = basis.dual(c)
+            keep = np.broadcast_to(primal_ok & dual_ok, pending.shape)
+            if keep.any():
+                kept = np.flatnonzero(keep)
+                store(pending[kept], rows_of(X, kept), rows_of(Y, kept), rows_of(D, kept))
+            pending = pending[~keep]
+            if not len(pending):
+                break
+
+        k, pending = pending[0], pending[1:]
+        if vary_rhs:
+            session.update_rhs(np.arange(problem.num_constraints), B[k])
+        if vary_objective:
+            session.update_objective(np.arange(problem.num_variables), C[k])
+        solved = session.solve()
+        iterations += solved["simplex_iterations"]
+        results.resolved[k] = True
+        results.status[k] = solved["status"]
+        if solved["status"] != "Optimal":
+            continue
+        new_basis = usable_basis()
+        if new_basis is None:
+            store(np.array([k]), np.array([solved["variables"]]))
+            continue
+        basis = new_basis
+        bases += 1
+        X, _ = basis.primal(rows_of(B, np.array([k])))
+        Y, D, _ = basis.dual(rows_of(C, np.array([k])) * sign)
+        store(np.array([k]), X, Y, D)
+
+    results.summary = {
+        "scenarios": num_scenarios,
+        "resolves": int(results.resolved.sum()),
+        "bases": bases,
+        "simplex_iterations": int(iterations),
+        "time": time.perf_counter() - start,
+    }
+    return results
@@ -1,7 +1,131 @@
+import json
+import logging
+import math
+import os
+import time
+from typing import Iterable, List, Optional, Tuple
+
 import numpy as np
-from optimax.parser import ProblemInstance
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE, SENSE_EQ
+
+logger = logging.getLogger(__name__)
+
+# Candidates timed for each kind of problem: LP algorithms and ILP backends
+LP_CANDIDATES = ("simplex", "dual_simplex", "interior_point")
+ILP_CANDIDATES = ("pulp", "highs", "native")
+
+# Features compared between problems; sizes are log-scaled so that 100 vs 200 rows weighs like 1000 vs 2000
+FEATURE_NAMES = ("rows", "cols", "nnz", "density", "eq_share", "ge_share", "integer_share", "zero_feasible")
+LOG_FEATURES = ("rows", "cols", "nnz")
+
+DEFAULT_TIMING_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "timings.json")
+
+class TimingTable:
+    """
+    Measured solve times of every candidate on a set of reference problems.
+
+    Each record holds the features of one problem, its kind ('lp' or 'ilp') and the time in seconds
+    of each candidate on it. A new problem gets the candidate that was fastest, on a distance-weighted
+    average, on the k reference problems of the same kind whose features are closest to its own.
+    """
+
+    def __init__(self, records: List[dict]):
+        self.records = records
+        self._points = {}
+        for kind in ("lp", "ilp"):
+            kind_records = [r for r in records if r["kind"] == kind]
+            points = np.array([_feature_point(r["features"]) for r in kind_records]).reshape(-1, len(FEATURE_NAMES))
+            self._points[kind] = (kind_records, points)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_TIMING_TABLE) -> "TimingTable":
+        with open(path) as f:
+            return cls(json.load(f)["records"])
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            json.dump({"features": list(FEATURE_NAMES), "records": self.records}, f, indent=1)
+
+    @classmethod
+    def measure(cls, problems: Iterable[ProblemInstance], repeats: int = 3) -> "TimingTable":
+        """
+        Builds a table by solving each problem with every candidate and keeping the best of 'repeats' runs.
+
+        Parameters:
+            problems (iterable): Reference problem instances.
+            repeats (int): Number of timed runs per candidate.
+
+        Returns:
+            TimingTable: The measured table.
+        """
+        from optimax.solver import Solver
+
+        records = []
+        for problem in problems:
+            features = AlgorithmSelector.features(problem)
+            if features["integer_share"] > 0:
+                kind = "ilp"
+                runs = {backend: ("branch_and_bound", backend) for backend in ILP_CANDIDATES}
+            else:
+                kind = "lp"
+                runs = {algorithm: (algorithm, "pulp") for algorithm in LP_CANDIDATES}
+            timings = {}
+            for name, (algorithm, backend) in runs.items():
+                best = math.inf
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    solution = Solver._solve_with(problem, algorithm, backend)
+                    best = min(best, time.perf_counter() - start)
+                # A candidate that fails to solve a problem the others solve should never be preferred for it
+                status = str(solution.get("status", "")).lower()
+                timings[name] = best if status not in ("not solved", "undefined") else None
+            records.append({"kind": kind, "features": features, "timings": timings})
+        return cls(records)
+
+    def best(self, kind: str, features: dict, k: int = 3) -> Optional[Tuple[str, dict]]:
+        """
+        Picks the fastest candidate for a problem from its nearest reference problems.
+
+        Parameters:
+            kind (str): 'lp' or 'ilp'.
+            features (dict): Features of the problem, as returned by AlgorithmSelector.features.
+            k (int): Number of nearest reference problems to average over.
+
+        Returns:
+            tuple: (candidate, expected seconds per candidate), or None if the table has no record of that kind.
+        """
+        kind_records, points = self._points[kind]
+        if not kind_records:
+            return None
+        distances = np.linalg.norm(points - _feature_point(features), axis=1)
+        nearest = np.argsort(distances, kind="stable")[:k]
+        # Closer problems count more, and times are compared relative to each problem's fastest
+        # candidate so that one large neighbour does not outweigh the others
+        weights = 1.0 / (distances[nearest] + 1e-3)
+        weights /= weights.sum()
+        fastest = [min((t for t in kind_records[i]["timings"].values() if t is not None), default=math.inf)
+                   for i in nearest]
+        expected = {}
+        relative = {}
+        for name in kind_records[nearest[0]]["timings"]:
+            times = [kind_records[i]["timings"].get(name) for i in nearest]
+            if any(t is None for t in times):
+                # A candidate that failed on any neighbour is ranked last
+                expected[name] = relative[name] = math.inf
+                continue
+            expected[name] = float(weights @ np.array(times))
+            relative[name] = float(weights @ (np.array(times) / np.array(fastest)))
+        return min(relative, key=relative.get), expected
+
+def _feature_point(features: dict) -> np.ndarray:
+    return np.array([math.log10(1 + features[name]) if name in LOG_FEATURES else float(features[name])
+                     for name in FEATURE_NAMES])
 
 class AlgorithmSelector:
+    # Loaded from DEFAULT_TIMING_TABLE on first use; assign a TimingTable (or None) to override it
+    timing_table = None
+    _default_loaded = False
+
     @staticmethod
     def is_zero_vector_feasible(problem: ProblemInstance) -> bool:
         """
@@ -14,46 +138,101 @@ class AlgorithmSelector:
         Returns:
             bool: True if the zero vector satisfies all constraints, False otherwise.
         """
-        # Create a zero vector of the appropriate dimension
-        x0 = np.zeros(len(problem.function_objective))
-        
-        # Check each constraint
-        for constraint in problem.constraints:
-            coefficients = np.array(constraint["coeficientes"])
-            sign = constraint["signo"]
-            rhs = constraint["valor"]
-            lhs = np.dot(coefficients, x0)
-            
-            if sign == "<=" and lhs > rhs:
-                return False
-            elif sign == ">=" and lhs < rhs:
-                return False
-            elif sign == "==" and not np.isclose(lhs, rhs, atol=1e-6):
-                return False
+        # x = 0 must lie within the variable bounds
+        if np.any(problem.lower > 0) or np.any(problem.upper < 0):
+            return False
+
+        # With x = 0 every left-hand side is zero, so only the rhs signs matter
+        b = problem.b
+        senses = problem.senses
+        if np.any(b[senses == SENSE_LE] < 0):
+            return False
+        if np.any(b[senses == SENSE_GE] > 0):
+            return False
+        if not np.allclose(b[senses == SENSE_EQ], 0, atol=1e-6):
+            return False
         return True
 
     @classmethod
-    def select_algorithm(cls, problem: ProblemInstance) -> str:
+    def features(cls, problem: ProblemInstance) -> dict:
         """
-        Selects the most appropriate algorithm based on the problem instance.
-        
-        If any variable is restricted to be integer, then Branch & Bound is used.
-        For pure LP problems, the feasibility of the zero vector is used as a heuristic:
-            - If feasible, use the Simplex method.
-            - Otherwise, use the Dual Simplex method.
-        
+        Computes the features used to compare problems, all from whole-array operations.
+
         Parameters:
             problem (ProblemInstance): The optimization problem instance.
-            
+
         Returns:
-            str: One of 'branch_and_bound', 'simplex', or 'dual_simplex'.
+            dict: 'rows', 'cols', 'nnz', 'density', 'eq_share', 'ge_share', 'integer_share'
+                and 'zero_feasible' (1.0 if the zero vector is feasible, else 0.0).
         """
-        # Check for integer variables
-        if any(problem.variables_integer):
-            return "branch_and_bound"
-        
-        # For LP problems, check the feasibility of the zero vector
-        if cls.is_zero_vector_feasible(problem):
-            return "simplex"
+        rows, cols = problem.A.shape
+        senses = problem.senses
+        return {
+            "rows": rows,
+            "cols": cols,
+            "nnz": int(problem.A.nnz),
+            "density": problem.A.nnz / (rows * cols) if rows and cols else 0.0,
+            "eq_share": float(np.mean(senses == SENSE_EQ)) if rows else 0.0,
+            "ge_share": float(np.mean(senses == SENSE_GE)) if rows else 0.0,
+            "integer_share": float(np.mean(problem.integrality)) if cols else 0.0,
+            "zero_feasible": float(cls.is_zero_vector_feasible(problem)),
+        }
+
+    @classmethod
+    def get_timing_table(cls) -> Optional[TimingTable]:
+        if cls.timing_table is None and not cls._default_loaded:
+            cls._default_loaded = True
+            if os.path.exists(DEFAULT_TIMING_TABLE):
+                cls.timing_table = TimingTable.load(DEFAULT_TIMING_TABLE)
+        return cls.timing_table
+
+    @classmethod
+    def select(cls, problem: ProblemInstance, metrics=None) -> Tuple[str, str]:
+        """
+        Selects the algorithm and the ILP backend expected to be fastest for the problem.
+
+        The problem's features are matched against the timing table; without a table (or without
+        records for the problem's kind) the zero-vector heuristic is used for LPs and PuLP for ILPs.
+        The decision and the features behind it are logged at INFO level.
+
+        Parameters:
+            problem (ProblemInstance): The optimization problem instance.
+            metrics (Metrics): Optional collector; the decision and features are recorded under 'selector'.
+
+        Returns:
+            tuple: (algorithm, backend), where algorithm is one of 'branch_and_bound', 'simplex',
+                'dual_simplex' or 'interior_point' and backend is one of 'pulp', 'highs' or 'native'.
+        """
+        features = cls.features(problem)
+        kind = "ilp" if features["integer_share"] > 0 else "lp"
+        table = cls.get_timing_table()
+        choice = table.best(kind, features) if table is not None else None
+
+        if choice is not None:
+            best, expected = choice
+            reason = "timings " + ", ".join(f"{name}={seconds * 1000:.2f}ms" for name, seconds in expected.items())
+        elif kind == "ilp":
+            best, reason = "pulp", "no timing table"
         else:
-            return "dual_simplex"
\ No newline at end of file
+            # With a feasible starting point primal simplex can start right away; otherwise dual simplex is used
+            best = "simplex" if features["zero_feasible"] else "dual_simplex"
+            reason = "zero-vector heuristic"
+
+        algorithm, backend = ("branch_and_bound", best) if kind == "ilp" else (best, "pulp")
+        logger.info("Selected %s (backend %s) by %s; features %s", algorithm, backend, reason, features)
+        if metrics is not None:
+            metrics.record("selector", {"algorithm": algorithm, "backend": backend, "reason": reason, "features": features})
+        return algorithm, backend
+
+    @classmethod
+    def select_algorithm(cls, problem: ProblemInstance) -> str:
+        """
+        Selects the most appropriate algorithm based on the problem instance (see select()).
+
+        Parameters:
+            problem (ProblemInstance): The optimization problem instance.
+
+        Returns:
+            str: One of 'branch_and_bound', 'simplex', 'dual_simplex' or 'interior_point'.
+        """
+        return cls.select(problem)[0]
\ No newline at end of file
@@ -0,0 +1,434 @@
+import collections
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import socketserver
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Modules loaded once by the fork server, so that every worker forked from it starts warm
+PRELOAD_MODULES = ["optimax.batch", "optimax.branch_and_bound", "scipy.optimize", "scipy.sparse"]
+
+WARM_UP_PROBLEM = json.dumps({
+    "objetivo": "maximizar",
+    "funcion_objetivo": [1, 1],
+    "restricciones": [{"coeficientes": [1, 2], "signo": "<=", "valor": 4}],
+    "variables_enteras": [False, False],
+})
+
+class ServiceBusy(Exception):
+    """Raised when the request queue is full."""
+
+class RequestTimeout(Exception):
+    """Raised when a request did not finish within its timeout."""
+
+class RequestCancelled(Exception):
+    """Raised when a request was cancelled before it finished."""
+
+def _worker_main(conn, cache, solve_options):
+    from optimax.batch import _init_worker, solve_problem
+
+    _init_worker(cache)
+    # Solving a tiny problem loads the selector's timing table and HiGHS before the first real request
+    solve_problem("warm-up", WARM_UP_PROBLEM)
+    try:
+        import pulp  # noqa: F401
+    except ImportError:
+        pass
+    conn.send("ready")
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        problem_id, json_input, collect_metrics = job
+        conn.send(solve_problem(problem_id, json_input, solve_options, collect_metrics))
+
+class _Worker:
+    def __init__(self, context, cache, solve_options):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, cache, solve_options), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+class SolveService:
+    """
+    Solves problems on a pool of pre-warmed worker processes that stay alive between requests.
+
+    Each worker imports the solver stack and solves a warm-up problem once, so requests never pay
+    interpreter or library start-up. Requests wait for a free worker in a bounded queue: when
+    'max_queue' requests are already waiting or running, new ones are rejected with ServiceBusy.
+    A request that exceeds its timeout or is cancelled has its worker killed and replaced, so a
+    runaway solve never keeps a worker busy.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: int = 64, timeout: float = 30.0, cache=None,
+                 solve_options: Optional[dict] = None, latency_window: int = 1000):
+        """
+        Parameters:
+            workers (int): Number of worker processes (defaults to the CPU count).
+            max_queue (int): Maximum requests waiting or running at once.
+            timeout (float): Default per-request timeout in seconds, counted from arrival.
+            cache (SolutionCache): Optional cache copied into every worker; give it a disk path to share
+                solutions between workers.
+            solve_options (dict): Extra keyword arguments for Solver.solve (e.g. backend, presolve).
+            latency_window (int): Number of recent requests used for the latency percentiles.
+        """
+        self.num_workers = workers or multiprocessing.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._cache = cache
+        self._solve_options = solve_options
+        try:
+            self._context = multiprocessing.get_context("forkserver")
+            self._context.set_forkserver_preload(PRELOAD_MODULES)
+        except ValueError:
+            self._context = multiprocessing.get_context("spawn")
+
+        self._idle = queue.Queue()
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._latencies = collections.deque(maxlen=latency_window)
+        self._counts = collections.Counter()
+        self._waiting = 0
+        self._running = 0
+        self._closed = False
+        self._started = time.monotonic()
+
+    def start(self, wait: bool = True):
+        """
+        Starts the worker processes.
+
+        Parameters:
+            wait (bool): Block until every worker has finished warming up.
+
+        Raises:
+            RuntimeError: If waiting and no worker could be started.
+        """
+        starters = [self._start_worker() for _ in range(self.num_workers)]
+        if wait:
+            for starter in starters:
+                starter.join()
+            if self._idle.empty():
+                raise RuntimeError("No worker process could be started")
+        return self
+
+    def _start_worker(self) -> threading.Thread:
+        def start():
+            try:
+                worker = _Worker(self._context, self._cache, self._solve_options)
+                ready = worker.conn.recv()
+            except Exception:
+                logger.exception("Worker process failed to start")
+                return
+            if self._closed:
+                worker.kill()
+                return
+            self._idle.put(worker)
+
+        starter = threading.Thread(target=start, name="optimax-worker-start", daemon=True)
+        starter.start()
+        return starter
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def solve(self, json_input: str, request_id: Optional[str] = None, timeout: Optional[float] = None,
+              collect_metrics: bool = False) -> dict:
+        """
+        Solves one problem on the next free worker.
+
+        Parameters:
+            json_input (str): The problem in the JSON input format.
+            request_id (str): Identifier used to cancel the request; generated when omitted.
+            timeout (float): Seconds before the request is abandoned (defaults to the service timeout).
+            collect_metrics (bool): Include per-phase metrics in the result.
+
+        Returns:
+            dict: The result of optimax.batch.solve_problem ({'id', 'algorithm', 'solution'} or {'id', 'error'}).
+
+        Raises:
+            ServiceBusy: If max_queue requests are already waiting or running.
+            RequestTimeout: If the request did not finish in time.
+            RequestCancelled: If cancel() was called for the request.
+        """
+        if self._closed or not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            raise ServiceBusy(f"{self.max_queue} requests already queued")
+        start = time.monotonic()
+        deadline = start + (self.timeout if timeout is None else timeout)
+        request_id = request_id or uuid.uuid4().hex
+        cancelled = threading.Event()
+        with self._lock:
+            duplicate = request_id in self._requests
+            if not duplicate:
+                self._requests[request_id] = cancelled
+                self._waiting += 1
+        if duplicate:
+            self._slots.release()
+            raise ValueError(f"Duplicate request id: {request_id}")
+        worker = None
+        try:
+            try:
+                worker = self._acquire_worker(deadline, cancelled)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            with self._lock:
+                self._running += 1
+            try:
+                result = self._run(worker, (request_id, json_input, collect_metrics), deadline, cancelled)
+            finally:
+                with self._lock:
+                    self._running -= 1
+            if worker.process.is_alive():
+                self._idle.put(worker)
+                worker = None
+            self._count("failed" if "error" in result else "completed")
+            with self._lock:
+                self._latencies.append(time.monotonic() - start)
+            return result
+        except RequestTimeout:
+            self._count("timeouts")
+            raise
+        except RequestCancelled:
+            self._count("cancelled")
+            raise
+        finally:
+            if worker is not None:
+                # The worker died or may still be solving an abandoned request; replace it with a fresh one
+                worker.kill()
+                if not self._closed:
+                    self._start_worker()
+            with self._lock:
+                self._requests.pop(request_id, None)
+            self._slots.release()
+
+    def _acquire_worker(self, deadline: float, cancelled: threading.Event) -> _Worker:
+        while True:
+            self._check(deadline, cancelled)
+            try:
+                return self._idle.get(timeout=min(0.05, max(deadline - time.monotonic(), 0.001)))
+            except queue.Empty:
+                continue
+
+    def _run(self, worker: _Worker, job, deadline: float, cancelled: threading.Event) -> dict:
+        worker.conn.send(job)
+        while True:
+            self._check(deadline, cancelled)
+            try:
+                if worker.conn.poll(min(0.05, max(deadline - time.monotonic(), 0.001))):
+                    return worker.conn.recv()
+            except (EOFError, OSError):
+                return {"id": job[0], "error": "Worker process died while solving"}
+            if not worker.process.is_alive() and not worker.conn.poll():
+                return {"id": job[0], "error": "Worker process died while solving"}
+
+    @staticmethod
+    def _check(deadline: float, cancelled: threading.Event):
+        if cancelled.is_set():
+            raise RequestCancelled()
+        if time.monotonic() >= deadline:
+            raise RequestTimeout()
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def cancel(self, request_id: str) -> bool:
+        """
+        Cancels a waiting or running request.
+
+        Returns:
+            bool: True if the request was found.
+        """
+        with self._lock:
+            cancelled = self._requests.get(request_id)
+        if cancelled is None:
+            return False
+        cancelled.set()
+        return True
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Queue depth (requests waiting for a worker), running and idle workers, request counts
+                and latency percentiles in milliseconds over the recent requests.
+        """
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            stats = {
+                "status": "closed" if self._closed else "ok",
+                "workers": self.num_workers,
+                "idle_workers": self._idle.qsize(),
+                "queue_depth": self._waiting,
+                "running": self._running,
+                "max_queue": self.max_queue,
+                "uptime_s": round(time.monotonic() - self._started, 3),
+            }
+            for name in ("completed", "failed", "timeouts", "cancelled", "rejected"):
+                stats[name] = self._counts[name]
+        if len(latencies):
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+            stats["latency_ms"] = {"p50": round(p50, 3), "p90": round(p90, 3), "p99": round(p99, 3),
+                                   "max": round(float(latencies.max()), 3), "samples": len(latencies)}
+        else:
+            stats["latency_ms"] = None
+        return stats
+
+    def close(self):
+        """
+        Stops accepting requests, cancels the ones in progress and shuts the workers down.
+        """
+        self._closed = True
+        with self._lock:
+            pending = list(self._requests.values())
+        for cancelled in pending:
+            cancelled.set()
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.process.join(timeout=1)
+            if worker.process.is_alive():
+                worker.kill()
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server_version = "optimax"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.info("%s %s", self.requestline, format % args)
+
+    def _send_json(self, status: int, body: dict):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if urlparse(self.path).path in ("/health", "/stats"):
+            self._send_json(200, self.server.service.stats())
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        if url.path.startswith("/cancel/"):
+            return self._cancel(url.path[len("/cancel/"):])
+        if url.path != "/solve":
+            return self._send_json(404, {"error": "Not found"})
+
+        json_input = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        request_id = params.get("id") or self.headers.get("X-Request-Id") or None
+        try:
+            timeout = float(params["timeout"]) if "timeout" in params else None
+        except ValueError:
+            return self._send_json(400, {"error": "timeout must be a number"})
+        service = self.server.service
+        try:
+            result = service.solve(json_input, request_id=request_id, timeout=timeout,
+                                   collect_metrics=params.get("metrics") in ("1", "true", "json"))
+        except ServiceBusy as e:
+            return self._send_json(503, {"id": request_id, "error": str(e)})
+        except RequestTimeout:
+            return self._send_json(504, {"id": request_id, "error": "Request timed out"})
+        except RequestCancelled:
+            return self._send_json(409, {"id": request_id, "error": "Request cancelled"})
+        except ValueError as e:
+            return self._send_json(409, {"id": request_id, "error": str(e)})
+        self._send_json(422 if "error" in result else 200, result)
+
+    def do_DELETE(self):
+        url = urlparse(self.path)
+        if url.path.startswith("/solve/"):
+            return self._cancel(url.path[len("/solve/"):])
+        self._send_json(404, {"error": "Not found"})
+
+    def _cancel(self, request_id: str):
+        if self.server.service.cancel(request_id):
+            self._send_json(200, {"id": request_id, "cancelled": True})
+        else:
+            self._send_json(404, {"id": request_id, "error": "No such request"})
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class _UnixRequestHandler(_RequestHandler):
+    def address_string(self):
+        return "unix"
+
+def make_server(service: SolveService, address: str):
+    """
+    Creates the HTTP server for a service.
+
+    Parameters:
+        service (SolveService): The (started) service.
+        address (str): 'HOST:PORT' for TCP (port 0 picks a free port) or 'unix:PATH' for a Unix socket.
+
+    Returns:
+        socketserver.BaseServer: Call serve_forever() on it; it handles requests concurrently.
+    """
+    if address.startswith("unix:"):
+        server = _UnixHTTPServer(address[len("unix:"):], _UnixRequestHandler)
+    else:
+        host, _, port = address.rpartition(":")
+        server = ThreadingHTTPServer((host or "127.0.0.1", int(port)), _RequestHandler)
+        server.daemon_threads = True
+    server.service = service
+    return server
+
+def serve(address: str, **service_options):
+    """
+    Runs the service until interrupted.
+
+    Endpoints:
+        POST /solve[?id=ID&timeout=SECONDS&metrics=1]  body: the problem JSON
+            200 result, 422 invalid problem, 503 queue full, 504 timed out, 409 cancelled
+        DELETE /solve/ID (or POST /cancel/ID)        cancels a waiting or running request
+        GET /health                                  queue depth, workers, counts and latency percentiles
+
+    Parameters:
+        address (str): 'HOST:PORT' or 'unix:PATH'.
+        service_options: Keyword arguments for SolveService.
+    """
+    with SolveService(**service_options) as service:
+        server = make_server(service, address)
+        logger.info("Serving on %s with %d workers", address, service.num_workers)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if address.startswith("unix:"):
+                os.unlink(address[len("unix:"):])
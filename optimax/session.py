@@ -0,0 +1,237 @@
+import highspy
+import numpy as np
+import scipy.sparse as sp
+from optimax.parser import ProblemInstance, SENSE_CODES, SENSE_LE, SENSE_GE
+
+INF = highspy.kHighsInf
+
+# HiGHS 'simplex_strategy' option values
+STRATEGY_AUTO = 0
+STRATEGY_DUAL = 1
+STRATEGY_PRIMAL = 4
+STRATEGY_NAMES = {STRATEGY_AUTO: "auto", STRATEGY_DUAL: "dual", STRATEGY_PRIMAL: "primal"}
+
+# HiGHS basis status codes (highspy.HighsBasisStatus)
+BASIS_LOWER = 0
+BASIS_BASIC = 1
+BASIS_UPPER = 2
+BASIS_ZERO = 3
+
+class SolverSession:
+    """
+    Keeps a HiGHS model alive across solves so that small edits can be re-optimized from the previous basis.
+
+    Typical use:
+        session = SolverSession(problem)
+        session.solve()
+        session.update_rhs([0, 3], [12.0, 4.5])
+        session.solve()  # dual simplex from the previous optimal basis
+
+    After rhs, bound or row changes the previous basis stays dual feasible, so dual simplex is used;
+    after objective-only changes it stays primal feasible, so primal simplex is used.
+    """
+
+    def __init__(self, problem: ProblemInstance):
+        self.problem = problem
+        self.num_variables = problem.num_variables
+        self._senses = problem.senses.copy()
+        self._rhs = problem.b.copy()
+        self._integer = bool(problem.integrality.any())
+        self._changes = set()
+        self._last_solution = None
+
+        self._highs = highspy.Highs()
+        self._highs.silent()
+        # Presolve would discard the basis we want to reuse
+        self._highs.setOptionValue("presolve", "off")
+        self._highs.passModel(self._build_lp(problem))
+        if self._integer:
+            columns = np.arange(self.num_variables, dtype=np.int32)
+            self._highs.changeColsIntegrality(self.num_variables, columns, problem.integrality.astype(np.uint8))
+
+    def _build_lp(self, problem: ProblemInstance):
+        A = problem.A.tocsc()
+        lower, upper = self._row_bounds(self._senses, self._rhs)
+        lp = highspy.HighsLp()
+        lp.num_col_ = problem.num_variables
+        lp.num_row_ = problem.num_constraints
+        lp.col_cost_ = problem.c.astype(float)
+        lp.col_lower_ = np.maximum(problem.lower, -INF)
+        lp.col_upper_ = np.minimum(problem.upper, INF)
+        lp.row_lower_ = lower
+        lp.row_upper_ = upper
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.start_ = A.indptr.astype(np.int32)
+        lp.a_matrix_.index_ = A.indices.astype(np.int32)
+        lp.a_matrix_.value_ = A.data.astype(float)
+        lp.sense_ = highspy.ObjSense.kMaximize if problem.objective == "maximizar" else highspy.ObjSense.kMinimize
+        return lp
+
+    @staticmethod
+    def _row_bounds(senses: np.ndarray, rhs: np.ndarray):
+        lower = np.where(senses == SENSE_LE, -INF, rhs)
+        upper = np.where(senses == SENSE_GE, INF, rhs)
+        return lower.astype(float), upper.astype(float)
+
+    @property
+    def num_constraints(self) -> int:
+        return len(self._rhs)
+
+    def update_rhs(self, rows, values):
+        """
+        Changes the right-hand side of existing constraints.
+
+        Parameters:
+            rows (array-like): Row indices to change.
+            values (array-like): New right-hand side values.
+        """
+        rows = np.asarray(rows, dtype=np.int32).ravel()
+        self._rhs[rows] = np.asarray(values, dtype=float).ravel()
+        lower, upper = self._row_bounds(self._senses[rows], self._rhs[rows])
+        self._highs.changeRowsBounds(len(rows), rows, lower, upper)
+        self._changes.add("rhs")
+
+    def update_objective(self, columns, values):
+        """
+        Changes objective coefficients.
+
+        Parameters:
+            columns (array-like): Variable indices to change.
+            values (array-like): New objective coefficients.
+        """
+        columns = np.asarray(columns, dtype=np.int32).ravel()
+        values = np.asarray(values, dtype=float).ravel()
+        self._highs.changeColsCost(len(columns), columns, values)
+        self._changes.add("objective")
+
+    def update_bounds(self, columns, lower, upper):
+        """
+        Changes variable bounds (variables start with the problem's bounds, [0, inf) for JSON input).
+
+        Parameters:
+            columns (array-like): Variable indices to change.
+            lower (array-like): New lower bounds; use -np.inf for no bound.
+            upper (array-like): New upper bounds; use np.inf for no bound.
+        """
+        columns = np.asarray(columns, dtype=np.int32).ravel()
+        lower = np.broadcast_to(np.asarray(lower, dtype=float), columns.shape).copy()
+        upper = np.broadcast_to(np.asarray(upper, dtype=float), columns.shape).copy()
+        self._highs.changeColsBounds(len(columns), columns, np.maximum(lower, -INF), np.minimum(upper, INF))
+        self._changes.add("bounds")
+
+    def add_rows(self, coefficients, signs, values) -> np.ndarray:
+        """
+        Appends constraints to the model.
+
+        Parameters:
+            coefficients: Dense 2-D array or sparse matrix with one row per new constraint.
+            signs (list): Sign of each new constraint ('<=', '>=' or '==').
+            values (array-like): Right-hand side of each new constraint.
+
+        Returns:
+            np.ndarray: Indices of the new rows.
+        """
+        rows = sp.csr_matrix(coefficients, dtype=float)
+        senses = np.array([SENSE_CODES[sign] for sign in signs], dtype=np.int8)
+        rhs = np.asarray(values, dtype=float).ravel()
+        if rows.shape[1] != self.num_variables or rows.shape[0] != len(senses) or len(senses) != len(rhs):
+            raise ValueError("Mismatch in dimensions of the added rows.")
+        first = self.num_constraints
+        lower, upper = self._row_bounds(senses, rhs)
+        self._highs.addRows(rows.shape[0], lower, upper, rows.nnz,
+                            rows.indptr[:-1].astype(np.int32), rows.indices.astype(np.int32), rows.data)
+        self._senses = np.concatenate([self._senses, senses])
+        self._rhs = np.concatenate([self._rhs, rhs])
+        self._changes.add("rows")
+        return np.arange(first, self.num_constraints)
+
+    def remove_rows(self, rows):
+        """
+        Deletes constraints; the remaining rows are renumbered consecutively.
+
+        Parameters:
+            rows (array-like): Row indices to delete.
+        """
+        rows = np.unique(np.asarray(rows, dtype=np.int32).ravel())
+        self._highs.deleteRows(len(rows), rows)
+        keep = np.ones(self.num_constraints, dtype=bool)
+        keep[rows] = False
+        self._senses = self._senses[keep]
+        self._rhs = self._rhs[keep]
+        self._changes.add("rows")
+
+    def _choose_strategy(self) -> int:
+        if not self._changes:
+            return STRATEGY_AUTO
+        if self._changes == {"objective"}:
+            return STRATEGY_PRIMAL
+        if "objective" not in self._changes:
+            return STRATEGY_DUAL
+        return STRATEGY_AUTO
+
+    def solve(self, compare_cold: bool = False) -> dict:
+        """
+        Re-optimizes the current model, starting from the previous basis when there is one.
+
+        Parameters:
+            compare_cold (bool): Also solve a fresh copy of the model from scratch and report
+                how many simplex iterations the warm start saved.
+
+        Returns:
+            dict: Solution status, optimal value and variables (when optimal), plus
+                'simplex_iterations', 'warm_start' and 'simplex_strategy'; with compare_cold,
+                also 'cold_iterations' and 'iterations_saved'.
+        """
+        strategy = self._choose_strategy()
+        warm_start = bool(self._highs.getBasis().valid)
+        if self._integer and self._last_solution is not None:
+            # MIP has no basis to reuse; the previous incumbent is offered as a starting point instead
+            solution = highspy.HighsSolution()
+            solution.col_value = self._last_solution
+            self._highs.setSolution(solution)
+            warm_start = True
+        self._highs.setOptionValue("simplex_strategy", strategy)
+        self._highs.run()
+        self._changes.clear()
+
+        info = self._highs.getInfo()
+        status = self._highs.getModelStatus()
+        result = {
+            "status": self._highs.modelStatusToString(status),
+            "simplex_iterations": int(info.simplex_iteration_count),
+            "warm_start": warm_start,
+            "simplex_strategy": STRATEGY_NAMES[strategy],
+        }
+        if status == highspy.HighsModelStatus.kOptimal:
+            variables = list(self._highs.getSolution().col_value)
+            self._last_solution = variables
+            result["optimal_value"] = info.objective_function_value
+            result["variables"] = variables
+
+        if compare_cold:
+            cold_iterations = self._cold_iterations()
+            result["cold_iterations"] = cold_iterations
+            result["iterations_saved"] = cold_iterations - result["simplex_iterations"]
+        return result
+
+    def basis(self):
+        """
+        Returns:
+            tuple: (column status, row status) of the last solve as int8 arrays of HiGHS basis codes
+                (BASIS_LOWER, BASIS_BASIC, BASIS_UPPER, BASIS_ZERO), or None when there is no valid
+                basis (integer problems, or a solve that did not finish).
+        """
+        basis = self._highs.getBasis()
+        if self._integer or not basis.valid:
+            return None
+        col_status = np.fromiter(map(int, basis.col_status), dtype=np.int8, count=self.num_variables)
+        row_status = np.fromiter(map(int, basis.row_status), dtype=np.int8, count=self.num_constraints)
+        return col_status, row_status
+
+    def _cold_iterations(self) -> int:
+        cold = highspy.Highs()
+        cold.silent()
+        cold.setOptionValue("presolve", "off")
+        cold.passModel(self._highs.getModel())
+        cold.run()
+        return int(cold.getInfo().simplex_iteration_count)
@@ -1,127 +1,180 @@
+import copy
+import os
+import tempfile
+import threading
+import time
+from typing import Callable
+
 import numpy as np
+import scipy.sparse as sp
 from scipy.optimize import linprog
-import pulp
-from optimax.parser import ProblemInstance
+from optimax.parser import ProblemInstance, SENSE_GE, SENSE_EQ, SENSE_LE
+from optimax.metrics import phase
 from optimax.utils import validate_dimensions
-from optimax.visualizer import Visualizer  # Assuming Visualizer is imported for plotting
+
+# scipy.optimize.milp status codes mapped to PuLP's status names
+MILP_STATUS = {0: "Optimal", 1: "Not Solved", 2: "Infeasible", 3: "Unbounded", 4: "Undefined"}
+
+ILP_BACKENDS = ("pulp", "highs", "native")
+
+# Seconds between reads of the CBC log while streaming incumbents
+CBC_POLL_INTERVAL = 0.05
+
+# Slack added to a heuristic incumbent's objective before it is passed as the backend's cutoff, so
+# that the incumbent itself is not cut off
+CUTOFF_TOLERANCE = 1e-6
+
+# scipy linprog method used for each LP algorithm
+LP_METHODS = {"simplex": "highs", "dual_simplex": "highs-ds", "interior_point": "highs-ipm"}
 
 class Solver:
     @staticmethod
-    def solve_lp(problem: ProblemInstance, method: str = 'highs') -> dict:
+    def build_lp(problem: ProblemInstance) -> dict:
         """
-        Solves a linear programming problem using scipy.optimize.linprog.
+        Assembles the scipy.optimize.linprog arguments for a problem.
 
         Parameters:
             problem (ProblemInstance): The problem instance.
-            method (str): The solver method. Use 'highs' for simplex and 'highs-ds' for dual simplex.
 
         Returns:
-            dict: A dictionary containing the solution status, optimal value, and variable assignments.
+            dict: Keyword arguments for linprog ('c', 'A_ub', 'b_ub', 'A_eq', 'b_eq', 'bounds').
         """
         # Adjust objective coefficients for minimization (linprog minimizes by default)
-        c = problem.function_objective[:]
+        c = problem.c
         if problem.objective == "maximizar":
-            c = [-coef for coef in c]
+            c = -c
         
-        A_ub = []
-        b_ub = []
-        A_eq = []
-        b_eq = []
+        # Select row blocks by sense; '>=' rows are converted to '<=' by negating them
+        eq = problem.senses == SENSE_EQ
+        ub = ~eq
+        row_sign = np.where(problem.senses[ub] == SENSE_GE, -1.0, 1.0)
+        A_ub = sp.diags(row_sign) @ problem.A[ub]
+        b_ub = problem.b[ub] * row_sign
+        A_eq = problem.A[eq]
+        b_eq = problem.b[eq]
         
-        for cons in problem.constraints:
-            coefs = cons["coeficientes"]
-            sign = cons["signo"]
-            rhs = cons["valor"]
-            if sign == "<=":
-                A_ub.append(coefs)
-                b_ub.append(rhs)
-            elif sign == ">=":
-                # Convert to <= by multiplying both sides by -1
-                A_ub.append([-x for x in coefs])
-                b_ub.append(-rhs)
-            elif sign == "==":
-                A_eq.append(coefs)
-                b_eq.append(rhs)
-            else:
-                raise ValueError(f"Unsupported constraint sign: {sign}")
-        
-        bounds = [(0, None) for _ in problem.function_objective]
-        
-        # Track iterations and objective values for convergence plot
-        iterations = []
-        objective_values = []
-        
-        def callback(res):
-            """
-            Callback function to track iterations and objective function values.
-            """
-            iterations.append(len(iterations) + 1)
-            if res.x is not None: 
-                objective_values.append(np.dot(c, res.x))
-
-        result = linprog(
-            c=c,
-            A_ub=A_ub if A_ub else None,
-            b_ub=b_ub if b_ub else None,
-            A_eq=A_eq if A_eq else None,
-            b_eq=b_eq if b_eq else None,
-            bounds=bounds,
-            method=method,
-            #callback=callback
-        )
+        return {
+            "c": c,
+            "A_ub": A_ub if len(b_ub) else None,
+            "b_ub": b_ub if len(b_ub) else None,
+            "A_eq": A_eq if len(b_eq) else None,
+            "b_eq": b_eq if len(b_eq) else None,
+            "bounds": np.column_stack([problem.lower, problem.upper]),
+        }
+
+    @staticmethod
+    def solve_lp(problem: ProblemInstance, method: str = 'highs', model: dict = None) -> dict:
+        """
+        Solves a linear programming problem using scipy.optimize.linprog.
+
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            method (str): The solver method. Use 'highs' for simplex, 'highs-ds' for dual simplex
+                and 'highs-ipm' for interior point.
+            model (dict): Arguments already assembled by build_lp; built from the problem when omitted.
+
+        Returns:
+            dict: A dictionary containing the solution status, optimal value, variable assignments and
+                'nit', the number of iterations HiGHS needed. HiGHS does not report its iterates; use
+                solve_revised_simplex for a convergence trace.
+        """
+        if model is None:
+            model = Solver.build_lp(problem)
+        result = linprog(**model, method=method)
 
-        
         if result.success:
             optimal_value = result.fun if problem.objective == "minimizar" else -result.fun
-            Visualizer.plot_convergence(iterations, objective_values)
             return {
                 "status": result.message,
                 "optimal_value": optimal_value,
                 "variables": result.x.tolist(),
-                "iterations": iterations,
-                "objective_values": objective_values
+                "nit": int(result.nit),
             }
         else:
             return {"status": result.message}
-    
+
     @staticmethod
-    def solve_ilp(problem: ProblemInstance) -> dict:
+    def solve_revised_simplex(problem: ProblemInstance, method: str = "primal", pricing: str = "steepest_edge") -> dict:
         """
-        Solves an Integer Linear Programming (ILP) problem using PuLP, which employs Branch & Bound.
+        Solves a linear programming problem with the built-in NumPy revised simplex, which records
+        the objective value after every iteration.
 
         Parameters:
             problem (ProblemInstance): The problem instance.
+            method (str): 'primal' or 'dual'.
+            pricing (str): 'dantzig' or 'steepest_edge'.
 
         Returns:
-            dict: A dictionary containing the solution status, optimal value, and variable assignments.
+            dict: A dictionary containing the solution status, optimal value, variable assignments, 'nit'
+                and the 'iterations' and 'objective_values' of the convergence graph.
+        """
+        from optimax.revised_simplex import RevisedSimplex
+        return RevisedSimplex(problem, method=method, pricing=pricing).solve()
+
+    @staticmethod
+    def build_ilp(problem: ProblemInstance):
+        """
+        Assembles the PuLP model for a problem.
+
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+
+        Returns:
+            tuple: (pulp.LpProblem, list of its pulp.LpVariable in variable order).
         """
+        # PuLP is imported here so that pure LP solves never load it
+        import pulp
+
         sense = pulp.LpMaximize if problem.objective == "maximizar" else pulp.LpMinimize
         prob = pulp.LpProblem("ILP_Problem", sense)
         
-        variables = []
-        for i, is_int in enumerate(problem.variables_integer):
-            if is_int:
-                var = pulp.LpVariable(f"x_{i}", lowBound=0, cat=pulp.LpInteger)
-            else:
-                var = pulp.LpVariable(f"x_{i}", lowBound=0, cat=pulp.LpContinuous)
-            variables.append(var)
-        
-        prob += pulp.lpSum([coef * var for coef, var in zip(problem.function_objective, variables)])
+        # PuLP uses None for a missing bound
+        lower = [None if np.isinf(v) else v for v in problem.lower.tolist()]
+        upper = [None if np.isinf(v) else v for v in problem.upper.tolist()]
+        variables = [
+            pulp.LpVariable(f"x_{i}", lowBound=lower[i], upBound=upper[i], cat=pulp.LpInteger if is_int else pulp.LpContinuous)
+            for i, is_int in enumerate(problem.integrality)
+        ]
         
-        for cons in problem.constraints:
-            coefs = cons["coeficientes"]
-            sign = cons["signo"]
-            rhs = cons["valor"]
-            expr = pulp.lpSum([coef * var for coef, var in zip(coefs, variables)])
-            if sign == "<=":
-                prob += (expr <= rhs)
-            elif sign == ">=":
-                prob += (expr >= rhs)
-            elif sign == "==":
-                prob += (expr == rhs)
-            else:
-                raise ValueError(f"Unsupported constraint sign: {sign}")
+        prob += pulp.LpAffineExpression(zip(variables, problem.c.tolist()))
         
+        # Add each block of rows with the PuLP sense matching its sense code,
+        # building terms only for the stored nonzeros of each CSR row
+        pulp_senses = {SENSE_LE: pulp.LpConstraintLE, SENSE_GE: pulp.LpConstraintGE, SENSE_EQ: pulp.LpConstraintEQ}
+        for code, pulp_sense in pulp_senses.items():
+            mask = problem.senses == code
+            block = problem.A[mask]
+            indptr = block.indptr
+            indices = block.indices.tolist()
+            data = block.data.tolist()
+            for i, rhs in enumerate(problem.b[mask].tolist()):
+                start, end = indptr[i], indptr[i + 1]
+                expr = pulp.LpAffineExpression(zip([variables[j] for j in indices[start:end]], data[start:end]))
+                prob += pulp.LpConstraint(expr, sense=pulp_sense, rhs=rhs)
+        return prob, variables
+
+    @staticmethod
+    def solve_ilp(problem: ProblemInstance, model=None, limits=None, incumbent=None) -> dict:
+        """
+        Solves an Integer Linear Programming (ILP) problem using PuLP, which employs Branch & Bound.
+
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            model (tuple): Model already assembled by build_ilp; built from the problem when omitted.
+            limits (SolveLimits): Optional time, node and gap limits and incumbent callback, passed to CBC.
+            incumbent (array-like): Optional feasible solution, e.g. from PrimalHeuristics. CBC starts
+                from it and cuts off every node that cannot beat it.
+
+        Returns:
+            dict: A dictionary containing the solution status, optimal value, and variable assignments.
+                With limits or an incumbent, also 'bound', 'gap', 'nodes' and 'limit' (see SolveLimits).
+        """
+        import pulp
+
+        prob, variables = model if model is not None else Solver.build_ilp(problem)
+        if limits is not None or incumbent is not None:
+            from optimax.limits import SolveLimits
+            return Solver._solve_cbc_limited(problem, prob, variables, limits or SolveLimits(), incumbent)
         result_status = prob.solve()
         
         branch_tree_data = []
@@ -136,26 +189,409 @@ class Solver:
             }
         else:
             return {"status": pulp.LpStatus[result_status]}
-    
+
+    @staticmethod
+    def _cutoff(problem: ProblemInstance, incumbent) -> float:
+        # Objective of the incumbent in minimization form, plus CUTOFF_TOLERANCE
+        value = float(problem.c @ np.asarray(incumbent, dtype=float))
+        if problem.objective == "maximizar":
+            value = -value
+        return value + CUTOFF_TOLERANCE * max(1.0, abs(value))
+
+    @staticmethod
+    def _solve_cbc_limited(problem: ProblemInstance, prob, variables, limits, incumbent=None) -> dict:
+        import pulp
+        from optimax.limits import CbcLog, relative_gap
+
+        fd, log_path = tempfile.mkstemp(suffix="-cbc.log")
+        os.close(fd)
+        options = []
+        if incumbent is not None:
+            for variable, value in zip(variables, incumbent):
+                variable.setInitialValue(value)
+            # CBC reads the cutoff in minimization form
+            options.append(f"cutoff {Solver._cutoff(problem, incumbent)!r}")
+        solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=limits.time_limit, gapRel=limits.gap_rel, gapAbs=limits.gap_abs,
+                                   maxNodes=limits.node_limit, logPath=log_path, warmStart=incumbent is not None,
+                                   options=options)
+        log = CbcLog(problem.objective == "maximizar", limits, time.perf_counter())
+        errors = []
+        worker = None
+        try:
+            if limits.on_incumbent is None:
+                prob.solve(solver)
+            else:
+                # CBC runs in a subprocess; the solve waits on it in a worker thread while this one follows the log
+                def run():
+                    try:
+                        prob.solve(solver)
+                    except Exception as error:
+                        errors.append(error)
+                worker = threading.Thread(target=run, daemon=True)
+                worker.start()
+            with open(log_path) as f:
+                while worker is not None and worker.is_alive():
+                    worker.join(CBC_POLL_INTERVAL)
+                    log.feed(f.read())
+                log.feed(f.read())
+            log.close()
+        finally:
+            os.remove(log_path)
+        if errors:
+            raise errors[0]
+
+        solution = {"status": pulp.LpStatus[prob.status]}
+        if prob.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+            solution["optimal_value"] = pulp.value(prob.objective)
+            solution["variables"] = [pulp.value(v) for v in variables]
+            solution["branch_tree_data"] = []
+            if log.limit is not None:
+                # PuLP reports a run stopped on a limit with a solution as 'Optimal'
+                solution["status"] = "Feasible"
+            if log.bound is None and log.limit is None:
+                log.bound = solution["optimal_value"]
+        elif log.limit is not None:
+            solution["status"] = "Not Solved"
+        if log.limit is not None:
+            solution["limit"] = log.limit
+        if log.bound is not None:
+            solution["bound"] = log.bound
+            solution["gap"] = relative_gap(solution.get("optimal_value"), log.bound)
+        if log.nodes is not None:
+            solution["nodes"] = log.nodes
+        return solution
+
+    @staticmethod
+    def build_milp(problem: ProblemInstance) -> dict:
+        """
+        Assembles the scipy.optimize.milp arguments for a problem.
+
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+
+        Returns:
+            dict: Keyword arguments for milp ('c', 'constraints', 'integrality', 'bounds').
+
+        Raises:
+            ImportError: If the installed SciPy has no scipy.optimize.milp (SciPy < 1.9).
+        """
+        from scipy.optimize import Bounds, LinearConstraint
+
+        c = -problem.c if problem.objective == "maximizar" else problem.c
+        constraints = None
+        if problem.num_constraints:
+            lower = np.where(problem.senses == SENSE_LE, -np.inf, problem.b)
+            upper = np.where(problem.senses == SENSE_GE, np.inf, problem.b)
+            constraints = LinearConstraint(problem.A, lower, upper)
+        return {
+            "c": c,
+            "constraints": constraints,
+            "integrality": problem.integrality.astype(np.uint8),
+            "bounds": Bounds(problem.lower, problem.upper),
+        }
+
+    @staticmethod
+    def solve_milp(problem: ProblemInstance, model: dict = None, limits=None, incumbent=None) -> dict:
+        """
+        Solves an Integer Linear Programming (ILP) problem in-process with HiGHS through scipy.optimize.milp.
+        Unlike solve_ilp, no model file is written and no solver subprocess is started.
+
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            model (dict): Arguments already assembled by build_milp; built from the problem when omitted.
+            limits (SolveLimits): Optional time, node and gap limits and incumbent callback. milp has no
+                absolute gap and no callback, so limited solves call HiGHS through highspy instead.
+            incumbent (array-like): Optional feasible solution, e.g. from PrimalHeuristics. HiGHS starts
+                from it and uses its objective as a cutoff; this also goes through highspy.
+
+        Returns:
+            dict: A dictionary containing the solution status, optimal value, and variable assignments.
+                Status strings follow PuLP's ('Optimal', 'Infeasible', 'Unbounded', 'Not Solved', 'Undefined').
+                With limits or an incumbent, also 'bound', 'gap' and 'limit' (see SolveLimits).
+
+        Raises:
+            ImportError: If the installed SciPy has no scipy.optimize.milp (SciPy < 1.9).
+        """
+        from scipy.optimize import milp
+
+        if limits is not None or incumbent is not None:
+            from optimax.limits import SolveLimits
+            return Solver._solve_highs_limited(problem, limits or SolveLimits(), incumbent)
+        if model is None:
+            model = Solver.build_milp(problem)
+        result = milp(**model)
+
+        status = MILP_STATUS.get(result.status, "Undefined")
+        if status == "Optimal":
+            optimal_value = result.fun if problem.objective == "minimizar" else -result.fun
+            variables = result.x.copy()
+            variables[problem.integrality] = np.round(variables[problem.integrality])
+            return {
+                "status": status,
+                "optimal_value": optimal_value,
+                "variables": variables.tolist(),
+                "nodes": getattr(result, "mip_node_count", None),
+                "branch_tree_data": []
+            }
+        else:
+            return {"status": status}
+
+    @staticmethod
+    def _solve_highs_limited(problem: ProblemInstance, limits, incumbent=None) -> dict:
+        import highspy
+        from optimax.limits import relative_gap
+
+        inf = highspy.kHighsInf
+        A = problem.A.tocsc()
+        row_lower = np.where(problem.senses == SENSE_LE, -inf, problem.b).astype(float)
+        row_upper = np.where(problem.senses == SENSE_GE, inf, problem.b).astype(float)
+        maximize = problem.objective == "maximizar"
+        highs = highspy.Highs()
+        highs.silent()
+        highs.passModel(
+            problem.num_variables, problem.num_constraints, A.nnz, highspy.MatrixFormat.kColwise,
+            highspy.ObjSense.kMaximize if maximize else highspy.ObjSense.kMinimize, 0.0, problem.c.astype(float),
+            np.maximum(problem.lower, -inf), np.minimum(problem.upper, inf), row_lower, row_upper,
+            A.indptr.astype(np.int32), A.indices.astype(np.int32), A.data.astype(float), problem.integrality.astype(np.int32),
+        )
+        for option, value in (("time_limit", limits.time_limit), ("mip_rel_gap", limits.gap_rel),
+                              ("mip_abs_gap", limits.gap_abs), ("mip_max_nodes", limits.node_limit)):
+            if value is not None:
+                highs.setOptionValue(option, value)
+        if incumbent is not None:
+            start_solution = highspy.HighsSolution()
+            start_solution.col_value = np.asarray(incumbent, dtype=float)
+            start_solution.value_valid = True
+            highs.setSolution(start_solution)
+            # Like CBC, HiGHS reads objective_bound in minimization form
+            highs.setOptionValue("objective_bound", Solver._cutoff(problem, incumbent))
+        start = time.perf_counter()
+        if limits.on_incumbent is not None:
+            def improving(event):
+                data = event.data_out
+                limits.report(start, data.objective_function_value, data.mip_dual_bound,
+                              variables=np.asarray(data.mip_solution).tolist(), elapsed=data.running_time)
+            highs.cbMipImprovingSolution.subscribe(improving)
+        highs.run()
+
+        model_status = highs.getModelStatus()
+        info = highs.getInfo()
+        statuses = highspy.HighsModelStatus
+        limit = {statuses.kTimeLimit: "time_limit", statuses.kSolutionLimit: "node_limit"}.get(model_status)
+        if model_status == statuses.kOptimal:
+            status = "Optimal"
+        elif model_status == statuses.kInfeasible:
+            status = "Infeasible"
+        elif model_status in (statuses.kUnbounded, statuses.kUnboundedOrInfeasible):
+            status = "Unbounded"
+        elif limit is not None:
+            status = "Feasible" if highs.getSolution().value_valid else "Not Solved"
+        else:
+            status = "Undefined"
+
+        solution = {"status": status, "nodes": int(info.mip_node_count)}
+        if status in ("Optimal", "Feasible"):
+            variables = np.array(highs.getSolution().col_value)
+            variables[problem.integrality] = np.round(variables[problem.integrality])
+            solution["optimal_value"] = info.objective_function_value
+            solution["variables"] = variables.tolist()
+            solution["branch_tree_data"] = []
+        if limit is not None:
+            solution["limit"] = limit
+        if np.isfinite(info.mip_dual_bound):
+            solution["bound"] = info.mip_dual_bound
+            solution["gap"] = relative_gap(solution.get("optimal_value"), info.mip_dual_bound)
+        return solution
+
+    @staticmethod
+    def solve_bnb(problem: ProblemInstance, node_selection: str = "best_bound", branching: str = "most_fractional",
+                  recorder=None, limits=None) -> dict:
+        """
+        Solves an Integer Linear Programming (ILP) problem with the built-in Branch & Bound engine,
+        which solves LP relaxations with HiGHS and records the explored tree.
+
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            node_selection (str): 'best_bound' or 'depth_first'.
+            branching (str): 'most_fractional' or 'pseudo_cost'.
+            recorder (TreeRecorder): Optional sink that streams the explored nodes (see optimax.tree).
+            limits (SolveLimits): Optional time, node and gap limits and incumbent callback.
+
+        Returns:
+            dict: A dictionary containing the solution status, optimal value, variable assignments,
+                bound, gap and branch_tree_data (tree_summary when a recorder is given).
+        """
+        from optimax.branch_and_bound import BranchAndBound
+        return BranchAndBound(problem, node_selection=node_selection, branching=branching, recorder=recorder,
+                              limits=limits).solve()
+
     @classmethod
-    def solve(cls, problem: ProblemInstance, algorithm: str) -> dict:
+    def solve(cls, problem: ProblemInstance, algorithm: str, cache=None, backend: str = "pulp", presolve: bool = False,
+              metrics=None, recorder=None, limits=None, heuristics: bool = False) -> dict:
         """
         Main method to solve a problem instance using the selected algorithm.
 
         Parameters:
             problem (ProblemInstance): The problem instance.
-            algorithm (str): One of 'simplex', 'dual_simplex', or 'branch_and_bound'.
+            algorithm (str): One of 'simplex', 'dual_simplex', 'interior_point', 'revised_simplex' (the
+                built-in engine, which traces the objective per iteration) or 'branch_and_bound'.
+            cache (SolutionCache): Optional cache; equivalent problems solved before with the same
+                algorithm, backend, presolve and heuristics are returned from it.
+            backend (str): Engine for 'branch_and_bound': 'pulp' (CBC), 'highs' (in-process HiGHS MILP,
+                falling back to PuLP if unavailable or if HiGHS fails) or 'native' (built-in Branch & Bound).
+            presolve (bool): Reduce the problem before solving and map the solution back afterwards;
+                the reduction summary is returned under 'presolve'.
+            metrics (Metrics): Optional collector for the 'solve.*' phase timings, problem size,
+                backend iterations and cache or presolve statistics.
+            recorder (TreeRecorder): Optional sink for the node events of the 'native' backend.
+            limits (SolveLimits): Optional time, node and gap limits and incumbent callback for
+                'branch_and_bound'. With any time, node or gap limit the cache is neither read nor
+                filled, since a gap tolerance makes even 'Optimal' answers inexact. Neither is it for
+                'revised_simplex' or with a recorder, whose trace and node events only a new solve produces.
+            heuristics (bool): Run primal heuristics (see optimax.heuristics) for 'branch_and_bound' and
+                give the best solution they find to the backend as a starting incumbent and cutoff;
+                their summary is returned under 'heuristics'.
 
         Returns:
             dict: The solution as returned by the appropriate solver.
         """
         if validate_dimensions(problem):
-            if algorithm in ["simplex", "dual_simplex"]:
-                method = "highs" if algorithm == "simplex" else "highs-ds"
-                return cls.solve_lp(problem, method=method)
-            elif algorithm == "branch_and_bound":
-                return cls.solve_ilp(problem)
+            # Limits can make answers inexact, and a cached answer cannot replay what the built-in
+            # simplex and a tree recorder exist for: the per-iteration trace and the streamed nodes
+            if (limits is not None and limits.active) or algorithm == "revised_simplex" or recorder is not None:
+                cache = None
+            if metrics is not None:
+                metrics.record("problem", {"rows": problem.num_constraints, "cols": problem.num_variables,
+                                           "nnz": int(problem.A.nnz), "integer_vars": int(problem.integrality.sum())})
+            if cache is not None:
+                with phase(metrics, "solve.cache_lookup"):
+                    key = cache.key_for(problem, {
+                        "algorithm": algorithm,
+                        "backend": backend if algorithm == "branch_and_bound" else None,
+                        "presolve": presolve,
+                        "heuristics": heuristics and algorithm == "branch_and_bound",
+                    })
+                    cached = cache.get(key)
+                if metrics is not None:
+                    metrics.record("cache", dict(cache.stats(), hit=cached is not None))
+                if cached is not None:
+                    return cached
+
+            if presolve:
+                from optimax.presolve import presolve as presolve_problem
+                with phase(metrics, "solve.presolve"):
+                    presolved = presolve_problem(problem)
+                if presolved.status is not None:
+                    solution = {"status": presolved.status}
+                elif presolved.reduced.num_variables == 0:
+                    # Every variable was fixed by presolve
+                    solution = presolved.postsolve({"status": "Optimal", "variables": []})
+                else:
+                    reduced_limits = limits
+                    if limits is not None and limits.on_incumbent is not None:
+                        reduced_limits = copy.copy(limits)
+                        reduced_limits.on_incumbent = lambda event: limits.on_incumbent(presolved.postsolve_incumbent(event))
+                    reduced_solution = cls._solve_with(presolved.reduced, algorithm, backend, metrics, recorder, reduced_limits,
+                                                       heuristics)
+                    with phase(metrics, "solve.postsolve"):
+                        solution = presolved.postsolve(reduced_solution)
+                solution["presolve"] = presolved.summary
+                if metrics is not None:
+                    metrics.record("presolve", presolved.summary)
             else:
-                raise ValueError(f"Unsupported algorithm type: {algorithm}")
+                solution = cls._solve_with(problem, algorithm, backend, metrics, recorder, limits, heuristics)
+
+            if metrics is not None:
+                metrics.record("solver", {
+                    "algorithm": algorithm,
+                    "backend": backend if algorithm == "branch_and_bound" else LP_METHODS.get(algorithm, "native"),
+                    "status": str(solution.get("status")),
+                    "iterations": solution.get("nit"),
+                    "nodes": solution.get("nodes"),
+                })
+            # A search stopped early, e.g. by a failed LP relaxation, is not worth reusing
+            if cache is not None and "limit" not in solution:
+                with phase(metrics, "solve.cache_store"):
+                    cache.put(key, solution)
+            return solution
         else:
             print("Check the dimensions of your problem again.")
+
+    @classmethod
+    def assemble(cls, problem: ProblemInstance, algorithm: str, backend: str = "pulp", recorder=None,
+                 limits=None, heuristics: bool = False) -> Callable[[], dict]:
+        """
+        Builds the model of the backend that will solve the problem, without solving it yet.
+
+        Parameters:
+            problem (ProblemInstance): The problem instance.
+            algorithm (str): One of 'simplex', 'dual_simplex', 'interior_point', 'revised_simplex' or
+                'branch_and_bound'.
+            backend (str): Engine for 'branch_and_bound' (see solve()).
+            recorder (TreeRecorder): Optional sink for the node events of the 'native' backend.
+            limits (SolveLimits): Optional limits for the 'branch_and_bound' backends.
+            heuristics (bool): Run primal heuristics for 'branch_and_bound': the 'native' backend runs
+                them at its root and periodically during the search, 'pulp' and 'highs' beforehand,
+                starting from their incumbent with its objective as cutoff.
+
+        Returns:
+            callable: Runs the backend on the assembled model and returns the solution.
+        """
+        if algorithm in LP_METHODS:
+            model = cls.build_lp(problem)
+            return lambda: cls.solve_lp(problem, method=LP_METHODS[algorithm], model=model)
+        elif algorithm == "revised_simplex":
+            return lambda: cls.solve_revised_simplex(problem)
+        elif algorithm == "branch_and_bound":
+            if backend == "pulp":
+                model = cls.build_ilp(problem)
+
+                def run(incumbent=None, limits=limits):
+                    return cls.solve_ilp(problem, model=model, limits=limits, incumbent=incumbent)
+            elif backend == "highs":
+                try:
+                    model = cls.build_milp(problem)
+                except ImportError:
+                    model = None
+
+                def run(incumbent=None, limits=limits):
+                    try:
+                        solution = cls.solve_milp(problem, model=model, limits=limits, incumbent=incumbent) if model is not None else {"status": "Undefined"}
+                    except ImportError:
+                        solution = {"status": "Undefined"}
+                    if solution["status"] == "Undefined":
+                        solution = cls.solve_ilp(problem, limits=limits, incumbent=incumbent)
+                    return solution
+            elif backend == "native":
+                from optimax.branch_and_bound import BranchAndBound
+                if heuristics:
+                    from optimax.heuristics import PrimalHeuristics
+                    return BranchAndBound(problem, recorder=recorder, limits=limits,
+                                          heuristics=PrimalHeuristics(problem, limits=limits)).solve
+                return BranchAndBound(problem, recorder=recorder, limits=limits).solve
+            else:
+                raise ValueError(f"Unsupported backend: {backend}")
+            if not heuristics:
+                return run
+
+            def run_with_heuristics():
+                from optimax.heuristics import PrimalHeuristics
+                primal = PrimalHeuristics(problem, limits=limits)
+                incumbent = primal.run()
+                backend_limits = limits
+                if limits is not None and limits.time_limit is not None:
+                    # The heuristics' time counts against the time limit
+                    backend_limits = copy.copy(limits)
+                    backend_limits.time_limit = max(limits.time_limit - primal.summary()["time"], 0.0)
+                return primal.merge(run(incumbent, backend_limits))
+            return run_with_heuristics
+        else:
+            raise ValueError(f"Unsupported algorithm type: {algorithm}")
+
+    @classmethod
+    def _solve_with(cls, problem: ProblemInstance, algorithm: str, backend: str, metrics=None, recorder=None,
+                    limits=None, heuristics: bool = False) -> dict:
+        with phase(metrics, "solve.assembly"):
+            run = cls.assemble(problem, algorithm, backend, recorder, limits, heuristics)
+        with phase(metrics, "solve.backend"):
+            return run()
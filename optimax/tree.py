@@ -0,0 +1,263 @@
+"""
+Branch & Bound search trees at any size.
+
+TreeRecorder receives one event per processed node. It appends the events to a JSONL or DOT file
+while the search runs and keeps only bounded summaries in memory: node counts per depth and
+status, a down-sampled bound/incumbent timeline, and the top of the tree up to max_nodes nodes.
+Every node past that limit is counted against its nearest kept ancestor instead of being stored.
+
+collapse_fathomed and layout_tree prepare the kept nodes for Visualizer.plot_branch_and_bound_tree.
+"""
+import json
+import math
+import os
+import time
+from typing import Optional
+
+STREAM_FORMATS = ("jsonl", "dot")
+# Node fill colors by status, shared by DOT streams and Visualizer.plot_branch_and_bound_tree
+NODE_COLORS = {"branched": "lightblue", "integer": "palegreen", "pruned": "lightgray", "infeasible": "salmon",
+               "unbounded": "orange", "failed": "red"}
+
+def _finite(value) -> Optional[float]:
+    return float(value) if value is not None and math.isfinite(value) else None
+
+class TreeRecorder:
+    """
+    Streams Branch & Bound node events and keeps bounded summaries of the search.
+
+    Each event is the node record used by 'branch_tree_data' ('node_id', 'parent_id', 'depth',
+    'branch_decision', 'objective_value', 'status'). JSONL lines add 'time' (seconds since the
+    recorder was created), 'bound' and 'incumbent', both in the problem's own objective sense.
+
+    Memory stays bounded: at most max_nodes node records, max_points timeline points (the sampling
+    stride doubles whenever the timeline fills up) and one counter per depth and status. Nodes
+    that are not kept add to the 'hidden' count of their nearest kept ancestor ('hidden_integer'
+    for the ones that found an integer solution).
+    """
+
+    def __init__(self, path: str = None, format: str = None, max_nodes: int = 2000, max_depth: int = None,
+                 max_points: int = 1000):
+        """
+        Parameters:
+            path (str): File the events are appended to while the search runs; None keeps only the summaries.
+            format (str): 'jsonl' or 'dot'; by default '.dot' and '.gv' files are DOT and anything else JSONL.
+            max_nodes (int): Maximum node records kept for rendering (the top of the tree).
+            max_depth (int): Deepest level kept for rendering; None keeps any depth within max_nodes.
+            max_points (int): Maximum points of the bound/incumbent timeline.
+        """
+        if format is None:
+            format = "dot" if path and os.path.splitext(path)[1].lower() in (".dot", ".gv") else "jsonl"
+        if format not in STREAM_FORMATS:
+            raise ValueError(f"Unsupported tree stream format: {format}")
+        self.path = path
+        self.format = format
+        self.max_nodes = max(1, max_nodes)
+        self.max_depth = max_depth
+        self.max_points = max(2, max_points)
+
+        self.count = 0
+        self.status_counts = {}
+        self.depth_counts = {}
+        self.nodes = []
+        self.timeline = {"time": [], "nodes": [], "bound": [], "incumbent": []}
+        self._kept = {}
+        # Anchors of unkept branched nodes whose children have not all been seen: node_id -> [anchor, children left]
+        self._anchors = {}
+        self._stride = 1
+        self._last = None
+        self._start = time.perf_counter()
+        self._file = open(path, "w") if path else None
+        if self._file is not None and format == "dot":
+            self._file.write("digraph branch_and_bound {\n  node [shape=box, style=filled];\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @classmethod
+    def from_records(cls, records, **kwargs) -> "TreeRecorder":
+        """
+        Builds the summaries of an already explored tree, e.g. a 'branch_tree_data' list.
+        Records must come in processing order (every parent before its children).
+        """
+        recorder = cls(**kwargs)
+        for record in records:
+            recorder.add(record)
+        recorder.close()
+        return recorder
+
+    def add(self, record: dict, bound: float = None, incumbent: float = None):
+        """
+        Records one processed node.
+
+        Parameters:
+            record (dict): The node record.
+            bound (float): Best bound of the whole search after this node, if known.
+            incumbent (float): Objective value of the best solution found so far, if any.
+        """
+        self.count += 1
+        elapsed = time.perf_counter() - self._start
+        status = record.get("status", "branched")
+        depth = record.get("depth", 0)
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        per_depth = self.depth_counts.setdefault(status, [])
+        if len(per_depth) <= depth:
+            per_depth.extend([0] * (depth + 1 - len(per_depth)))
+        per_depth[depth] += 1
+
+        if self._file is not None:
+            self._write(record, elapsed, bound, incumbent)
+        self._keep_or_fold(record, status, depth)
+
+        self._last = (elapsed, self.count, _finite(bound), _finite(incumbent))
+        if (self.count - 1) % self._stride == 0:
+            self._append_point(self._last)
+
+    def _write(self, record: dict, elapsed: float, bound, incumbent):
+        if self.format == "jsonl":
+            event = dict(record, time=round(elapsed, 6), bound=_finite(bound), incumbent=_finite(incumbent))
+            self._file.write(json.dumps(event) + "\n")
+            return
+        node_id, parent_id = record["node_id"], record.get("parent_id")
+        value = record.get("objective_value")
+        value = "N/A" if value is None else f"{value:.6g}"
+        label = f"{node_id}\\n{record.get('branch_decision', '')}\\nZ={value}".replace('"', "'")
+        color = NODE_COLORS.get(record.get("status"), "white")
+        self._file.write(f'  n{node_id} [label="{label}", fillcolor={color}];\n')
+        if parent_id is not None:
+            self._file.write(f"  n{parent_id} -> n{node_id};\n")
+
+    def _keep_or_fold(self, record: dict, status: str, depth: int):
+        node_id, parent_id = record["node_id"], record.get("parent_id")
+        parent_kept = parent_id is None or parent_id in self._kept
+        if parent_kept:
+            anchor = parent_id
+        else:
+            anchor, left = self._anchors.get(parent_id, (None, 0))
+            if left <= 1:
+                self._anchors.pop(parent_id, None)
+            else:
+                self._anchors[parent_id][1] = left - 1
+        keep = parent_kept and len(self.nodes) < self.max_nodes and (self.max_depth is None or depth <= self.max_depth)
+        if keep:
+            self._kept[node_id] = len(self.nodes)
+            self.nodes.append(dict(record, hidden=0, hidden_integer=0))
+            return
+        if anchor is None:
+            return
+        kept = self.nodes[self._kept[anchor]]
+        kept["hidden"] += 1
+        kept["hidden_integer"] += status == "integer"
+        if status == "branched":
+            self._anchors[node_id] = [anchor, 2]
+
+    def _append_point(self, point):
+        for key, value in zip(("time", "nodes", "bound", "incumbent"), point):
+            self.timeline[key].append(value)
+        if len(self.timeline["time"]) >= self.max_points:
+            for key in self.timeline:
+                self.timeline[key] = self.timeline[key][::2]
+            self._stride *= 2
+
+    def close(self):
+        """
+        Adds the final timeline point and finishes the stream file.
+        """
+        if self._last is not None and (not self.timeline["nodes"] or self.timeline["nodes"][-1] != self._last[1]):
+            self._append_point(self._last)
+        if self._file is not None:
+            if self.format == "dot":
+                self._file.write("}\n")
+            self._file.close()
+            self._file = None
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: 'nodes' (total processed), 'status_counts', 'nodes_per_depth' ({status: count per depth}),
+                'timeline' ({'time', 'nodes', 'bound', 'incumbent'} lists, None where unknown) and
+                'tree' (the kept node records). Everything is JSON-serializable.
+        """
+        depth = max((len(counts) for counts in self.depth_counts.values()), default=0)
+        return {
+            "nodes": self.count,
+            "status_counts": dict(self.status_counts),
+            "nodes_per_depth": {status: counts + [0] * (depth - len(counts)) for status, counts in self.depth_counts.items()},
+            "timeline": {key: list(values) for key, values in self.timeline.items()},
+            "tree": [dict(node) for node in self.nodes],
+        }
+
+def _children(nodes) -> dict:
+    children = {}
+    for node in nodes:
+        if node.get("parent_id") is not None:
+            children.setdefault(node["parent_id"], []).append(node["node_id"])
+    return children
+
+def collapse_fathomed(nodes: list, min_size: int = 3) -> list:
+    """
+    Replaces every subtree of at least min_size nodes (counting hidden ones) that never found an
+    integer solution by its root, marked with 'collapsed' = the subtree size. The search path to
+    every incumbent stays visible.
+
+    Parameters:
+        nodes (list): Node records in processing order, as kept by TreeRecorder.
+
+    Returns:
+        list: The remaining node records (copies of the collapsed roots).
+    """
+    by_id = {node["node_id"]: node for node in nodes}
+    children = _children(nodes)
+    size, integer = {}, {}
+    # Children are processed after their parents, so the reversed list visits them first
+    for node in reversed(nodes):
+        node_id = node["node_id"]
+        kids = [kid for kid in children.get(node_id, ()) if kid in by_id]
+        size[node_id] = 1 + node.get("hidden", 0) + sum(size[kid] for kid in kids)
+        integer[node_id] = (node.get("status") == "integer" or node.get("hidden_integer", 0) > 0
+                            or any(integer[kid] for kid in kids))
+
+    result, removed = [], set()
+    for node in nodes:
+        node_id, parent_id = node["node_id"], node.get("parent_id")
+        if parent_id in removed:
+            removed.add(node_id)
+            continue
+        if parent_id is not None and node_id in children and not integer[node_id] and size[node_id] >= min_size:
+            node = dict(node, collapsed=size[node_id])
+            removed.add(node_id)
+        result.append(node)
+    return result
+
+def layout_tree(nodes: list) -> dict:
+    """
+    Places a tree for drawing in O(n): leaves get consecutive x positions in depth-first order,
+    every parent is centred over its children and y is minus the depth.
+
+    Returns:
+        dict: node_id -> (x, y).
+    """
+    by_id = {node["node_id"]: node for node in nodes}
+    children = _children(nodes)
+    roots = [node["node_id"] for node in nodes if node.get("parent_id") not in by_id]
+    order = []
+    stack = list(reversed(roots))
+    while stack:
+        node_id = stack.pop()
+        order.append(node_id)
+        stack.extend(sorted((kid for kid in children.get(node_id, ()) if kid in by_id), reverse=True))
+
+    x = {}
+    next_leaf = 0
+    for node_id in order:
+        if not any(kid in by_id for kid in children.get(node_id, ())):
+            x[node_id] = next_leaf
+            next_leaf += 1
+    for node_id in reversed(order):
+        if node_id not in x:
+            placed = [x[kid] for kid in children[node_id] if kid in by_id]
+            x[node_id] = (min(placed) + max(placed)) / 2
+    return {node_id: (x[node_id], -by_id[node_id].get("depth", 0)) for node_id in order}
@@ -5,10 +5,10 @@ def validate_dimensions(problem_instance):
     Raises:
         ValueError: If a constraint's coefficient length does not match the number of variables.
     """
-    num_vars = len(problem_instance.function_objective)
-    for constraint in problem_instance.constraints:
-        if len(constraint.get("coeficientes", [])) != num_vars:
-            raise ValueError("Mismatch in dimensions: each constraint's coefficients length must match number of variables.")
+    num_vars = len(problem_instance.c)
+    num_rows = len(problem_instance.b)
+    if problem_instance.A.shape != (num_rows, num_vars) or len(problem_instance.senses) != num_rows:
+        raise ValueError("Mismatch in dimensions: each constraint's coefficients length must match number of variables.")
     return True
 
 def format_solution(solution):
@@ -27,4 +27,10 @@ def format_solution(solution):
         vars_str = "No variable assignments available."
     optimal_value = solution.get("optimal_value", "N/A")
     status = solution.get("status", "Unknown")
-    return f"Status: {status}\nOptimal Value: {optimal_value}\nVariables: {vars_str}"
+    text = f"Status: {status}\nOptimal Value: {optimal_value}\nVariables: {vars_str}"
+    if "limit" in solution:
+        text += f"\nStopped on: {solution['limit']}"
+    if "bound" in solution:
+        gap = "N/A" if solution.get("gap") is None else f"{solution['gap']:.2%}"
+        text += f"\nBest Bound: {solution['bound']}\nGap: {gap}"
+    return text
@@ -1,78 +1,80 @@
-import matplotlib.pyplot as plt
-import networkx as nx
+# Figure objects are used instead of pyplot: they hold no global state, need no GUI backend
+# and can be rendered safely from the background render thread
 import numpy as np
-from optimax.parser import ProblemInstance
-from networkx.drawing.nx_agraph import graphviz_layout
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from optimax.geometry import feasible_region, line_segment
+from optimax.parser import ProblemInstance, SENSE_SYMBOLS
+from optimax.tree import NODE_COLORS, TreeRecorder, collapse_fathomed, layout_tree
+
+# Above this many constraints the lines are drawn without legend entries
+MAX_LABELED_CONSTRAINTS = 12
+# Branch & Bound trees: nodes drawn at most, and nodes drawn with text labels at most
+MAX_TREE_NODES = 500
+MAX_LABELED_TREE_NODES = 40
+# Convergence graphs mark every iteration up to this many iterations
+CONVERGENCE_MARKERS = 200
 
 class Visualizer:
     @staticmethod
     def plot_feasible_region(problem: ProblemInstance, solution: dict, filename="feasible_region.png"):
         """
         Visualizes the feasible region for 2-variable LP problems.
-        Plots constraint lines, shades the feasible region, and marks the optimal solution.
+        Plots constraint lines, shades the exact feasible region, and marks the optimal solution.
+        The axes are fitted to the region's vertices and the optimum; unbounded sides get extra room.
         
         Parameters:
             problem (ProblemInstance): The optimization problem instance.
             solution (dict): The solution dictionary with at least 'variables' key.
             filename (str): The file name where the plot will be saved.
         """
-        num_vars = len(problem.function_objective)
+        num_vars = problem.num_variables
         if num_vars != 2:
             print("Feasible region visualization is only supported for 2-variable problems.")
             return
 
-        # Define a grid for plotting
-        x = np.linspace(0, 50, 400)
-        y = np.linspace(0, 50, 400)
-        X, Y = np.meshgrid(x, y)
-        
-        fig, ax = plt.subplots()
-        
-        # Initialize a mask for the feasible region (start with all True)
-        feasible_mask = np.ones_like(X, dtype=bool)
-        
-        # Plot each constraint and update the feasible mask
-        for cons in problem.constraints:
-            coef = cons["coeficientes"]
-            sign = cons["signo"]
-            rhs = cons["valor"]
-            
-            # Plot constraint lines (avoid division by zero)
-            if coef[1] != 0:
-                # Calculate line: y = (rhs - coef[0]*x)/coef[1]
-                y_line = (rhs - coef[0] * x) / coef[1]
-                ax.plot(x, y_line, label=f'{coef[0]}x + {coef[1]}y {sign} {rhs}')
-            else:
-                # Vertical line: x = rhs/coef[0]
-                x_line = np.full_like(y, rhs / coef[0])
-                ax.plot(x_line, y, label=f'{coef[0]}x {sign} {rhs}')
-            
-            # Update the feasible mask based on the constraint
-            if sign == '<=':
-                feasible_mask &= (coef[0] * X + coef[1] * Y <= rhs)
-            elif sign == '>=':
-                feasible_mask &= (coef[0] * X + coef[1] * Y >= rhs)
-            elif sign == '==':
-                feasible_mask &= np.isclose(coef[0] * X + coef[1] * Y, rhs, atol=1e-2)
-            else:
-                raise ValueError(f"Unsupported constraint sign: {sign}")
-        
-        # Shade the feasible region
-        ax.contourf(X, Y, feasible_mask, levels=[0.5, 1], colors=['#cce5ff'], alpha=0.5)
-        
+        region = feasible_region(problem)
+        optimum = solution.get("variables")
+        xlim, ylim = region.axis_limits(optimum)
+
+        fig = Figure()
+        ax = fig.subplots()
+
+        # Plot constraint lines clipped to the view; large problems get one unlabeled collection
+        rows = zip(problem.A.toarray().tolist(), problem.senses.tolist(), problem.b.tolist())
+        if problem.num_constraints <= MAX_LABELED_CONSTRAINTS:
+            for (a0, a1), sign, rhs in rows:
+                ends = line_segment((a0, a1), rhs, xlim, ylim)
+                if len(ends):
+                    label = f'{a0}x + {a1}y {SENSE_SYMBOLS[sign]} {rhs}' if a1 != 0 else f'{a0}x {SENSE_SYMBOLS[sign]} {rhs}'
+                    ax.plot(ends[:, 0], ends[:, 1], label=label)
+        else:
+            segments = [ends for ends in (line_segment(a, rhs, xlim, ylim) for a, _, rhs in rows) if len(ends)]
+            ax.add_collection(LineCollection(segments, colors='gray', linewidths=0.5, alpha=0.5))
+
+        # Shade the feasible region: the exact polygon, or a thick line / marker for degenerate regions
+        shown = region.clip(xlim, ylim)
+        if region.kind == "polygon" and len(shown):
+            ax.fill(shown[:, 0], shown[:, 1], color='#cce5ff', alpha=0.5, label='Feasible Region')
+        elif region.kind == "segment" and len(shown):
+            ax.plot(shown[:, 0], shown[:, 1], color='#66aaff', linewidth=4, alpha=0.7, label='Feasible Region')
+        elif region.kind == "point" and len(shown):
+            ax.plot(shown[:, 0], shown[:, 1], 's', color='#66aaff', markersize=10, label='Feasible Region')
+
         # Plot the optimal solution if available
-        if "variables" in solution:
-            opt_x, opt_y = solution["variables"]
+        if optimum is not None:
+            opt_x, opt_y = optimum
             ax.plot(opt_x, opt_y, 'ro', label='Optimal Solution')
-        
+
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
         ax.set_xlabel('x')
         ax.set_ylabel('y')
         ax.legend()
         ax.set_title('Feasible Region')
         
         # Save the figure as a PNG file
-        plt.savefig(filename)
-        plt.close(fig)  # Close the plot after saving
+        fig.savefig(filename)
 
     @staticmethod
     def plot_convergence(iterations, objective_values, filename="convergence_graph.png"):
@@ -84,24 +86,29 @@ class Visualizer:
             objective_values (list): Corresponding objective function values.
             filename (str): The file name where the plot will be saved.
         """
-        plt.figure()
-        plt.plot(iterations, objective_values, marker='o')
-        plt.xlabel('Iteration')
-        plt.ylabel('Objective Value')
-        plt.title('Convergence Graph')
-        plt.grid(True)
+        fig = Figure()
+        ax = fig.subplots()
+        ax.plot(iterations, objective_values, marker='o' if len(iterations) <= CONVERGENCE_MARKERS else None)
+        ax.set_xlabel('Iteration')
+        ax.set_ylabel('Objective Value')
+        ax.set_title('Convergence Graph')
+        ax.grid(True)
         
         # Save the figure as a PNG file
-        plt.savefig(filename)
-        plt.close()  # Close the plot after saving
+        fig.savefig(filename)
     
     @staticmethod
-    def plot_branch_and_bound_tree(branch_tree_data, filename="branch_and_bound_tree.png"):
+    def plot_branch_and_bound_tree(branch_tree_data, filename="branch_and_bound_tree.png", max_nodes=MAX_TREE_NODES):
         """
-        Visualizes the Branch & Bound tree using NetworkX.
+        Visualizes the Branch & Bound tree.
+
+        Large trees stay readable: only the top max_nodes nodes are drawn (deeper nodes are counted
+        on their nearest drawn ancestor), subtrees that never found an integer solution are collapsed
+        into a single triangle, and node labels are only drawn for small trees.
 
         Parameters:
-            branch_tree_data (list): List of dictionaries representing nodes in the tree.
+            branch_tree_data (list | dict): List of dictionaries representing nodes in the tree, or
+                the 'tree_summary' of a search run with a TreeRecorder.
                 Each dictionary should contain:
                     - 'node_id': Unique identifier for the node.
                     - 'parent_id': Parent node ID (if any).
@@ -110,46 +117,121 @@ class Visualizer:
                     - 'depth': Depth of the node in the tree.
                     - 'objective_value': The objective value of the node (optional).
                     - 'branch_decision': The decision made to branch (optional).
+                    - 'status': 'branched', 'integer', 'pruned', 'infeasible' or 'unbounded' (optional).
             filename (str): The file name where the plot will be saved.
+            max_nodes (int): Maximum nodes drawn before the deeper ones are folded into their ancestors.
         """
-        G = nx.DiGraph()  # Directed graph
+        nodes = branch_tree_data["tree"] if isinstance(branch_tree_data, dict) else branch_tree_data
+        if len(nodes) > max_nodes:
+            nodes = TreeRecorder.from_records(nodes, max_nodes=max_nodes).nodes
+        nodes = collapse_fathomed(nodes)
+        pos = layout_tree(nodes)
+
+        fig = Figure(figsize=(12, 8))
+        ax = fig.subplots()
 
-        # Add nodes and edges to the graph based on the branch tree data
-        for node in branch_tree_data:
-            node_id = node['node_id']
-            parent_id = node.get('parent_id', None)
-            objective_value = node.get('objective_value', 'N/A')
-            branch_decision = node.get('branch_decision', '')
+        # Draw edges
+        edges = [(pos[node["parent_id"]], pos[node["node_id"]]) for node in nodes if node.get("parent_id") in pos]
+        ax.add_collection(LineCollection(edges, colors="gray", linewidths=1.0, alpha=0.7, zorder=1))
 
-            # Node label including ID, decision, and objective value
-            node_label = f"{node_id}\n{branch_decision}\nZ={objective_value}"
+        # Draw nodes, one color per status; collapsed subtrees are triangles sized by their node count
+        labeled = len(nodes) <= MAX_LABELED_TREE_NODES
+        size = 800 if labeled else max(10, 4000 / max(len(nodes), 1))
+        for status, color in NODE_COLORS.items():
+            group = [node for node in nodes if node.get("status", "branched") == status and "collapsed" not in node]
+            if group:
+                xy = np.array([pos[node["node_id"]] for node in group])
+                ax.scatter(xy[:, 0], xy[:, 1], s=size, c=color, edgecolors="black", linewidths=0.5, zorder=2, label=status)
+        collapsed = [node for node in nodes if "collapsed" in node]
+        if collapsed:
+            xy = np.array([pos[node["node_id"]] for node in collapsed])
+            counts = np.array([node["collapsed"] for node in collapsed])
+            ax.scatter(xy[:, 0], xy[:, 1], s=size * (1 + np.log10(counts)), marker="v", c="lightgray",
+                       edgecolors="black", linewidths=0.5, zorder=2, label="collapsed subtree")
+        folded = [node for node in nodes if node.get("hidden") and "collapsed" not in node]
 
-            # Add node with label
-            G.add_node(node_id, label=node_label)
+        # Draw labels
+        if labeled:
+            for node in nodes:
+                value = node.get("objective_value")
+                value = "N/A" if value is None else f"{value:.4g}"
+                label = f"{node['node_id']}\n{node.get('branch_decision', '')}\nZ={value}"
+                if "collapsed" in node:
+                    label += f"\n({node['collapsed']} nodes)"
+                elif node.get("hidden"):
+                    label += f"\n(+{node['hidden']} below)"
+                x, y = pos[node["node_id"]]
+                ax.text(x, y, label, ha="center", va="center", fontsize=7, fontweight="bold", zorder=3)
+        else:
+            for node in folded:
+                x, y = pos[node["node_id"]]
+                ax.annotate(f"+{node['hidden']}", (x, y), xytext=(4, 0), textcoords="offset points", ha="left",
+                            va="center", fontsize=6, zorder=3)
 
-            # Add edge if parent exists
-            if parent_id is not None:
-                G.add_edge(parent_id, node_id)
+        # Set title
+        shown = len(nodes)
+        total = sum(node.get("collapsed", 1) + (0 if "collapsed" in node else node.get("hidden", 0)) for node in nodes)
+        title = "Branch & Bound Tree" if shown == total else f"Branch & Bound Tree ({shown} of {total} nodes drawn)"
+        ax.set_title(title, fontsize=14, fontweight="bold")
+        legend = ax.legend(loc="upper left", bbox_to_anchor=(1.0, 1.0), fontsize=8)
+        for handle in legend.legend_handles:
+            handle.set_sizes([60])
+        ax.autoscale_view()
+        ax.margins(0.05)
+        ax.axis("off")  # Hide axes
 
-        # Use Graphviz hierarchical layout for better tree structure
-        pos = graphviz_layout(G, prog="dot")
+        # Save the plot
+        fig.savefig(filename, bbox_inches="tight")
 
-        plt.figure(figsize=(12, 8))
+    @staticmethod
+    def plot_search_summary(tree_summary: dict, filename="search_summary.png"):
+        """
+        Summarizes a Branch & Bound search of any size: nodes per depth by status, and the best
+        bound, the incumbent and the gap between them over time.
 
-        # Draw nodes
-        nx.draw_networkx_nodes(G, pos, node_size=800, node_color="lightblue", edgecolors="black", alpha=0.9)
-        
-        # Draw edges
-        nx.draw_networkx_edges(G, pos, edge_color="gray", width=1.5, alpha=0.7)
+        Parameters:
+            tree_summary (dict): The 'tree_summary' of a search run with a TreeRecorder.
+            filename (str): The file name where the plot will be saved.
+        """
+        timeline = tree_summary["timeline"]
+        has_timeline = any(value is not None for value in timeline["bound"] + timeline["incumbent"])
+        fig = Figure(figsize=(12, 5) if has_timeline else (6, 5))
+        axes = fig.subplots(1, 2 if has_timeline else 1, squeeze=False)[0]
 
-        # Draw labels
-        labels = nx.get_node_attributes(G, 'label')
-        nx.draw_networkx_labels(G, pos, labels=labels, font_size=9, font_weight="bold")
+        # Nodes per depth, stacked by status
+        ax = axes[0]
+        per_depth = tree_summary["nodes_per_depth"]
+        depths = np.arange(max((len(counts) for counts in per_depth.values()), default=0))
+        bottom = np.zeros(len(depths))
+        for status, color in NODE_COLORS.items():
+            if status in per_depth:
+                counts = np.asarray(per_depth[status], dtype=float)
+                ax.bar(depths, counts, bottom=bottom, color=color, edgecolor="black", linewidth=0.3, label=status)
+                bottom += counts
+        ax.set_xlabel("Depth")
+        ax.set_ylabel("Nodes")
+        ax.set_title(f"Nodes per Depth ({tree_summary['nodes']} nodes)")
+        ax.legend(fontsize=8)
 
-        # Set title
-        plt.title("Branch & Bound Tree", fontsize=14, fontweight="bold")
-        plt.axis("off")  # Hide axes
+        # Bound and incumbent over time, with the relative gap on a second axis
+        if has_timeline:
+            ax = axes[1]
+            elapsed = np.asarray(timeline["time"], dtype=float)
+            bound = np.array([np.nan if value is None else value for value in timeline["bound"]])
+            incumbent = np.array([np.nan if value is None else value for value in timeline["incumbent"]])
+            ax.step(elapsed, bound, where="post", label="Best bound")
+            ax.step(elapsed, incumbent, where="post", label="Incumbent")
+            ax.set_xlabel("Time (s)")
+            ax.set_ylabel("Objective Value")
+            ax.set_title("Bound and Incumbent")
+            gap_ax = ax.twinx()
+            with np.errstate(invalid="ignore", divide="ignore"):
+                gap = 100 * np.abs(incumbent - bound) / np.maximum(np.abs(incumbent), 1.0)
+            gap_ax.step(elapsed, gap, where="post", color="gray", linestyle="--", label="Gap")
+            gap_ax.set_ylabel("Gap (%)")
+            lines, labels = ax.get_legend_handles_labels()
+            gap_lines, gap_labels = gap_ax.get_legend_handles_labels()
+            ax.legend(lines + gap_lines, labels + gap_labels, fontsize=8)
 
-        # Save the plot
-        plt.savefig(filename, bbox_inches="tight")
-        plt.close()  # Close the plot after saving
+        fig.tight_layout()
+        fig.savefig(filename)
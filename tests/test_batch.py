@@ -0,0 +1,35 @@
+import unittest
+from optimax.batch import solve_batch, solve_problem
+
+LP_JSON = '''
+{
+    "objetivo": "maximizar",
+    "funcion_objetivo": [5, 3],
+    "restricciones": [
+        {"coeficientes": [2, 1], "signo": "<=", "valor": 10},
+        {"coeficientes": [1, 2], "signo": "<=", "valor": 8}
+    ],
+    "variables_enteras": [false, false]
+}
+'''
+
+class TestBatch(unittest.TestCase):
+    def test_solve_problem_reports_errors(self):
+        result = solve_problem("bad", '{"objetivo": "maximizar"}')
+        self.assertEqual(result["id"], "bad")
+        self.assertIn("error", result)
+
+    def test_solve_batch_input_order(self):
+        problems = [("p0", LP_JSON), ("p1", "not json"), ("p2", LP_JSON)]
+        results = list(solve_batch(problems, workers=2, ordered=True))
+        self.assertEqual([r["id"] for r in results], ["p0", "p1", "p2"])
+        self.assertIn("error", results[1])
+        self.assertAlmostEqual(results[2]["solution"]["optimal_value"], 26, places=2)
+
+    def test_solve_batch_completion_order(self):
+        problems = [(f"p{i}", LP_JSON) for i in range(5)]
+        results = list(solve_batch(problems, workers=2, ordered=False))
+        self.assertEqual(sorted(r["id"] for r in results), [f"p{i}" for i in range(5)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import copy
+import json
+import unittest
+from benchmarks.generators import GENERATORS, generate
+from benchmarks.run import PHASES, compare, run_case
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+
+SMALL_SIZES = {"dense": (4, 3), "sparse": (6, 5), "transportation": (2, 3), "knapsack": (6, 2), "set_cover": (5, 6),
+               "block_diagonal": (2, 3, 4)}
+
+class TestBenchmarks(unittest.TestCase):
+    def test_generators_are_seeded_and_solvable(self):
+        for name in GENERATORS:
+            document = generate(name, SMALL_SIZES[name], seed=3)
+            self.assertEqual(document, generate(name, SMALL_SIZES[name], seed=3))
+            self.assertNotEqual(document, generate(name, SMALL_SIZES[name], seed=4))
+            problem = ProblemInstance.from_json(json.dumps(document))
+            algorithm = "branch_and_bound" if problem.integrality.any() else "dual_simplex"
+            result = Solver.solve(problem, algorithm, backend="native")
+            self.assertIn("optimal_value", result, name)
+
+    def test_run_case_times_every_phase(self):
+        result = run_case("transportation", (2, 3), repeats=1)
+        self.assertEqual((result["rows"], result["cols"]), (5, 6))
+        self.assertEqual(set(result["phases"]), set(PHASES))
+        self.assertTrue(all(phase["median_s"] >= 0 for phase in result["phases"].values()))
+
+        report = {"results": [result]}
+        self.assertEqual(compare(report, report), [])
+        slower = copy.deepcopy(report)
+        slower["results"][0]["phases"]["solve"]["median_s"] += 1.0
+        slower["results"][0]["optimal_value"] += 1.0
+        regressions = compare(slower, report)
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("solve time", regressions[1])
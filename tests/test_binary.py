@@ -0,0 +1,70 @@
+import json
+import mmap
+import os
+import tempfile
+import unittest
+import numpy as np
+from optimax.binary import convert, is_binary, read_binary, write_binary
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+
+PROBLEM = {
+    "objetivo": "maximizar",
+    "funcion_objetivo": [5, 3, 1],
+    "restricciones": [
+        {"coeficientes": [2, 1, 0], "signo": "<=", "valor": 10},
+        {"indices": [1, 2], "coeficientes": [2, 1], "signo": ">=", "valor": 1},
+        {"coeficientes": [1, 0, 1], "signo": "==", "valor": 2},
+    ],
+    "variables_enteras": [True, False, False],
+}
+
+def is_mapped(array):
+    while array is not None:
+        if isinstance(array, (np.memmap, mmap.mmap)):
+            return True
+        array = array.base
+    return False
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_round_trip_is_memory_mapped(self):
+        problem = ProblemInstance.from_json(json.dumps(PROBLEM))
+        path = os.path.join(self.tmp.name, "problem.optimax")
+        write_binary(problem, path)
+        self.assertTrue(is_binary(path))
+
+        loaded = read_binary(path)
+        self.assertTrue(is_mapped(loaded.A.data) and is_mapped(loaded.A.indices) and is_mapped(loaded.c))
+        self.assertEqual((loaded.A != problem.A).nnz, 0)
+        np.testing.assert_array_equal(loaded.senses, problem.senses)
+        self.assertEqual(loaded.variables_integer, [True, False, False])
+        self.assertAlmostEqual(Solver.solve(loaded, "branch_and_bound", backend="native")["optimal_value"],
+                               Solver.solve(problem, "branch_and_bound", backend="native")["optimal_value"])
+
+        # Changes to the mapped arrays are private to the process
+        loaded.b[0] = 99
+        self.assertEqual(read_binary(path).b[0], 10)
+
+    def test_convert_both_ways(self):
+        json_path = os.path.join(self.tmp.name, "problem.json")
+        binary_path = os.path.join(self.tmp.name, "problem.optimax")
+        back_path = os.path.join(self.tmp.name, "back.json")
+        with open(json_path, "w") as f:
+            json.dump(PROBLEM, f)
+        convert(json_path, binary_path)
+        convert(binary_path, back_path)
+        with open(back_path) as f:
+            back = ProblemInstance.from_json(f.read())
+        self.assertEqual(back.function_objective, [5, 3, 1])
+        self.assertEqual(back.constraints[1], {"indices": [1, 2], "coeficientes": [2.0, 1.0], "signo": ">=", "valor": 1.0})
+
+    def test_rejects_unknown_format(self):
+        os.makedirs(os.path.join(self.tmp.name, "other"))
+        with open(os.path.join(self.tmp.name, "other", "header.json"), "w") as f:
+            json.dump({"format": "other", "version": 1}, f)
+        with self.assertRaises(ValueError):
+            read_binary(os.path.join(self.tmp.name, "other"))
@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+from optimax.branch_and_bound import BranchAndBound
+from optimax.limits import SolveLimits
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+
+def knapsack():
+    # max 8x0 + 11x1 + 6x2 + 4x3 s.t. 5x0 + 7x1 + 4x2 + 3x3 <= 14, x binary; optimum 21 at (0, 1, 1, 1)
+    constraints = [{"coeficientes": [5, 7, 4, 3], "signo": "<=", "valor": 14}]
+    constraints += [{"indices": [j], "coeficientes": [1], "signo": "<=", "valor": 1} for j in range(4)]
+    return ProblemInstance("maximizar", [8, 11, 6, 4], constraints, [True] * 4)
+
+class TestBranchAndBound(unittest.TestCase):
+    def test_all_strategies_find_optimum(self):
+        for node_selection in ("best_bound", "depth_first"):
+            for branching in ("most_fractional", "pseudo_cost"):
+                result = BranchAndBound(knapsack(), node_selection, branching).solve()
+                self.assertEqual(result["status"], "Optimal")
+                self.assertAlmostEqual(result["optimal_value"], 21, places=6)
+                self.assertEqual(result["variables"], [0, 1, 1, 1])
+
+    def test_branch_tree_data_schema(self):
+        result = Solver.solve(knapsack(), "branch_and_bound", backend="native")
+        tree = result["branch_tree_data"]
+        self.assertGreater(len(tree), 1)
+        self.assertEqual(result["nodes"], len(tree))
+        self.assertIsNone(tree[0]["parent_id"])
+        node_ids = {node["node_id"] for node in tree}
+        for node in tree:
+            self.assertTrue({"node_id", "parent_id", "depth", "objective_value", "branch_decision"} <= node.keys())
+            if node["parent_id"] is not None:
+                self.assertIn(node["parent_id"], node_ids)
+
+    def test_infeasible(self):
+        problem = ProblemInstance(
+            "minimizar", [1, 1],
+            [
+                {"coeficientes": [2, 2], "signo": "==", "valor": 3},
+            ],
+            [True, True],
+        )
+        self.assertEqual(BranchAndBound(problem).solve()["status"], "Infeasible")
+
+    def test_failed_relaxation_is_not_pruned(self):
+        # An LP stopped by HiGHS without an answer proves nothing about its subtree
+        engine = BranchAndBound(knapsack())
+        engine._highs.setOptionValue("simplex_iteration_limit", 0)
+        result = engine.solve()
+        self.assertEqual(result["status"], "Undefined")
+        self.assertNotIn("optimal_value", result)
+        self.assertEqual(result["branch_tree_data"][-1]["status"], "failed")
+
+    def test_failed_relaxation_keeps_incumbent(self):
+        # HiGHS starts failing once the first integer solution is found; the search returns it
+        problem = knapsack()
+        engine = BranchAndBound(problem, node_selection="depth_first", limits=SolveLimits(
+            on_incumbent=lambda event: engine._highs.setOptionValue("simplex_iteration_limit", 0)))
+        result = engine.solve()
+        self.assertEqual((result["status"], result["limit"]), ("Feasible", "lp_failure"))
+        self.assertEqual(result["branch_tree_data"][-1]["status"], "failed")
+        self.assertAlmostEqual(result["optimal_value"], float(problem.c @ np.array(result["variables"])))
+        self.assertGreaterEqual(result["bound"], result["optimal_value"])
+
+if __name__ == '__main__':
+    unittest.main()
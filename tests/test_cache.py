@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from optimax.cache import SolutionCache, problem_key
+from optimax.decompose import solve_decomposed
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+
+def make_problem(constraints, objective="maximizar"):
+    return ProblemInstance(objective, [5, 3], constraints, [False, False])
+
+class TestCache(unittest.TestCase):
+    def test_key_ignores_row_order_and_orientation(self):
+        p1 = make_problem([
+            {"coeficientes": [2, 1], "signo": "<=", "valor": 10},
+            {"coeficientes": [1, 2], "signo": ">=", "valor": 8},
+        ])
+        p2 = make_problem([
+            {"coeficientes": [-1, -2], "signo": "<=", "valor": -8},
+            {"indices": [0, 1], "coeficientes": [2, 1], "signo": "<=", "valor": 10},
+        ])
+        p3 = make_problem(p1.constraints, objective="minimizar")
+        self.assertEqual(problem_key(p1), problem_key(p2))
+        self.assertNotEqual(problem_key(p1), problem_key(p3))
+
+    def test_lru_eviction(self):
+        cache = SolutionCache(max_entries=2)
+        cache.put("a", {"status": "a"})
+        cache.put("b", {"status": "b"})
+        cache.get("a")
+        cache.put("c", {"status": "c"})
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"status": "a"})
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+    def test_memory_limit(self):
+        cache = SolutionCache(max_bytes=40)
+        cache.put("a", {"status": "x" * 20})
+        cache.put("b", {"status": "y" * 20})
+        self.assertLessEqual(cache.stats()["bytes"], 40)
+        self.assertIsNone(cache.get("a"))
+
+    def test_disk_tier_persists(self):
+        problem = make_problem([{"coeficientes": [2, 1], "signo": "<=", "valor": 10}])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite")
+            first = SolutionCache(path=path)
+            solution = Solver.solve(problem, "simplex", cache=first)
+            second = SolutionCache(path=path)
+            cached = Solver.solve(problem, "simplex", cache=second)
+            self.assertEqual(second.stats()["disk_hits"], 1)
+            self.assertAlmostEqual(cached["optimal_value"], solution["optimal_value"])
+
+    def test_options_are_part_of_the_key(self):
+        problem = make_problem([{"coeficientes": [2, 1], "signo": "<=", "valor": 10}])
+        cache = SolutionCache()
+        self.assertIn("presolve", Solver.solve(problem, "simplex", cache=cache, presolve=True))
+        self.assertNotIn("presolve", Solver.solve(problem, "simplex", cache=cache))
+        self.assertNotIn("decomposition", Solver.solve(problem, "simplex", cache=cache))
+        self.assertIn("decomposition", solve_decomposed(problem, workers=1, cache=cache))
+        self.assertIn("decomposition", solve_decomposed(problem, workers=1, cache=cache))
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (2, 3))
+
+if __name__ == '__main__':
+    unittest.main()
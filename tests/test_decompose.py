@@ -0,0 +1,81 @@
+import json
+import time
+import unittest
+import numpy as np
+import scipy.sparse as sp
+from benchmarks.generators import block_diagonal, knapsack
+from optimax.decompose import decompose, solve_decomposed
+from optimax.limits import SolveLimits
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+
+def two_knapsacks():
+    # Two independent knapsacks on x0..x3 and x4..x6, plus x7 that appears in no constraint
+    constraints = [
+        {"indices": [0, 1, 2, 3], "coeficientes": [5, 7, 4, 3], "signo": "<=", "valor": 14},
+        {"indices": [4, 5, 6], "coeficientes": [3, 4, 5], "signo": "<=", "valor": 8},
+    ]
+    constraints += [{"indices": [j], "coeficientes": [1], "signo": "<=", "valor": 1} for j in range(7)]
+    constraints.append({"indices": [7], "coeficientes": [0], "signo": "<=", "valor": 0})
+    return ProblemInstance("maximizar", [8, 11, 6, 4, 4, 5, 6, -1], constraints, [True] * 8)
+
+class TestDecompose(unittest.TestCase):
+    def test_finds_blocks(self):
+        problem = ProblemInstance.from_json(json.dumps(block_diagonal(3, 4, 5, seed=2)))
+        decomposition = decompose(problem)
+        cols = np.concatenate([block_cols for _, block_cols in decomposition.blocks])
+        rows = np.concatenate([block_rows for block_rows, _ in decomposition.blocks])
+        self.assertEqual(sorted(cols.tolist()), list(range(problem.num_variables)))
+        self.assertEqual(sorted(rows.tolist()), list(range(problem.num_constraints)))
+        # No block mixes variables of two generated blocks
+        for _, block_cols in decomposition.blocks:
+            self.assertEqual(len(set((block_cols // 5).tolist())), 1)
+        self.assertGreaterEqual(decomposition.summary["blocks"], 3)
+
+    def test_merged_solution_matches_whole_problem(self):
+        problem = ProblemInstance.from_json(json.dumps(block_diagonal(3, 6, 8, seed=1)))
+        whole = Solver.solve(problem, "dual_simplex")
+        merged = solve_decomposed(problem, workers=1)
+        self.assertAlmostEqual(merged["optimal_value"], whole["optimal_value"], places=6)
+        x = np.array(merged["variables"])
+        self.assertAlmostEqual(float(problem.c @ x), whole["optimal_value"], places=6)
+        self.assertEqual(merged["decomposition"]["blocks"], len(decompose(problem).blocks))
+
+    def test_process_pool(self):
+        problem = two_knapsacks()
+        decomposition = decompose(problem)
+        # The unused variable x7 ends up in a block without rows
+        self.assertEqual(decomposition.blocks[-1][1].tolist(), [7])
+        self.assertEqual(len(decomposition.blocks[-1][0]), 0)
+        merged = solve_decomposed(problem, workers=2)
+        self.assertAlmostEqual(merged["optimal_value"], 21 + 10, places=6)
+        self.assertEqual(merged["variables"], [0, 1, 1, 1, 1, 0, 1, 0])
+
+    def test_infeasible_block(self):
+        constraints = [
+            {"indices": [0], "coeficientes": [1], "signo": "<=", "valor": 4},
+            {"indices": [1], "coeficientes": [1], "signo": ">=", "valor": 3},
+            {"indices": [1], "coeficientes": [1], "signo": "<=", "valor": 2},
+        ]
+        problem = ProblemInstance("maximizar", [1, 1], constraints, [False, False])
+        self.assertIn("infeasible", solve_decomposed(problem, workers=1)["status"].lower())
+        constraints.append({"indices": [0], "coeficientes": [0], "signo": ">=", "valor": 1})
+        problem = ProblemInstance("maximizar", [1, 1], constraints, [False, False])
+        self.assertEqual(decompose(problem).status, "Infeasible")
+
+    def test_time_limit_covers_all_blocks(self):
+        # Four hard knapsacks, each far from solved after the whole time limit
+        blocks = [ProblemInstance.from_json(json.dumps(knapsack(60, 5, seed=seed))) for seed in (3, 5, 8, 9)]
+        problem = ProblemInstance.from_arrays(
+            "maximizar", np.concatenate([block.c for block in blocks]), sp.block_diag([block.A for block in blocks], format="csr"),
+            np.concatenate([block.b for block in blocks]), np.concatenate([block.senses for block in blocks]),
+            np.concatenate([block.integrality for block in blocks]))
+        self.assertEqual(len(decompose(problem).blocks), 4)
+        start = time.perf_counter()
+        merged = solve_decomposed(problem, workers=1, solve_options={"backend": "native", "limits": SolveLimits(time_limit=0.5)})
+        # One after another, the blocks would take 0.5 s each
+        self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertEqual(merged["limit"], "time_limit")
+
+if __name__ == '__main__':
+    unittest.main()
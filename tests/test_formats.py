@@ -0,0 +1,120 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from benchmarks.generators import generate
+from optimax.formats import read_lp, read_mps, read_problem, write_problem
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE, SENSE_EQ
+from optimax.solver import Solver
+
+MPS = """* ranges, integer markers, free rows and bounds
+NAME          TESTLP
+OBJSENSE
+    MAX
+ROWS
+ N  COST
+ L  LIM1
+ G  LIM2
+ E  MYEQN
+ N  UNUSED
+COLUMNS
+    X1        COST         1.0   LIM1         1.0
+    X1        LIM2         1.0   UNUSED       3.0
+    MARKER    'MARKER'     'INTORG'
+    X2        COST         2.0   LIM1         1.0
+    X2        MYEQN       -1.0
+    MARKER    'MARKER'     'INTEND'
+    X3        COST        -1.0   MYEQN        1.0
+RHS
+    RHS       LIM1         4.0   LIM2         1.0
+    RHS       MYEQN        7.0
+RANGES
+    RNG       LIM1         2.5   MYEQN       -3.0
+BOUNDS
+ UP BND       X1           4.0
+ MI BND       X2
+ UP BND       X2           1
+ LO BND       X3          -1.0
+ENDATA
+"""
+
+LP = """\\ ranged rows, constants and multi-line expressions
+Maximize
+ obj: x + 2 y - 3z
+   + 0.5 w
+Subject To
+ c1: x + y + z <= 10
+ c2: x - y >= -2
+ -3 <= x + w <= 8
+ c4: 2 x + 3 y
+   - z + 1 = 5
+Bounds
+ x <= 6
+ -10 <= y <= 5
+ z free
+ w >= -1
+ 2 >= w
+Generals
+ y
+End
+"""
+
+class TestFormats(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name, text=None):
+        path = os.path.join(self.tmp.name, name)
+        if text is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return path
+
+    def test_read_mps(self):
+        problem = read_mps(self.path("test.mps", MPS))
+        self.assertEqual(problem.objective, "maximizar")
+        self.assertEqual(problem.variable_names, ["X1", "X2", "X3"])
+        np.testing.assert_array_equal(problem.c, [1, 2, -1])
+        np.testing.assert_array_equal(problem.integrality, [False, True, False])
+        np.testing.assert_array_equal(problem.lower, [0, -np.inf, -1])
+        np.testing.assert_array_equal(problem.upper, [4, 1, np.inf])
+        # LIM1 becomes 1.5 <= row <= 4 and MYEQN 4 <= row <= 7, each split into two rows
+        self.assertEqual(problem.constraint_names, ["LIM1", "LIM2", "MYEQN", "LIM1.range", "MYEQN.range"])
+        np.testing.assert_array_equal(problem.senses, [SENSE_GE, SENSE_GE, SENSE_GE, SENSE_LE, SENSE_LE])
+        np.testing.assert_array_equal(problem.b, [1.5, 1, 4, 4, 7])
+        np.testing.assert_array_equal(problem.A.toarray()[3], [1, 1, 0])
+
+    def test_read_lp(self):
+        problem = read_lp(self.path("test.lp", LP))
+        self.assertEqual(problem.variable_names, ["x", "y", "z", "w"])
+        np.testing.assert_array_equal(problem.c, [1, 2, -3, 0.5])
+        np.testing.assert_array_equal(problem.lower, [0, -10, -np.inf, -1])
+        np.testing.assert_array_equal(problem.upper, [6, 5, np.inf, 2])
+        np.testing.assert_array_equal(problem.senses, [SENSE_LE, SENSE_GE, SENSE_GE, SENSE_EQ, SENSE_LE])
+        np.testing.assert_array_equal(problem.b, [10, -2, -3, 4, 8])
+        np.testing.assert_array_equal(problem.A.toarray()[3], [2, 3, -1, 0])
+        self.assertAlmostEqual(Solver.solve(problem, "branch_and_bound", backend="native")["optimal_value"], 83)
+
+    def test_round_trip(self):
+        for name, size, algorithm in [("sparse", (40, 40), "simplex"), ("knapsack", (12, 2), "branch_and_bound")]:
+            problem = ProblemInstance.from_json(json.dumps(generate(name, size, seed=1)))
+            problem.upper[0] = 3.5
+            expected = Solver.solve(problem, algorithm, backend="highs")["optimal_value"]
+            for extension in ("mps", "lp", "mps.gz", "optimax"):
+                with self.subTest(name=name, extension=extension):
+                    path = self.path(f"{name}.{extension}")
+                    write_problem(problem, path)
+                    loaded = read_problem(path)
+                    self.assertEqual((loaded.A != problem.A).nnz, 0)
+                    np.testing.assert_array_equal(loaded.upper, problem.upper)
+                    self.assertAlmostEqual(Solver.solve(loaded, algorithm, backend="highs")["optimal_value"], expected, places=6)
+
+    def test_unsupported_input(self):
+        with self.assertRaises(ValueError):
+            read_mps(self.path("quad.mps", MPS.replace("ENDATA", "QUADOBJ\n    X1 X1 1.0\nENDATA")))
+        with self.assertRaises(ValueError):
+            read_lp(self.path("quad.lp", LP.replace("+ 0.5 w", "+ [ x ^ 2 ]")))
+        with self.assertRaises(ValueError):
+            read_problem(self.path("problem.txt", "{}"))
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from optimax.geometry import feasible_region, half_plane_intersection
+from optimax.parser import ProblemInstance
+from optimax.visualizer import Visualizer
+
+def make_problem(rows, objective="maximizar"):
+    constraints = [{"coeficientes": a, "signo": sign, "valor": rhs} for a, sign, rhs in rows]
+    return ProblemInstance(objective, [1, 1], constraints, [False, False])
+
+def sorted_vertices(region):
+    return sorted(map(tuple, np.round(region.vertices, 9).tolist()))
+
+class TestGeometry(unittest.TestCase):
+    def test_bounded_polygon(self):
+        region = feasible_region(make_problem([([2, 1], "<=", 10), ([1, 2], "<=", 8)]))
+        self.assertEqual(region.kind, "polygon")
+        self.assertTrue(region.bounded)
+        self.assertEqual(sorted_vertices(region), [(0, 0), (0, 4), (4, 2), (5, 0)])
+        (xmin, xmax), (ymin, ymax) = region.axis_limits()
+        self.assertTrue(xmin < 0 and 5 < xmax < 6 and ymin < 0 and 4 < ymax < 5)
+
+    def test_unbounded_region_is_flagged(self):
+        region = feasible_region(make_problem([([1, 1], ">=", 2)], "minimizar"))
+        self.assertEqual(region.kind, "polygon")
+        self.assertFalse(region.bounded)
+        exact = sorted(map(tuple, region.vertices[region.exact].tolist()))
+        self.assertEqual(exact, [(0.0, 2.0), (2.0, 0.0)])
+        # Open sides get extra room beyond the last true vertex
+        (_, xmax), (_, ymax) = region.axis_limits()
+        self.assertGreater(xmax, 2.5)
+        self.assertGreater(ymax, 2.5)
+
+    def test_degenerate_regions(self):
+        segment = feasible_region(make_problem([([1, 1], "==", 4)]))
+        self.assertEqual(segment.kind, "segment")
+        self.assertEqual(sorted_vertices(segment), [(0, 4), (4, 0)])
+        squeezed = feasible_region(make_problem([([1, 1], "<=", 2), ([1, 1], ">=", 2)]))
+        self.assertEqual(squeezed.kind, "segment")
+        point = feasible_region(make_problem([([1, 1], "==", 4), ([1, -1], "==", 0)]))
+        self.assertEqual(point.kind, "point")
+        np.testing.assert_allclose(point.vertices, [[2, 2]])
+        self.assertEqual(feasible_region(make_problem([([1, 1], "<=", 1), ([1, 1], ">=", 2)])).kind, "empty")
+        self.assertEqual(feasible_region(make_problem([([1, 1], "==", 4), ([1, 1], "==", 5)])).kind, "empty")
+        # Inequalities alone can also pinch the region to a point
+        pinched = feasible_region(make_problem([([1, 1], "<=", 0)]))
+        self.assertEqual(pinched.kind, "point")
+        np.testing.assert_allclose(pinched.vertices, [[0, 0]], atol=1e-9)
+
+    def test_empty_intersection_of_inequalities(self):
+        # The sweep leaves lines 2 and 3 around (0, 0.25), which violates 2x - 2y <= -9
+        problem = make_problem([([2, -2], "<=", -9), ([5, 4], ">=", 1), ([0, 4], "<=", 1)])
+        self.assertEqual(feasible_region(problem).kind, "empty")
+
+    def test_many_constraints(self):
+        # 20k tangents of a circle of radius 5: every vertex lies just outside the circle
+        angles = np.linspace(0, 2 * np.pi, 20000, endpoint=False)
+        A = np.column_stack([np.cos(angles), np.sin(angles)])
+        start = time.perf_counter()
+        boundary = half_plane_intersection(A, np.full(len(angles), 5.0), 1e-9)
+        self.assertLess(time.perf_counter() - start, 5.0)
+        self.assertEqual(len(boundary), len(angles))
+
+    def test_plot_unbounded_region(self):
+        problem = make_problem([([1, 1], ">=", 2), ([1, -1], "<=", 1)], "minimizar")
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "region.png")
+            Visualizer.plot_feasible_region(problem, {"variables": [0.0, 2.0]}, filename=filename)
+            self.assertGreater(os.path.getsize(filename), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import unittest
+import numpy as np
+from benchmarks.generators import knapsack, set_cover
+from optimax.branch_and_bound import BranchAndBound
+from optimax.cache import SolutionCache
+from optimax.heuristics import HEURISTICS, PrimalHeuristics
+from optimax.limits import SolveLimits
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+
+def generated(document):
+    return ProblemInstance.from_json(json.dumps(document))
+
+class TestHeuristics(unittest.TestCase):
+    def test_each_heuristic_finds_a_feasible_solution(self):
+        problem = generated(knapsack(30, 3, seed=3))
+        optimum = Solver.solve(problem, "branch_and_bound", backend="highs")["optimal_value"]
+        for name in HEURISTICS:
+            heuristics = PrimalHeuristics(problem, methods=(name,))
+            incumbent = heuristics.run()
+            self.assertIsNotNone(incumbent, name)
+            self.assertTrue(heuristics.is_feasible(incumbent), name)
+            summary = heuristics.summary()
+            self.assertEqual(summary["found_by"], name)
+            self.assertAlmostEqual(summary["objective_value"], float(problem.c @ incumbent))
+            self.assertLessEqual(summary["objective_value"], optimum + 1e-9)
+            self.assertEqual(summary["improvements"][name], 1)
+
+    def test_rounding_repairs_violated_rows(self):
+        # Rounding (0.6, 0.7) to (1, 1) violates x0 + x1 <= 1; repair moves the cheaper x1 back down
+        problem = ProblemInstance("maximizar", [2, 1], [
+            {"coeficientes": [1, 1], "signo": "<=", "valor": 1},
+        ], [True, True])
+        heuristics = PrimalHeuristics(problem, methods=("rounding",))
+        self.assertTrue(heuristics.round(np.array([0.6, 0.7])))
+        np.testing.assert_allclose(heuristics.incumbent, [1, 0])
+        self.assertEqual(heuristics.summary()["objective_value"], 2)
+        # The same value again is no improvement
+        self.assertFalse(heuristics.round(np.array([0.6, 0.4])))
+        with self.assertRaises(ValueError):
+            PrimalHeuristics(problem, methods=("local_branching",))
+
+    def test_native_search_starts_from_heuristics(self):
+        problem = generated(knapsack(30, 3, seed=3))
+        plain = BranchAndBound(problem).solve()
+        events = []
+        heuristics = PrimalHeuristics(problem, limits=SolveLimits(on_incumbent=events.append))
+        result = BranchAndBound(problem, heuristics=heuristics).solve()
+        self.assertEqual(result["status"], "Optimal")
+        self.assertAlmostEqual(result["optimal_value"], plain["optimal_value"], places=6)
+        self.assertLessEqual(result["nodes"], plain["nodes"])
+        summary = result["heuristics"]
+        self.assertIsNotNone(summary["objective_value"])
+        self.assertGreater(summary["nodes_pruned"], 0)
+        self.assertGreater(summary["calls"]["rounding"], 1)
+        # Every heuristic improvement reaches on_incumbent
+        self.assertEqual(len(events), sum(summary["improvements"].values()))
+        self.assertAlmostEqual(events[-1]["objective_value"], summary["objective_value"])
+
+    def test_backends_with_incumbent(self):
+        for problem in (generated(knapsack(20, 3, seed=1)), generated(set_cover(40, 80, seed=2))):
+            expected = Solver.solve(problem, "branch_and_bound", backend="native")["optimal_value"]
+            for backend in ("pulp", "highs", "native"):
+                solution = Solver.solve(problem, "branch_and_bound", backend=backend, heuristics=True)
+                self.assertEqual(solution["status"], "Optimal", backend)
+                self.assertAlmostEqual(solution["optimal_value"], expected, places=6, msg=backend)
+                self.assertIn("heuristics", solution)
+                self.assertEqual(solution["heuristics"]["nodes_pruned"] is None, backend != "native")
+
+    def test_cached_solve_keeps_summary(self):
+        problem = generated(knapsack(20, 3, seed=1))
+        cache = SolutionCache()
+        plain = Solver.solve(problem, "branch_and_bound", backend="highs", cache=cache)
+        self.assertNotIn("heuristics", plain)
+        for _ in range(2):
+            solution = Solver.solve(problem, "branch_and_bound", backend="highs", cache=cache, heuristics=True)
+            self.assertIn("heuristics", solution)
+            self.assertAlmostEqual(solution["optimal_value"], plain["optimal_value"], places=6)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_merge(self):
+        problem = generated(set_cover(40, 80, seed=2))
+        heuristics = PrimalHeuristics(problem)
+        incumbent = heuristics.run()
+        value = heuristics.summary()["objective_value"]
+        # A backend that finds nothing better than its cutoff reports the problem infeasible
+        merged = heuristics.merge({"status": "Infeasible"})
+        self.assertEqual((merged["status"], merged["optimal_value"], merged["gap"]), ("Optimal", value, 0.0))
+        self.assertEqual(merged["variables"], incumbent.tolist())
+        stopped = heuristics.merge({"status": "Not Solved", "limit": "time_limit", "bound": value - 2})
+        self.assertEqual(stopped["status"], "Feasible")
+        self.assertAlmostEqual(stopped["gap"], 2 / value)
+        better = {"status": "Optimal", "optimal_value": value - 1, "variables": []}
+        self.assertEqual(heuristics.merge(better)["optimal_value"], value - 1)
+
+if __name__ == '__main__':
+    unittest.main()
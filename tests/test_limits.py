@@ -0,0 +1,98 @@
+import json
+import unittest
+import numpy as np
+from benchmarks.generators import knapsack
+from optimax.branch_and_bound import BranchAndBound
+from optimax.cache import SolutionCache
+from optimax.limits import CbcLog, SolveLimits, relative_gap
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+
+def hard_knapsack():
+    # Five knapsack constraints over 60 general integers: thousands of nodes to prove optimality
+    return ProblemInstance.from_json(json.dumps(knapsack(60, 5, seed=3)))
+
+class TestLimits(unittest.TestCase):
+    def test_node_limit_returns_incumbent_and_bound(self):
+        problem = hard_knapsack()
+        result = BranchAndBound(problem, node_selection="depth_first", limits=SolveLimits(node_limit=200)).solve()
+        self.assertEqual(result["status"], "Feasible")
+        self.assertEqual(result["limit"], "node_limit")
+        self.assertEqual(result["nodes"], 200)
+        self.assertAlmostEqual(float(problem.c @ np.array(result["variables"])), result["optimal_value"], places=6)
+        # Maximization: the bound can only be above the incumbent
+        self.assertGreaterEqual(result["bound"], result["optimal_value"])
+        self.assertAlmostEqual(result["gap"], relative_gap(result["optimal_value"], result["bound"]))
+
+    def test_gap_tolerance_stops_early(self):
+        problem = hard_knapsack()
+        events = []
+        limits = SolveLimits(gap_abs=10, on_incumbent=events.append)
+        result = BranchAndBound(problem, limits=limits).solve()
+        self.assertEqual(result["status"], "Optimal")
+        self.assertNotIn("limit", result)
+        self.assertLessEqual(result["bound"] - result["optimal_value"], 10 + 1e-6)
+        values = [event["objective_value"] for event in events]
+        self.assertEqual(values, sorted(values))
+        self.assertAlmostEqual(values[-1], result["optimal_value"])
+        self.assertEqual(len(events[-1]["variables"]), problem.num_variables)
+
+    def test_backends(self):
+        problem = hard_knapsack()
+        for backend in ("pulp", "highs"):
+            events = []
+            result = Solver.solve(problem, "branch_and_bound", backend=backend,
+                                  limits=SolveLimits(node_limit=5, on_incumbent=events.append))
+            self.assertIn(result["status"], ("Feasible", "Optimal"), backend)
+            self.assertGreaterEqual(result["bound"], result["optimal_value"] - 1e-6, backend)
+            self.assertTrue(events, backend)
+            self.assertAlmostEqual(events[-1]["objective_value"], result["optimal_value"], places=6, msg=backend)
+            if result["status"] == "Feasible":
+                self.assertEqual(result["limit"], "node_limit", backend)
+
+    def test_limited_solutions_are_not_cached(self):
+        problem = hard_knapsack()
+        cache = SolutionCache(max_entries=4)
+        Solver.solve(problem, "branch_and_bound", cache=cache, backend="native", limits=SolveLimits(node_limit=1))
+        self.assertEqual(cache.stats()["entries"], 0)
+        # A gap tolerance ends the search with an 'Optimal' answer that is not the optimum
+        problem = ProblemInstance.from_json(json.dumps(knapsack(40, 3, seed=1)))
+        early = Solver.solve(problem, "branch_and_bound", cache=cache, backend="native", limits=SolveLimits(gap_rel=0.2))
+        self.assertEqual(cache.stats()["entries"], 0)
+        exact = Solver.solve(problem, "branch_and_bound", cache=cache, backend="native")
+        self.assertAlmostEqual(exact["optimal_value"], Solver.solve(problem, "branch_and_bound", backend="highs")["optimal_value"], places=6)
+        self.assertGreater(exact["optimal_value"], early["optimal_value"])
+
+    def test_presolve_maps_incumbents(self):
+        constraints = [
+            {"indices": [0, 1, 2], "coeficientes": [5, 7, 4], "signo": "<=", "valor": 11},
+            {"indices": [3], "coeficientes": [1], "signo": "==", "valor": 2},
+        ]
+        constraints += [{"indices": [j], "coeficientes": [1], "signo": "<=", "valor": 1} for j in range(3)]
+        problem = ProblemInstance("maximizar", [8, 11, 6, 3], constraints, [True] * 4)
+        events = []
+        result = Solver.solve(problem, "branch_and_bound", backend="native", presolve=True,
+                              limits=SolveLimits(on_incumbent=events.append))
+        self.assertAlmostEqual(result["optimal_value"], 17 + 6, places=6)
+        self.assertTrue(events)
+        for event in events:
+            self.assertAlmostEqual(float(problem.c @ np.array(event["variables"])), event["objective_value"], places=6)
+
+    def test_cbc_log(self):
+        events = []
+        log = CbcLog(True, SolveLimits(on_incumbent=events.append), 0.0)
+        log.feed("Cbc0012I Integer solution of -273.6 found by DiveCoefficient after 0 iterations and 0 nodes (0.01 seconds)\n"
+                 "Cbc0010I After 0 nodes, 1 on tree, -273.6 best solution, best possible -308.89555 (0.24 sec")
+        self.assertEqual(len(events), 1)
+        self.assertIsNone(log.bound)
+        log.feed("onds)\nResult - Stopped on time limit\n\nObjective value:   306.6\nUpper bound:   308.896\n"
+                 "Enumerated nodes:   10379")
+        log.close()
+        self.assertEqual(events[0]["objective_value"], 273.6)
+        self.assertEqual(events[0]["time"], 0.01)
+        self.assertEqual((log.limit, log.bound, log.nodes), ("time_limit", 308.896, 10379))
+        with self.assertRaises(ValueError):
+            SolveLimits(time_limit=-1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import json
+import unittest
+from optimax.batch import solve_problem
+from optimax.metrics import Metrics, phase
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+
+def problem():
+    return ProblemInstance("maximizar", [5, 3], [
+        {"coeficientes": [2, 1], "signo": "<=", "valor": 10},
+        {"coeficientes": [1, 2], "signo": "<=", "valor": 8},
+    ], [False, False])
+
+class TestMetrics(unittest.TestCase):
+    def test_disabled_phase_is_shared_noop(self):
+        self.assertIs(phase(None, "a"), phase(None, "b"))
+
+    def test_nested_phases_and_hooks(self):
+        events = []
+        metrics = Metrics(hooks=[lambda event, name, data: events.append((event, name))])
+        with metrics.phase("outer"):
+            with metrics.phase("outer.inner"):
+                block = bytearray(512 * 1024)
+            del block
+        with metrics.phase("outer.inner"):
+            pass
+        result = metrics.as_dict()["phases"]
+        self.assertEqual(result["outer.inner"]["calls"], 2)
+        self.assertGreaterEqual(result["outer.inner"]["peak_kb"], 512)
+        # The inner peak also counts for the enclosing phase
+        self.assertGreaterEqual(result["outer"]["peak_kb"], 512)
+        self.assertGreaterEqual(result["outer"]["wall_s"], result["outer.inner"]["wall_s"] / 2)
+        self.assertEqual(events[:2], [("phase", "outer.inner"), ("phase", "outer")])
+
+    def test_solver_records_phases_and_statistics(self):
+        metrics = Metrics(track_memory=False)
+        solution = Solver.solve(problem(), "dual_simplex", presolve=True, metrics=metrics)
+        result = metrics.as_dict()
+        self.assertTrue({"solve.presolve", "solve.assembly", "solve.backend"} <= set(result["phases"]))
+        self.assertNotIn("peak_kb", result["phases"]["solve.backend"])
+        self.assertEqual(result["problem"], {"rows": 2, "cols": 2, "nnz": 4, "integer_vars": 0})
+        self.assertEqual(result["solver"]["iterations"], solution["nit"])
+        self.assertIn("rows_removed", result["presolve"])
+        json.dumps(result)
+
+    def test_batch_result_metrics(self):
+        document = json.dumps({"objetivo": "maximizar", "funcion_objetivo": [1], "variables_enteras": [False],
+                               "restricciones": [{"coeficientes": [1], "signo": "<=", "valor": 3}]})
+        result = solve_problem("p", document, collect_metrics=True)
+        self.assertTrue({"parse", "select", "solve"} <= set(result["metrics"]["phases"]))
+        self.assertIn("features", result["metrics"]["selector"])
+        self.assertNotIn("metrics", solve_problem("p", document))
@@ -1,5 +1,6 @@
 import unittest
-from optimax.parser import ProblemInstance
+import numpy as np
+from optimax.parser import ProblemInstance, SENSE_LE, SENSE_GE, SENSE_EQ
 
 class TestParser(unittest.TestCase):
     def test_valid_json(self):
@@ -48,5 +49,69 @@ class TestParser(unittest.TestCase):
         with self.assertRaises(AssertionError):
             _ = ProblemInstance.from_json(json_input)
 
+    def test_array_representation(self):
+        json_input = '''
+        {
+            "objetivo": "minimizar",
+            "funcion_objetivo": [6, 8],
+            "restricciones": [
+                {"coeficientes": [5, 2], "signo": ">=", "valor": 10},
+                {"coeficientes": [1, 3], "signo": "<=", "valor": 6},
+                {"coeficientes": [1, -1], "signo": "==", "valor": 0}
+            ],
+            "variables_enteras": [true, false]
+        }
+        '''
+        problem = ProblemInstance.from_json(json_input)
+        np.testing.assert_array_equal(problem.c, [6, 8])
+        np.testing.assert_array_equal(problem.A.toarray(), [[5, 2], [1, 3], [1, -1]])
+        np.testing.assert_array_equal(problem.b, [10, 6, 0])
+        np.testing.assert_array_equal(problem.senses, [SENSE_GE, SENSE_LE, SENSE_EQ])
+        np.testing.assert_array_equal(problem.integrality, [True, False])
+
+    def test_sparse_rows(self):
+        json_input = '''
+        {
+            "objetivo": "maximizar",
+            "funcion_objetivo": [1, 1, 1, 1],
+            "restricciones": [
+                {"indices": [3, 0], "coeficientes": [2, 1], "signo": "<=", "valor": 10},
+                {"coeficientes": [0, 4, 0, 0], "signo": "<=", "valor": 8}
+            ],
+            "variables_enteras": [false, false, false, false]
+        }
+        '''
+        problem = ProblemInstance.from_json(json_input)
+        self.assertEqual(problem.A.nnz, 3)
+        np.testing.assert_array_equal(problem.A.toarray(), [[1, 0, 0, 2], [0, 4, 0, 0]])
+
+    def test_sparse_index_out_of_range(self):
+        json_input = '''
+        {
+            "objetivo": "maximizar",
+            "funcion_objetivo": [1, 1],
+            "restricciones": [
+                {"indices": [2], "coeficientes": [1], "signo": "<=", "valor": 10}
+            ],
+            "variables_enteras": [false, false]
+        }
+        '''
+        with self.assertRaises(AssertionError):
+            _ = ProblemInstance.from_json(json_input)
+
+    def test_unsupported_sign(self):
+        json_input = '''
+        {
+            "objetivo": "maximizar",
+            "funcion_objetivo": [5, 3],
+            "restricciones": [
+                {"coeficientes": [2, 1], "signo": "<", "valor": 10}
+            ],
+            "variables_enteras": [false, false]
+        }
+        '''
+        with self.assertRaises(ValueError):
+            _ = ProblemInstance.from_json(json_input)
+
 if __name__ == '__main__':
     unittest.main()
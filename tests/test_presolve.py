@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+from optimax.parser import ProblemInstance
+from optimax.presolve import presolve
+from optimax.solver import Solver
+
+class TestPresolve(unittest.TestCase):
+    def test_reductions_and_postsolve(self):
+        problem = ProblemInstance(
+            "maximizar", [5, 3, 2, 1],
+            [
+                {"coeficientes": [2, 1, 0, 0], "signo": "<=", "valor": 10},
+                {"coeficientes": [2, 1, 0, 0], "signo": "<=", "valor": 12},  # duplicate, looser
+                {"coeficientes": [1, 2, 0, 0], "signo": "<=", "valor": 8},
+                {"coeficientes": [0, 0, 0, 0], "signo": "<=", "valor": 1},   # empty
+                {"coeficientes": [0, 0, 2, 0], "signo": "==", "valor": 6},   # fixes x2 = 3
+                {"coeficientes": [0, 0, 0, 1], "signo": "<=", "valor": 4},   # bound x3 <= 4, then unused
+            ],
+            [False] * 4,
+        )
+        presolved = presolve(problem)
+        summary = presolved.summary
+        self.assertIsNone(presolved.status)
+        self.assertEqual((summary["empty_rows"], summary["duplicate_rows"]), (1, 1))
+        self.assertEqual(summary["singleton_rows"], 2)
+        self.assertEqual((summary["fixed_columns"], summary["empty_columns"]), (1, 1))
+        self.assertEqual(presolved.reduced.A.shape, (2, 2))
+
+        result = Solver.solve(problem, "simplex", presolve=True)
+        self.assertAlmostEqual(result["optimal_value"], 26 + 6 + 4, places=6)
+        np.testing.assert_allclose(result["variables"], [4, 2, 3, 4], atol=1e-9)
+        self.assertIn("presolve", result)
+
+    def test_detects_infeasible_duplicates(self):
+        problem = ProblemInstance(
+            "minimizar", [1, 1],
+            [
+                {"coeficientes": [1, 1], "signo": "==", "valor": 2},
+                {"coeficientes": [1, 1], "signo": "==", "valor": 3},
+            ],
+            [False, False],
+        )
+        self.assertEqual(Solver.solve(problem, "simplex", presolve=True)["status"], "Infeasible")
+
+    def test_unbounded_column_leaves_status_to_solver(self):
+        # x2 is in no row and improves without limit, but x0 + x1 <= 1 and x0 + x1 >= 3 are infeasible
+        problem = ProblemInstance(
+            "maximizar", [1, 1, 1],
+            [
+                {"coeficientes": [1, 1, 0], "signo": "<=", "valor": 1},
+                {"coeficientes": [1, 1, 0], "signo": ">=", "valor": 3},
+            ],
+            [False] * 3,
+        )
+        self.assertIsNone(presolve(problem).status)
+        self.assertIn("infeasible", Solver.solve(problem, "simplex", presolve=True)["status"].lower())
+        integer = ProblemInstance(problem.objective, [1, 1, 1], [
+            {"coeficientes": [1, 1, 0], "signo": "<=", "valor": 1},
+            {"coeficientes": [1, 1, 0], "signo": ">=", "valor": 3},
+        ], [True] * 3)
+        for backend in ("highs", "native"):
+            self.assertEqual(Solver.solve(integer, "branch_and_bound", backend=backend, presolve=True)["status"],
+                             "Infeasible", backend)
+
+    def test_integer_bounds_are_rounded(self):
+        problem = ProblemInstance(
+            "maximizar", [1, 1],
+            [
+                {"coeficientes": [2, 0], "signo": "<=", "valor": 5},
+                {"coeficientes": [1, 1], "signo": "<=", "valor": 10},
+            ],
+            [True, False],
+        )
+        presolved = presolve(problem)
+        self.assertEqual(presolved.reduced.upper[0], 2)
+        result = Solver.solve(problem, "branch_and_bound", backend="native", presolve=True)
+        self.assertAlmostEqual(result["optimal_value"], 10, places=6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from optimax.parser import ProblemInstance
+from optimax.render import RenderQueue, plot_paths
+from optimax.solver import Solver
+
+def make_problem():
+    return ProblemInstance(
+        "maximizar", [5, 3],
+        [
+            {"coeficientes": [2, 1], "signo": "<=", "valor": 10},
+            {"coeficientes": [1, 2], "signo": "<=", "valor": 8},
+        ],
+        [False, False],
+    )
+
+class TestRender(unittest.TestCase):
+    def test_solver_has_no_rendering_side_effects(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                Solver.solve(make_problem(), "simplex")
+            finally:
+                os.chdir(cwd)
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_plot_paths_are_unique_per_problem(self):
+        first = plot_paths("out", "batch/p1.json")
+        second = plot_paths("out", "batch/p2.json")
+        self.assertNotEqual(first["feasible_region"], second["feasible_region"])
+        self.assertEqual(os.path.dirname(first["convergence"]), "out")
+
+    def test_render_queue_writes_plots(self):
+        problem = make_problem()
+        solution = Solver.solve(problem, "simplex")
+        solution = dict(solution, iterations=[1, 2], objective_values=[20.0, 26.0])
+        with tempfile.TemporaryDirectory() as tmp:
+            with RenderQueue(tmp) as renderer:
+                paths = renderer.submit("p1", problem, solution)
+            self.assertEqual(len(paths), 2)
+            self.assertEqual(renderer.errors, [])
+            for path in paths:
+                self.assertTrue(os.path.exists(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import json
+import unittest
+import numpy as np
+from benchmarks.generators import generate
+from optimax.cache import SolutionCache
+from optimax.parser import ProblemInstance, SENSE_EQ, SENSE_GE
+from optimax.revised_simplex import PRICING_RULES, SIMPLEX_METHODS, RevisedSimplex
+from optimax.solver import Solver
+
+VARIANTS = [(method, pricing) for method in SIMPLEX_METHODS for pricing in PRICING_RULES]
+
+def generated_lp(name, size, seed):
+    problem = ProblemInstance.from_json(json.dumps(generate(name, size, seed)))
+    return ProblemInstance.from_arrays(problem.objective, problem.c, problem.A, problem.b, problem.senses,
+                                       np.zeros(problem.num_variables, dtype=bool), lower=problem.lower, upper=problem.upper)
+
+class TestRevisedSimplex(unittest.TestCase):
+    def test_variants_match_highs(self):
+        for name, size in (("dense", (20, 15)), ("sparse", (60, 50)), ("transportation", (5, 7))):
+            problem = generated_lp(name, size, seed=1)
+            expected = Solver.solve_lp(problem, method="highs-ds")["optimal_value"]
+            for method, pricing in VARIANTS:
+                result = RevisedSimplex(problem, method, pricing).solve()
+                self.assertEqual(result["status"], "Optimal", (name, method, pricing))
+                self.assertAlmostEqual(result["optimal_value"], expected, places=6, msg=(name, method, pricing))
+                x = np.array(result["variables"])
+                self.assertAlmostEqual(float(problem.c @ x), result["optimal_value"], places=6)
+                activity = problem.A @ x
+                self.assertTrue(np.all(np.where(problem.senses == SENSE_GE, problem.b - activity, activity - problem.b) <= 1e-6))
+                self.assertTrue(np.allclose(activity[problem.senses == SENSE_EQ], problem.b[problem.senses == SENSE_EQ]))
+
+    def test_equalities_and_bounds(self):
+        # min x0 - 2x1 + x2 s.t. x0 + x1 + x2 == 4, x0 - x1 >= -1, x2 >= 1 with 1 <= x1 <= 2 and x2 free;
+        # optimum -2 at (1, 2, 1)
+        constraints = [
+            {"coeficientes": [1, 1, 1], "signo": "==", "valor": 4},
+            {"coeficientes": [1, -1, 0], "signo": ">=", "valor": -1},
+            {"coeficientes": [0, 0, 1], "signo": ">=", "valor": 1},
+        ]
+        problem = ProblemInstance("minimizar", [1, -2, 1], constraints, [False] * 3)
+        problem = ProblemInstance.from_arrays(problem.objective, problem.c, problem.A, problem.b, problem.senses,
+                                              problem.integrality, lower=np.array([0.0, 1.0, -np.inf]),
+                                              upper=np.array([np.inf, 2.0, np.inf]))
+        for method, pricing in VARIANTS:
+            result = RevisedSimplex(problem, method, pricing).solve()
+            self.assertAlmostEqual(result["optimal_value"], -2, places=9, msg=(method, pricing))
+            np.testing.assert_allclose(result["variables"], [1, 2, 1], atol=1e-9)
+
+    def test_infeasible_and_unbounded(self):
+        infeasible = ProblemInstance("maximizar", [1, 1], [
+            {"coeficientes": [1, 1], "signo": "<=", "valor": 2},
+            {"coeficientes": [1, 1], "signo": ">=", "valor": 3},
+        ], [False, False])
+        unbounded = ProblemInstance("maximizar", [1, 1], [
+            {"coeficientes": [1, -1], "signo": "<=", "valor": 2},
+        ], [False, False])
+        for method, pricing in VARIANTS:
+            self.assertEqual(RevisedSimplex(infeasible, method, pricing).solve()["status"], "Infeasible", (method, pricing))
+            result = RevisedSimplex(unbounded, method, pricing).solve()
+            self.assertEqual(result["status"], "Unbounded", (method, pricing))
+            self.assertNotIn("variables", result)
+
+    def test_trace(self):
+        problem = generated_lp("transportation", (5, 7), seed=0)
+        engine = RevisedSimplex(problem, "primal", "dantzig")
+        result = engine.solve()
+        self.assertEqual(len(result["objective_values"]), result["nit"])
+        self.assertEqual(result["iterations"], list(range(1, result["nit"] + 1)))
+        self.assertAlmostEqual(result["objective_values"][-1], result["optimal_value"], places=6)
+        # Phase 2 never makes a minimization worse
+        phase_two = np.array(result["objective_values"][result["phase_one_iterations"]:])
+        self.assertTrue(np.all(np.diff(phase_two) <= 1e-6))
+        # Solving again starts from scratch
+        self.assertEqual(engine.solve()["objective_values"], result["objective_values"])
+
+        limited = RevisedSimplex(problem, "primal", "dantzig", max_iterations=3).solve()
+        self.assertEqual((limited["status"], limited["nit"]), ("Not Solved", 3))
+        with self.assertRaises(ValueError):
+            RevisedSimplex(problem, method="barrier")
+
+    def test_solver_algorithm(self):
+        problem = generated_lp("dense", (10, 10), seed=0)
+        solution = Solver.solve(problem, "revised_simplex")
+        self.assertEqual(solution["status"], "Optimal")
+        self.assertEqual(len(solution["iterations"]), solution["nit"])
+        self.assertAlmostEqual(solution["optimal_value"], Solver.solve(problem, "dual_simplex")["optimal_value"], places=6)
+        # A HiGHS solution in the cache has no trace, so the cache is bypassed
+        cache = SolutionCache(max_entries=4)
+        Solver.solve(problem, "simplex", cache=cache)
+        traced = Solver.solve(problem, "revised_simplex", cache=cache)
+        self.assertEqual(len(traced["objective_values"]), traced["nit"])
+        self.assertGreater(traced["nit"], 0)
+        self.assertEqual(cache.stats()["hits"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
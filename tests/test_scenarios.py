@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from optimax.parser import ProblemInstance
+from optimax.scenarios import sweep
+from optimax.session import SolverSession
+
+def production_problem(integer=False):
+    # max 3x0 + 2x1 s.t. x0 + x1 <= 4, x0 + 3x1 >= 2, x0 <= 3; optimum 11 at (3, 1)
+    constraints = [
+        {"coeficientes": [1, 1], "signo": "<=", "valor": 4},
+        {"coeficientes": [1, 3], "signo": ">=", "valor": 2},
+        {"coeficientes": [1, 0], "signo": "<=", "valor": 3},
+    ]
+    return ProblemInstance("maximizar", [3, 2], constraints, [integer, integer])
+
+def cold_solve(problem, b, c):
+    scenario = ProblemInstance.from_arrays(problem.objective, c, problem.A, b, problem.senses, problem.integrality,
+                                           lower=problem.lower, upper=problem.upper)
+    return SolverSession(scenario).solve()
+
+class TestScenarios(unittest.TestCase):
+    def test_rhs_within_basis_range_skips_solves(self):
+        problem = production_problem()
+        rhs = np.array([[4.0], [4.5], [5.0], [3.5]])
+        results = sweep(problem, rhs=rhs, rows=[0])
+        self.assertFalse(results.resolved.any())
+        np.testing.assert_allclose(results.objective_value, 9 + 2 * (rhs[:, 0] - 3))
+        np.testing.assert_allclose(results.duals, np.tile([2.0, 0.0, 1.0], (4, 1)), atol=1e-9)
+        np.testing.assert_allclose(results.slacks[:, 0], 0, atol=1e-9)
+        np.testing.assert_allclose(results.slacks[:, 1], 3 + 3 * (rhs[:, 0] - 3) - 2)
+
+    def test_matches_cold_solves(self):
+        problem = production_problem()
+        rng = np.random.default_rng(3)
+        rhs = problem.b * rng.uniform(0.2, 3.0, size=(30, 3))
+        objective = problem.c * rng.uniform(-1.0, 2.0, size=(30, 2))
+        results = sweep(problem, rhs=rhs, objective=objective)
+        self.assertEqual(results.variables.shape, (30, 2))
+        self.assertGreater(results.summary["resolves"], 0)
+        for k in range(30):
+            reference = cold_solve(problem, rhs[k], objective[k])
+            self.assertEqual(results.status[k], reference["status"])
+            if reference["status"] == "Optimal":
+                self.assertAlmostEqual(results.objective_value[k], reference["optimal_value"], places=6)
+                np.testing.assert_allclose(results.reduced_costs[k], objective[k] - problem.A.T @ results.duals[k], atol=1e-9)
+        self.assertEqual(results.solution(0)["status"], results.status[0])
+
+    def test_infeasible_scenario(self):
+        problem = production_problem()
+        # x0 + x1 <= 0.5 contradicts x0 + 3x1 >= 2
+        results = sweep(problem, rhs=[[0.5], [4.0]], rows=[0])
+        self.assertNotEqual(results.status[0], "Optimal")
+        self.assertTrue(np.isnan(results.variables[0]).all())
+        self.assertAlmostEqual(results.objective_value[1], 11, places=6)
+
+    def test_integer_problem(self):
+        results = sweep(production_problem(integer=True), objective=[[3, 2], [1, 5]])
+        self.assertTrue(results.resolved.all())
+        np.testing.assert_allclose(results.objective_value, [11, 20])
+        self.assertTrue(np.isnan(results.duals).all())
+        with self.assertRaises(ValueError):
+            sweep(production_problem(), rhs=[[1, 2]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from optimax.parser import ProblemInstance
+from optimax.selector import AlgorithmSelector, TimingTable
+from optimax.solver import Solver
+
+def small_problem(integer=False):
+    return ProblemInstance(
+        "maximizar", [3, 2],
+        [
+            {"coeficientes": [1, 1], "signo": "<=", "valor": 4},
+            {"coeficientes": [1, 3], "signo": ">=", "valor": 2},
+            {"coeficientes": [1, -1], "signo": "==", "valor": 0},
+        ],
+        [integer, False],
+    )
+
+def record(kind, rows, timings):
+    features = {"rows": rows, "cols": rows, "nnz": 2 * rows, "density": 0.1, "eq_share": 0.0,
+                "ge_share": 0.0, "integer_share": 1.0 if kind == "ilp" else 0.0, "zero_feasible": 1.0}
+    return {"kind": kind, "features": features, "timings": timings}
+
+class TestSelector(unittest.TestCase):
+    def setUp(self):
+        self._saved = (AlgorithmSelector.timing_table, AlgorithmSelector._default_loaded)
+
+    def tearDown(self):
+        AlgorithmSelector.timing_table, AlgorithmSelector._default_loaded = self._saved
+
+    def test_features(self):
+        features = AlgorithmSelector.features(small_problem(integer=True))
+        self.assertEqual((features["rows"], features["cols"], features["nnz"]), (3, 2, 6))
+        self.assertAlmostEqual(features["eq_share"], 1 / 3)
+        self.assertAlmostEqual(features["ge_share"], 1 / 3)
+        self.assertEqual(features["integer_share"], 0.5)
+        self.assertEqual(features["zero_feasible"], 0.0)
+
+    def test_nearest_records_decide(self):
+        AlgorithmSelector.timing_table = TimingTable([
+            record("lp", 3, {"simplex": 0.003, "dual_simplex": 0.002, "interior_point": 0.001}),
+            record("lp", 10000, {"simplex": 2.0, "dual_simplex": 1.0, "interior_point": 3.0}),
+            record("ilp", 3, {"pulp": 0.01, "highs": 0.02, "native": None}),
+        ])
+        self.assertEqual(AlgorithmSelector.select(small_problem()), ("interior_point", "pulp"))
+        self.assertEqual(AlgorithmSelector.select(small_problem(integer=True)), ("branch_and_bound", "pulp"))
+        with self.assertLogs("optimax.selector", level="INFO") as logs:
+            AlgorithmSelector.select(small_problem())
+        self.assertIn("eq_share", logs.output[0])
+
+    def test_measure_and_fallback(self):
+        table = TimingTable.measure([small_problem()], repeats=1)
+        self.assertEqual(set(table.records[0]["timings"]), {"simplex", "dual_simplex", "interior_point"})
+        self.assertIsNone(table.best("ilp", table.records[0]["features"]))
+
+        AlgorithmSelector.timing_table = table
+        self.assertEqual(AlgorithmSelector.select(small_problem(integer=True)), ("branch_and_bound", "pulp"))
+        result = Solver.solve(small_problem(), "interior_point")
+        self.assertAlmostEqual(result["optimal_value"], 10, places=6)
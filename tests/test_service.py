@@ -0,0 +1,92 @@
+import json
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from benchmarks.generators import generate
+from optimax.service import SolveService, ServiceBusy, make_server
+
+PROBLEM = json.dumps({
+    "objetivo": "maximizar",
+    "funcion_objetivo": [5, 3],
+    "restricciones": [
+        {"coeficientes": [2, 1], "signo": "<=", "valor": 10},
+        {"coeficientes": [1, 2], "signo": "<=", "valor": 8},
+    ],
+    "variables_enteras": [False, False],
+})
+
+# Takes long enough to parse and solve that tiny timeouts always expire
+LARGE_PROBLEM = json.dumps(generate("dense", (300, 300), seed=0))
+
+class TestSolveService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = SolveService(workers=1, max_queue=1, timeout=30)
+        cls.service.start()
+        cls.server = make_server(cls.service, "127.0.0.1:0")
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.close()
+
+    def request(self, path, body=None):
+        data = body.encode() if body is not None else None
+        try:
+            with urllib.request.urlopen(urllib.request.Request(self.url + path, data=data), timeout=60) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_solve_and_health(self):
+        status, result = self.request("/solve?id=a1", PROBLEM)
+        self.assertEqual(status, 200)
+        self.assertEqual(result["id"], "a1")
+        self.assertAlmostEqual(result["solution"]["optimal_value"], 26, places=6)
+
+        status, result = self.request("/solve", "{not json")
+        self.assertEqual(status, 422)
+        self.assertIn("error", result)
+
+        status, stats = self.request("/health")
+        self.assertEqual(status, 200)
+        self.assertEqual(stats["workers"], 1)
+        self.assertGreaterEqual(stats["completed"], 1)
+        self.assertGreaterEqual(stats["failed"], 1)
+        self.assertIsNotNone(stats["latency_ms"])
+
+    def test_timeout_replaces_worker(self):
+        status, _ = self.request("/solve?timeout=0.01", LARGE_PROBLEM)
+        self.assertEqual(status, 504)
+        status, result = self.request("/solve?timeout=abc", PROBLEM)
+        self.assertEqual(status, 400)
+        # The killed worker is replaced and the next request succeeds
+        status, result = self.request("/solve", PROBLEM)
+        self.assertEqual(status, 200)
+
+    def test_full_queue_is_rejected(self):
+        started = threading.Event()
+        results = []
+
+        def slow():
+            started.set()
+            try:
+                self.service.solve(LARGE_PROBLEM, timeout=0.5)
+            except Exception as e:
+                results.append(e)
+
+        thread = threading.Thread(target=slow)
+        thread.start()
+        started.wait()
+        # max_queue=1: the slow request holds the only slot
+        while not self.service.stats()["running"]:
+            time.sleep(0.001)
+        with self.assertRaises(ServiceBusy):
+            self.service.solve(PROBLEM)
+        thread.join()
+        self.assertGreaterEqual(self.service.stats()["rejected"], 1)
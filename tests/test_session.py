@@ -0,0 +1,54 @@
+import unittest
+from optimax.parser import ProblemInstance
+from optimax.session import SolverSession
+
+def make_problem(variables_integer=(False, False)):
+    return ProblemInstance(
+        "maximizar",
+        [5, 3],
+        [
+            {"coeficientes": [2, 1], "signo": "<=", "valor": 10},
+            {"coeficientes": [1, 2], "signo": "<=", "valor": 8},
+        ],
+        list(variables_integer),
+    )
+
+class TestSolverSession(unittest.TestCase):
+    def test_rhs_update_uses_dual_warm_start(self):
+        session = SolverSession(make_problem())
+        self.assertAlmostEqual(session.solve()["optimal_value"], 26, places=6)
+        session.update_rhs([0], [12])
+        result = session.solve(compare_cold=True)
+        self.assertTrue(result["warm_start"])
+        self.assertEqual(result["simplex_strategy"], "dual")
+        self.assertAlmostEqual(result["optimal_value"], 5 * 16 / 3 + 3 * 4 / 3, places=6)
+        self.assertEqual(result["iterations_saved"], result["cold_iterations"] - result["simplex_iterations"])
+
+    def test_objective_update_uses_primal(self):
+        session = SolverSession(make_problem())
+        session.solve()
+        session.update_objective([1], [10])
+        result = session.solve()
+        self.assertEqual(result["simplex_strategy"], "primal")
+        self.assertAlmostEqual(result["optimal_value"], 40, places=6)
+
+    def test_add_and_remove_rows(self):
+        session = SolverSession(make_problem())
+        session.solve()
+        rows = session.add_rows([[1, 1]], ["<="], [3])
+        self.assertEqual(list(rows), [2])
+        self.assertAlmostEqual(session.solve()["optimal_value"], 15, places=6)
+        session.remove_rows(rows)
+        self.assertEqual(session.num_constraints, 2)
+        self.assertAlmostEqual(session.solve()["optimal_value"], 26, places=6)
+
+    def test_bounds_and_integer_variables(self):
+        session = SolverSession(make_problem((True, False)))
+        session.update_bounds([0], [0], [3])
+        result = session.solve()
+        self.assertEqual(result["status"], "Optimal")
+        self.assertAlmostEqual(result["variables"][0], 3, places=6)
+        self.assertAlmostEqual(result["optimal_value"], 15 + 3 * 2.5, places=6)
+
+if __name__ == '__main__':
+    unittest.main()
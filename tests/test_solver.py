@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 from optimax.parser import ProblemInstance
 from optimax.solver import Solver
 
@@ -42,5 +43,46 @@ class TestSolver(unittest.TestCase):
         self.assertEqual(round(result["variables"][0]), result["variables"][0])
         self.assertAlmostEqual(result["optimal_value"], 26, places=2)
 
+    def test_solver_sparse_rows(self):
+        json_input = '''
+        {
+            "objetivo": "maximizar",
+            "funcion_objetivo": [5, 0, 0, 3],
+            "restricciones": [
+                {"indices": [0, 3], "coeficientes": [2, 1], "signo": "<=", "valor": 10},
+                {"indices": [3, 0], "coeficientes": [2, 1], "signo": "<=", "valor": 8},
+                {"indices": [1, 2], "coeficientes": [1, 1], "signo": ">=", "valor": 1}
+            ],
+            "variables_enteras": [true, false, false, false]
+        }
+        '''
+        problem = ProblemInstance.from_json(json_input)
+        lp_result = Solver.solve_lp(problem)
+        self.assertAlmostEqual(lp_result["optimal_value"], 26, places=2)
+        ilp_result = Solver.solve(problem, "branch_and_bound")
+        self.assertEqual(ilp_result.get("status", "").lower(), "optimal")
+        self.assertAlmostEqual(ilp_result["optimal_value"], 26, places=2)
+
+    def test_solver_ilp_highs_backend(self):
+        json_input = '''
+        {
+            "objetivo": "maximizar",
+            "funcion_objetivo": [5, 3],
+            "restricciones": [
+                {"coeficientes": [2, 1], "signo": "<=", "valor": 10},
+                {"coeficientes": [1, 2], "signo": "<=", "valor": 8}
+            ],
+            "variables_enteras": [true, false]
+        }
+        '''
+        problem = ProblemInstance.from_json(json_input)
+        result = Solver.solve(problem, "branch_and_bound", backend="highs")
+        self.assertEqual(result["status"], "Optimal")
+        self.assertAlmostEqual(result["optimal_value"], 26, places=2)
+        with mock.patch.object(Solver, "solve_milp", side_effect=ImportError):
+            fallback = Solver.solve(problem, "branch_and_bound", backend="highs")
+        self.assertEqual(fallback["status"], "Optimal")
+        self.assertAlmostEqual(fallback["optimal_value"], 26, places=2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that a headless LP solve must never load
+HEAVY_MODULES = ("matplotlib", "networkx", "pygraphviz", "pulp")
+
+# Generous ceiling for importing the solver path; override on slow machines
+MAX_IMPORT_SECONDS = float(os.environ.get("OPTIMAX_MAX_IMPORT_SECONDS", "3.0"))
+
+LP_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+from optimax.parser import ProblemInstance
+from optimax.selector import AlgorithmSelector
+from optimax.solver import Solver
+import_seconds = time.perf_counter() - start
+problem = ProblemInstance.from_json(open("problem.json").read())
+solution = Solver.solve(problem, AlgorithmSelector.select_algorithm(problem))
+print(json.dumps({"import_seconds": import_seconds, "status": solution["status"], "modules": sorted(sys.modules)}))
+'''
+
+CLI_SCRIPT = '''
+import json, runpy, sys
+sys.argv = ["main.py", "problem.json", "--no-plots"]
+runpy.run_path("main.py", run_name="__main__")
+print(json.dumps(sorted(sys.modules)))
+'''
+
+def run_python(script):
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def loaded_heavy_modules(modules):
+    return sorted({name.split(".")[0] for name in modules} & set(HEAVY_MODULES))
+
+class TestStartup(unittest.TestCase):
+    def test_lp_path_stays_light(self):
+        result = run_python(LP_SCRIPT)
+        self.assertIn("optimal", result["status"].lower())
+        self.assertEqual(loaded_heavy_modules(result["modules"]), [])
+        self.assertLess(result["import_seconds"], MAX_IMPORT_SECONDS)
+
+    def test_headless_cli_skips_plotting(self):
+        modules = run_python(CLI_SCRIPT)
+        self.assertEqual(loaded_heavy_modules(modules), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import unittest
+from optimax.branch_and_bound import BranchAndBound
+from optimax.cache import SolutionCache
+from optimax.parser import ProblemInstance
+from optimax.solver import Solver
+from optimax.tree import TreeRecorder, collapse_fathomed, layout_tree
+from optimax.visualizer import Visualizer
+
+def knapsack():
+    # max 8x0 + 11x1 + 6x2 + 4x3 s.t. 5x0 + 7x1 + 4x2 + 3x3 <= 14, x binary; optimum 21 at (0, 1, 1, 1)
+    constraints = [{"coeficientes": [5, 7, 4, 3], "signo": "<=", "valor": 14}]
+    constraints += [{"indices": [j], "coeficientes": [1], "signo": "<=", "valor": 1} for j in range(4)]
+    return ProblemInstance("maximizar", [8, 11, 6, 4], constraints, [True] * 4)
+
+def complete_tree(size):
+    # Breadth-first binary tree: node k has children 2k + 1 and 2k + 2 (size should be odd)
+    for k in range(size):
+        yield {"node_id": k, "parent_id": None if k == 0 else (k - 1) // 2, "depth": (k + 1).bit_length() - 1,
+               "branch_decision": "", "objective_value": 1.0, "status": "branched" if 2 * k + 2 < size else "pruned"}
+
+class TestTree(unittest.TestCase):
+    def test_streams_search_as_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tree.jsonl")
+            with TreeRecorder(path) as recorder:
+                result = BranchAndBound(knapsack(), recorder=recorder).solve()
+            with open(path) as f:
+                events = [json.loads(line) for line in f]
+        self.assertAlmostEqual(result["optimal_value"], 21, places=6)
+        self.assertNotIn("branch_tree_data", result)
+        self.assertEqual(len(events), result["nodes"])
+        self.assertIsNone(events[0]["parent_id"])
+        summary = result["tree_summary"]
+        self.assertEqual(summary["nodes"], result["nodes"])
+        self.assertEqual(sum(summary["status_counts"].values()), result["nodes"])
+        # The search bound of a maximization never drops below the incumbent, and meets it at the end
+        final = events[-1]
+        self.assertAlmostEqual(final["bound"], final["incumbent"], places=6)
+        self.assertTrue(all(e["bound"] >= e["incumbent"] - 1e-6 for e in events if e["incumbent"] is not None))
+
+    def test_recorder_bypasses_cache(self):
+        cache = SolutionCache()
+        Solver.solve(knapsack(), "branch_and_bound", backend="native", cache=cache)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tree.jsonl")
+            with TreeRecorder(path) as recorder:
+                result = Solver.solve(knapsack(), "branch_and_bound", backend="native", cache=cache, recorder=recorder)
+            with open(path) as f:
+                events = f.readlines()
+        self.assertEqual(len(events), result["nodes"])
+        self.assertIn("tree_summary", result)
+        self.assertEqual(cache.stats()["hits"], 0)
+
+    def test_memory_is_bounded(self):
+        recorder = TreeRecorder.from_records(complete_tree(4095), max_nodes=50, max_points=20)
+        self.assertEqual(len(recorder.nodes), 50)
+        self.assertEqual(sum(1 + node["hidden"] for node in recorder.nodes), 4095)
+        self.assertLessEqual(len(recorder.timeline["time"]), 20)
+        self.assertEqual(recorder.timeline["nodes"][-1], 4095)
+        self.assertEqual(recorder._anchors, {})
+        summary = recorder.summary()
+        self.assertEqual(sum(summary["nodes_per_depth"]["pruned"]) + sum(summary["nodes_per_depth"]["branched"]), 4095)
+
+    def test_dot_stream(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tree.dot")
+            with TreeRecorder(path) as recorder:
+                for record in complete_tree(7):
+                    recorder.add(record)
+            with open(path) as f:
+                text = f.read()
+        self.assertTrue(text.startswith("digraph"))
+        self.assertTrue(text.rstrip().endswith("}"))
+        self.assertEqual(text.count("->"), 6)
+        with self.assertRaises(ValueError):
+            TreeRecorder(format="png")
+
+    def test_collapse_and_layout(self):
+        nodes = list(complete_tree(15))
+        nodes[13]["status"] = "integer"
+        collapsed = collapse_fathomed(nodes)
+        # Only the path to the integer node (0 -> 2 -> 6 -> 13) keeps its children
+        self.assertEqual(sorted(node["node_id"] for node in collapsed), [0, 1, 2, 5, 6, 13, 14])
+        self.assertEqual({node["node_id"]: node["collapsed"] for node in collapsed if "collapsed" in node}, {1: 7, 5: 3})
+        pos = layout_tree(collapsed)
+        self.assertEqual(pos[0][1], 0)
+        self.assertEqual(pos[13][1], -3)
+        self.assertLess(pos[1][0], pos[0][0])
+        self.assertLess(pos[0][0], pos[2][0])
+
+    def test_plots(self):
+        result = BranchAndBound(knapsack(), recorder=TreeRecorder()).solve()
+        with tempfile.TemporaryDirectory() as tmp:
+            tree_file = os.path.join(tmp, "tree.png")
+            summary_file = os.path.join(tmp, "summary.png")
+            Visualizer.plot_branch_and_bound_tree(result["tree_summary"], filename=tree_file)
+            Visualizer.plot_search_summary(result["tree_summary"], filename=summary_file)
+            Visualizer.plot_branch_and_bound_tree(list(complete_tree(3001)), filename=tree_file)
+            self.assertGreater(os.path.getsize(tree_file), 0)
+            self.assertGreater(os.path.getsize(summary_file), 0)
+
+if __name__ == '__main__':
+    unittest.main()